@@ -11,7 +11,10 @@ from aiohttp.client import ClientTimeout
 from config import MOBYGAMES_API_KEY
 from fastapi import HTTPException, status
 from logger.logger import log
-from utils.context import ctx_aiohttp_session
+from utils.circuit_breaker import CircuitBreaker
+from utils.context import get_aiohttp_session
+from utils.http_transport import HTTPPool
+from utils.instrumentation import instrument_provider, mark_status
 
 
 async def auth_middleware(
@@ -33,9 +36,15 @@ class MobyGamesService:
         base_url: str | None = None,
     ) -> None:
         self.url = yarl.URL(base_url or "https://api.mobygames.com/v1")
+        self.circuit_breaker = CircuitBreaker("MobyGames")
 
+    @instrument_provider("mobygames")
     async def _request(self, url: str, request_timeout: int = 120) -> dict:
-        aiohttp_session = ctx_aiohttp_session.get()
+        aiohttp_session = get_aiohttp_session(HTTPPool.MOBYGAMES)
+        if not await self.circuit_breaker.allow_request():
+            mark_status("circuit_open")
+            return {}
+
         log.debug(
             "API request: URL=%s, Timeout=%s",
             url,
@@ -48,12 +57,15 @@ class MobyGamesService:
                 middlewares=(auth_middleware,),
                 timeout=ClientTimeout(total=request_timeout),
             )
+            await self.circuit_breaker.record_success()
             res.raise_for_status()
             return await res.json()
         except aiohttp.ServerTimeoutError:
+            await self.circuit_breaker.record_failure()
             # Retry the request once if it times out
             log.debug("Request to URL=%s timed out. Retrying...", url)
         except aiohttp.ClientConnectionError as exc:
+            await self.circuit_breaker.record_failure()
             log.critical("Connection error: can't connect to MobyGames", exc_info=True)
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -63,6 +75,7 @@ class MobyGamesService:
             if exc.status == http.HTTPStatus.UNAUTHORIZED:
                 # Sometimes MobyGames returns 401 even with a valid API key
                 log.error(exc)
+                mark_status("http_error")
                 return {}
             elif exc.status == http.HTTPStatus.TOO_MANY_REQUESTS:
                 # Retry after 2 seconds if rate limit hit
@@ -70,9 +83,11 @@ class MobyGamesService:
             else:
                 # Log the error and return an empty dict if the request fails with a different code
                 log.error(exc)
+                mark_status("http_error")
                 return {}
         except json.JSONDecodeError as exc:
             log.error("Error decoding JSON response from ScreenScraper: %s", exc)
+            mark_status("invalid_response")
             return {}
 
         # Retry the request once if it times out
@@ -87,9 +102,19 @@ class MobyGamesService:
                 middlewares=(auth_middleware,),
                 timeout=ClientTimeout(total=request_timeout),
             )
+            await self.circuit_breaker.record_success()
             res.raise_for_status()
             return await res.json()
         except (aiohttp.ClientResponseError, aiohttp.ServerTimeoutError) as exc:
+            if isinstance(exc, aiohttp.ServerTimeoutError):
+                await self.circuit_breaker.record_failure()
+
+            mark_status(
+                "timeout"
+                if isinstance(exc, aiohttp.ServerTimeoutError)
+                else "http_error"
+            )
+
             if (
                 isinstance(exc, aiohttp.ClientResponseError)
                 and exc.status == http.HTTPStatus.UNAUTHORIZED
@@ -100,6 +125,7 @@ class MobyGamesService:
             return {}
         except json.JSONDecodeError as exc:
             log.error("Error decoding JSON response from ScreenScraper: %s", exc)
+            mark_status("invalid_response")
             return {}
 
     @overload
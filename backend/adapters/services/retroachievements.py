@@ -17,7 +17,10 @@ from aiohttp.client import ClientTimeout
 from config import RETROACHIEVEMENTS_API_KEY
 from fastapi import HTTPException, status
 from logger.logger import log
-from utils.context import ctx_aiohttp_session
+from utils.circuit_breaker import CircuitBreaker
+from utils.context import get_aiohttp_session
+from utils.http_transport import HTTPPool
+from utils.instrumentation import instrument_provider, mark_status
 
 
 async def auth_middleware(
@@ -42,9 +45,15 @@ class RetroAchievementsService:
         base_url: str | None = None,
     ) -> None:
         self.url = yarl.URL(base_url or "https://retroachievements.org/API")
+        self.circuit_breaker = CircuitBreaker("RetroAchievements")
 
+    @instrument_provider("retroachievements")
     async def _request(self, url: str, request_timeout: int = 120) -> dict:
-        aiohttp_session = ctx_aiohttp_session.get()
+        aiohttp_session = get_aiohttp_session(HTTPPool.RETROACHIEVEMENTS)
+        if not await self.circuit_breaker.allow_request():
+            mark_status("circuit_open")
+            return {}
+
         log.debug(
             "API request: URL=%s, Timeout=%s",
             url,
@@ -56,12 +65,14 @@ class RetroAchievementsService:
                 middlewares=(auth_middleware,),
                 timeout=ClientTimeout(total=request_timeout),
             )
+            await self.circuit_breaker.record_success()
             res.raise_for_status()
             return await res.json()
         except aiohttp.ServerTimeoutError:
+            await self.circuit_breaker.record_failure()
             # Retry the request once if it times out
-            pass
         except aiohttp.ClientConnectionError as exc:
+            await self.circuit_breaker.record_failure()
             log.critical(
                 "Connection error: can't connect to RetroAchievements", exc_info=True
             )
@@ -76,9 +87,11 @@ class RetroAchievementsService:
             else:
                 # Log the error and return an empty dict if the request fails with a different code
                 log.error(err)
+                mark_status("http_error")
                 return {}
         except json.JSONDecodeError as exc:
             log.error("Error decoding JSON response from ScreenScraper: %s", exc)
+            mark_status("invalid_response")
             return {}
 
         try:
@@ -92,9 +105,19 @@ class RetroAchievementsService:
                 middlewares=(auth_middleware,),
                 timeout=ClientTimeout(total=request_timeout),
             )
+            await self.circuit_breaker.record_success()
             res.raise_for_status()
             return await res.json()
         except (aiohttp.ClientResponseError, aiohttp.ServerTimeoutError) as err:
+            if isinstance(err, aiohttp.ServerTimeoutError):
+                await self.circuit_breaker.record_failure()
+
+            mark_status(
+                "timeout"
+                if isinstance(err, aiohttp.ServerTimeoutError)
+                else "http_error"
+            )
+
             if (
                 isinstance(err, aiohttp.ClientResponseError)
                 and err.status == http.HTTPStatus.UNAUTHORIZED
@@ -105,6 +128,7 @@ class RetroAchievementsService:
             return {}
         except json.JSONDecodeError as exc:
             log.error("Error decoding JSON response from ScreenScraper: %s", exc)
+            mark_status("invalid_response")
             return {}
 
     async def get_game_extended_details(self, game_id: int) -> RAGameExtendedDetails:
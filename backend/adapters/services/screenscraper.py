@@ -11,7 +11,10 @@ from aiohttp.client import ClientTimeout
 from config import SCREENSCRAPER_PASSWORD, SCREENSCRAPER_USER
 from fastapi import HTTPException, status
 from logger.logger import log
-from utils.context import ctx_aiohttp_session
+from utils.circuit_breaker import CircuitBreaker
+from utils.context import get_aiohttp_session
+from utils.http_transport import HTTPPool
+from utils.instrumentation import instrument_provider, mark_status
 
 SS_DEV_ID: Final = base64.b64decode("enVyZGkxNQ==").decode()
 SS_DEV_PASSWORD: Final = base64.b64decode("eFRKd29PRmpPUUc=").decode()
@@ -46,9 +49,15 @@ class ScreenScraperService:
         base_url: str | None = None,
     ) -> None:
         self.url = yarl.URL(base_url or "https://api.screenscraper.fr/api2")
+        self.circuit_breaker = CircuitBreaker("ScreenScraper")
 
+    @instrument_provider("screenscraper")
     async def _request(self, url: str, request_timeout: int = 120) -> dict:
-        aiohttp_session = ctx_aiohttp_session.get()
+        aiohttp_session = get_aiohttp_session(HTTPPool.SCREENSCRAPER)
+        if not await self.circuit_breaker.allow_request():
+            mark_status("circuit_open")
+            return {}
+
         log.debug(
             "API request: URL=%s, Timeout=%s",
             url,
@@ -60,6 +69,7 @@ class ScreenScraperService:
                 middlewares=(auth_middleware,),
                 timeout=ClientTimeout(total=request_timeout),
             )
+            await self.circuit_breaker.record_success()
             res.raise_for_status()
             res_text = await res.text()
             if LOGIN_ERROR_CHECK in res_text:
@@ -70,9 +80,10 @@ class ScreenScraperService:
                 )
             return await res.json()
         except aiohttp.ServerTimeoutError:
+            await self.circuit_breaker.record_failure()
             # Retry the request once if it times out
-            pass
         except aiohttp.ClientConnectionError as exc:
+            await self.circuit_breaker.record_failure()
             log.critical(
                 "Connection error: can't connect to ScreenScraper", exc_info=True
             )
@@ -87,9 +98,11 @@ class ScreenScraperService:
             else:
                 # Log the error and return an empty dict if the request fails with a different code
                 log.error(err)
+                mark_status("http_error")
                 return {}
         except json.JSONDecodeError as exc:
             log.error("Error decoding JSON response from ScreenScraper: %s", exc)
+            mark_status("invalid_response")
             return {}
 
         try:
@@ -103,6 +116,7 @@ class ScreenScraperService:
                 middlewares=(auth_middleware,),
                 timeout=ClientTimeout(total=request_timeout),
             )
+            await self.circuit_breaker.record_success()
             res.raise_for_status()
             res_text = await res.text()
             if LOGIN_ERROR_CHECK in res_text:
@@ -113,6 +127,15 @@ class ScreenScraperService:
                 )
             return await res.json()
         except (aiohttp.ClientResponseError, aiohttp.ServerTimeoutError) as err:
+            if isinstance(err, aiohttp.ServerTimeoutError):
+                await self.circuit_breaker.record_failure()
+
+            mark_status(
+                "timeout"
+                if isinstance(err, aiohttp.ServerTimeoutError)
+                else "http_error"
+            )
+
             if (
                 isinstance(err, aiohttp.ClientResponseError)
                 and err.status == http.HTTPStatus.UNAUTHORIZED
@@ -123,6 +146,7 @@ class ScreenScraperService:
             return {}
         except json.JSONDecodeError as exc:
             log.error("Error decoding JSON response from ScreenScraper: %s", exc)
+            mark_status("invalid_response")
             return {}
 
     async def get_game_info(
@@ -21,7 +21,10 @@ from aiohttp.client import ClientTimeout
 from config import STEAMGRIDDB_API_KEY
 from exceptions.endpoint_exceptions import SGDBInvalidAPIKeyException
 from logger.logger import log
-from utils.context import ctx_aiohttp_session
+from utils.circuit_breaker import CircuitBreaker
+from utils.context import get_aiohttp_session
+from utils.http_transport import HTTPPool
+from utils.instrumentation import instrument_provider, mark_status
 
 
 async def auth_middleware(
@@ -43,9 +46,15 @@ class SteamGridDBService:
         base_url: str | None = None,
     ) -> None:
         self.url = yarl.URL(base_url or "https://steamgriddb.com/api/v2")
+        self.circuit_breaker = CircuitBreaker("SteamGridDB")
 
+    @instrument_provider("steamgriddb")
     async def _request(self, url: str, request_timeout: int = 120) -> dict:
-        aiohttp_session = ctx_aiohttp_session.get()
+        aiohttp_session = get_aiohttp_session(HTTPPool.STEAMGRIDDB)
+        if not await self.circuit_breaker.allow_request():
+            mark_status("circuit_open")
+            return {}
+
         log.debug(
             "API request: URL=%s, Timeout=%s",
             url,
@@ -57,8 +66,12 @@ class SteamGridDBService:
                 middlewares=(auth_middleware,),
                 timeout=ClientTimeout(total=request_timeout),
             )
+            await self.circuit_breaker.record_success()
             res.raise_for_status()
             return await res.json()
+        except aiohttp.ClientConnectionError:
+            await self.circuit_breaker.record_failure()
+            raise
         except aiohttp.client_exceptions.ClientResponseError as exc:
             print(f"Request failed with status {exc.status} for URL: {url}")
             if exc.status == http.HTTPStatus.UNAUTHORIZED:
@@ -66,12 +79,14 @@ class SteamGridDBService:
                 raise SGDBInvalidAPIKeyException from exc
             # Log the error and return an empty dict if the request fails with a different code
             log.error(exc)
+            mark_status("http_error")
             return {}
         except json.decoder.JSONDecodeError as exc:
             log.error(
                 "Failed to decode JSON response from SteamGridDB: %s",
                 str(exc),
             )
+            mark_status("invalid_response")
             return {}
 
     async def get_grids_for_game(
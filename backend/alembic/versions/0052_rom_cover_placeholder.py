@@ -0,0 +1,26 @@
+"""Add cover placeholder to roms
+
+Revision ID: 0052_rom_cover_placeholder
+Revises: 0051_add_rom_verification
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0052_rom_cover_placeholder"
+down_revision = "0051_add_rom_verification"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("cover_placeholder", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.drop_column("cover_placeholder")
@@ -25,6 +25,7 @@ ROMM_BASE_PATH: Final = os.environ.get("ROMM_BASE_PATH", "/romm")
 LIBRARY_BASE_PATH: Final = f"{ROMM_BASE_PATH}/library"
 RESOURCES_BASE_PATH: Final = f"{ROMM_BASE_PATH}/resources"
 ASSETS_BASE_PATH: Final = f"{ROMM_BASE_PATH}/assets"
+DATS_BASE_PATH: Final = f"{ROMM_BASE_PATH}/dats"
 FRONTEND_RESOURCES_PATH: Final = "/assets/romm/resources"
 
 # DATABASE
@@ -96,6 +97,29 @@ HASHEOUS_API_ENABLED: Final = str_to_bool(
 # THEGAMESDB
 TGDB_API_ENABLED: Final = str_to_bool(os.environ.get("TGDB_API_ENABLED", "false"))
 
+# METADATA PROVIDERS
+METADATA_CIRCUIT_BREAKER_THRESHOLD: Final = int(
+    os.environ.get("METADATA_CIRCUIT_BREAKER_THRESHOLD", 5)
+)
+METADATA_CIRCUIT_BREAKER_COOLDOWN: Final = int(
+    os.environ.get("METADATA_CIRCUIT_BREAKER_COOLDOWN", 5 * 60)  # 5 minutes
+)
+METADATA_LOOKUP_CACHE_TTL: Final = int(
+    os.environ.get("METADATA_LOOKUP_CACHE_TTL", 30 * 24 * 60 * 60)  # 30 days
+)
+METADATA_SEARCH_CACHE_TTL: Final = int(
+    os.environ.get("METADATA_SEARCH_CACHE_TTL", 5 * 60)  # 5 minutes
+)
+METADATA_SPECULATIVE_SEARCH: Final = str_to_bool(
+    os.environ.get("METADATA_SPECULATIVE_SEARCH", "false")
+)
+METADATA_NORMALIZE_CACHE_SIZE: Final = int(
+    os.environ.get("METADATA_NORMALIZE_CACHE_SIZE", 16384)
+)
+METADATA_MATCH_CANDIDATES_CACHE_SIZE: Final = int(
+    os.environ.get("METADATA_MATCH_CANDIDATES_CACHE_SIZE", 256)
+)
+
 # AUTH
 ROMM_AUTH_SECRET_KEY: Final = os.environ.get("ROMM_AUTH_SECRET_KEY")
 
@@ -122,6 +146,12 @@ OIDC_TLS_CACERTFILE: Final = os.environ.get("OIDC_TLS_CACERTFILE", None)
 # SCANS
 SCAN_TIMEOUT: Final = int(os.environ.get("SCAN_TIMEOUT", 60 * 60 * 4))  # 4 hours
 
+# RESOURCES
+IMAGE_PROCESSING_WORKERS: Final = int(os.environ.get("IMAGE_PROCESSING_WORKERS", 2))
+RESIZED_IMAGES_CACHE_SIZE_MB: Final = int(
+    os.environ.get("RESIZED_IMAGES_CACHE_SIZE_MB", 1024)
+)
+
 # TASKS
 ENABLE_RESCAN_ON_FILESYSTEM_CHANGE: Final = str_to_bool(
     os.environ.get("ENABLE_RESCAN_ON_FILESYSTEM_CHANGE", "false")
@@ -62,14 +62,11 @@ async def add_collection(
     _added_collection = db_collection_handler.add_collection(Collection(**cleaned_data))
 
     if artwork is not None and artwork.filename is not None:
-        file_ext = artwork.filename.split(".")[-1]
         artwork_content = BytesIO(await artwork.read())
         (
             path_cover_l,
             path_cover_s,
-        ) = await fs_resource_handler.store_artwork(
-            _added_collection, artwork_content, file_ext
-        )
+        ) = await fs_resource_handler.store_artwork(_added_collection, artwork_content)
     else:
         path_cover_s, path_cover_l = await fs_resource_handler.get_cover(
             entity=_added_collection,
@@ -294,14 +291,11 @@ async def update_collection(
         cleaned_data.update({"url_cover": ""})
     else:
         if artwork is not None and artwork.filename is not None:
-            file_ext = artwork.filename.split(".")[-1]
             artwork_content = BytesIO(await artwork.read())
             (
                 path_cover_l,
                 path_cover_s,
-            ) = await fs_resource_handler.store_artwork(
-                collection, artwork_content, file_ext
-            )
+            ) = await fs_resource_handler.store_artwork(collection, artwork_content)
 
             cleaned_data.update(
                 {
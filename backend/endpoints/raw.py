@@ -1,8 +1,10 @@
 from decorators.auth import protected_route
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Request, status
 from fastapi.responses import FileResponse
 from handler.auth.constants import Scope
 from handler.filesystem import fs_asset_handler
+from logger.logger import log
+from PIL import Image, UnidentifiedImageError
 from utils.router import APIRouter
 
 router = APIRouter(
@@ -52,3 +54,36 @@ def get_raw_asset(request: Request, path: str):
         raise HTTPException(status_code=404, detail="Asset not found")
 
     return FileResponse(path=str(resolved_path), filename=resolved_path.name)
+
+
+@protected_route(router.get, "/thumbnails/{path:path}", [Scope.ASSETS_READ])
+async def get_asset_thumbnail(request: Request, path: str):
+    """Download the thumbnail of an image asset, rendering it if missing or outdated
+
+    Args:
+        request (Request): Fastapi Request object
+        path (str): Relative path to the image asset file
+
+    Returns:
+        FileResponse: Returns the WebP thumbnail of the asset
+
+    Raises:
+        HTTPException: 404 if asset not found or access denied
+        HTTPException: 422 if the asset is not a valid image
+    """
+    try:
+        thumbnail_path = await fs_asset_handler.get_thumbnail(path)
+    except (FileNotFoundError, ValueError) as exc:
+        raise HTTPException(status_code=404, detail="Asset not found") from exc
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as exc:
+        log.error(f"Unable to render thumbnail of {path}: {str(exc)}")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Asset is not a valid image",
+        ) from exc
+
+    return FileResponse(
+        path=str(fs_asset_handler.validate_path(thumbnail_path)),
+        media_type="image/webp",
+        headers={"Cache-Control": "private, max-age=86400"},
+    )
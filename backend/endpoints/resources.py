@@ -0,0 +1,129 @@
+from typing import Annotated
+from urllib.parse import quote
+
+from config import DEV_MODE, FRONTEND_RESOURCES_PATH
+from decorators.auth import protected_route
+from endpoints.responses.resources import CoverSpriteSchema
+from fastapi import HTTPException
+from fastapi import Path as PathVar
+from fastapi import Query, Request, status
+from fastapi.responses import FileResponse, Response
+from handler.auth.constants import Scope
+from handler.database import db_rom_handler
+from handler.filesystem import fs_resource_handler
+from handler.filesystem.resources_handler import (
+    COVER_SPRITE_MAX_COVERS,
+    COVER_SPRITE_WIDTHS,
+    RESIZED_IMAGE_WIDTHS,
+)
+from logger.logger import log
+from PIL import Image, UnidentifiedImageError
+from utils.images import ImageFormat
+from utils.router import APIRouter
+
+router = APIRouter(
+    prefix="/resources",
+    tags=["resources"],
+)
+
+# Images rarely change under the same path, and cover URLs change with their content
+RESIZED_IMAGE_CACHE_CONTROL = "private, max-age=86400"
+
+
+@protected_route(router.get, "/image/{path:path}", [Scope.ROMS_READ])
+async def get_resized_image(
+    request: Request,
+    path: Annotated[
+        str,
+        PathVar(description="Path of the image, relative to the resources folder."),
+    ],
+    width: Annotated[
+        int,
+        Query(
+            description=(
+                "Width of the image, rounded up to a supported width, "
+                f"and capped at {RESIZED_IMAGE_WIDTHS[-1]}."
+            ),
+            ge=1,
+        ),
+    ],
+    format: Annotated[
+        ImageFormat, Query(description="Format of the image.")
+    ] = ImageFormat.WEBP,
+) -> Response:
+    """Get an image of the resources, such as a cover or screenshot, scaled down to a width."""
+
+    try:
+        resized_path = await fs_resource_handler.get_resized_image(path, width, format)
+    except (FileNotFoundError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Image not found"
+        ) from exc
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as exc:
+        log.error(f"Unable to resize image {path}: {str(exc)}")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="File is not a valid image",
+        ) from exc
+
+    media_type = f"image/{format}"
+    headers = {"Cache-Control": RESIZED_IMAGE_CACHE_CONTROL}
+
+    # Serve the file directly in development mode
+    if DEV_MODE:
+        return FileResponse(
+            path=fs_resource_handler.validate_path(resized_path),
+            media_type=media_type,
+            headers=headers,
+        )
+
+    # Otherwise let nginx serve it from the resources folder
+    headers["X-Accel-Redirect"] = quote(f"{FRONTEND_RESOURCES_PATH}/{resized_path}")
+    return Response(media_type=media_type, headers=headers)
+
+
+@protected_route(router.get, "/covers/sprite", [Scope.ROMS_READ])
+async def get_cover_sprite(
+    request: Request,
+    ids: Annotated[
+        list[int],
+        Query(
+            description="Rom ids, in the order of the tiles.",
+            min_length=1,
+            max_length=COVER_SPRITE_MAX_COVERS,
+        ),
+    ],
+    width: Annotated[
+        int,
+        Query(
+            description=(
+                "Max width of the covers, one of "
+                f"{', '.join(map(str, COVER_SPRITE_WIDTHS))}."
+            ),
+        ),
+    ] = COVER_SPRITE_WIDTHS[0],
+) -> CoverSpriteSchema:
+    """Get a sprite sheet of the covers of roms, to load a page of covers at once."""
+
+    if width not in COVER_SPRITE_WIDTHS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Width must be one of {', '.join(map(str, COVER_SPRITE_WIDTHS))}",
+        )
+
+    roms_by_id = {rom.id: rom for rom in db_rom_handler.get_roms_by_ids(ids)}
+    sprite = await fs_resource_handler.get_cover_sprite(
+        [roms_by_id[id] for id in ids if id in roms_by_id], width
+    )
+    if not sprite:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No covers found"
+        )
+
+    return CoverSpriteSchema(
+        # Sprite sheets are keyed by their covers, so their URL never changes content
+        url=f"{FRONTEND_RESOURCES_PATH}/{sprite['path']}",
+        width=sprite["width"],
+        height=sprite["height"],
+        tiles=sprite["tiles"],
+    )
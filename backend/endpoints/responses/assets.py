@@ -26,7 +26,7 @@ class BaseAsset(BaseModel):
 
 
 class ScreenshotSchema(BaseAsset):
-    pass
+    thumbnail_path: str
 
 
 class SaveSchema(BaseAsset):
@@ -0,0 +1,15 @@
+from .base import BaseModel
+
+
+class CoverSpriteTileSchema(BaseModel):
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+class CoverSpriteSchema(BaseModel):
+    url: str
+    width: int
+    height: int
+    tiles: dict[int, CoverSpriteTileSchema]
@@ -219,6 +219,7 @@ class RomSchema(BaseModel):
 
     path_cover_small: str | None
     path_cover_large: str | None
+    cover_placeholder: str | None
     url_cover: str | None
 
     has_manual: bool
@@ -608,6 +608,7 @@ async def update_rom(
                 "path_screenshots": [],
                 "path_cover_s": "",
                 "path_cover_l": "",
+                "cover_placeholder": None,
                 "url_cover": "",
                 "url_manual": "",
                 "slug": "",
@@ -705,21 +706,23 @@ async def update_rom(
 
     if remove_cover:
         cleaned_data.update(await fs_resource_handler.remove_cover(rom))
-        cleaned_data.update({"url_cover": ""})
+        cleaned_data.update({"url_cover": "", "cover_placeholder": None})
     else:
         if artwork is not None and artwork.filename is not None:
-            file_ext = artwork.filename.split(".")[-1]
             artwork_content = BytesIO(await artwork.read())
             (
                 path_cover_l,
                 path_cover_s,
-            ) = await fs_resource_handler.store_artwork(rom, artwork_content, file_ext)
+            ) = await fs_resource_handler.store_artwork(rom, artwork_content)
 
             cleaned_data.update(
                 {
                     "url_cover": "",
                     "path_cover_s": path_cover_s,
                     "path_cover_l": path_cover_l,
+                    "cover_placeholder": await fs_resource_handler.get_cover_placeholder(
+                        rom
+                    ),
                 }
             )
         else:
@@ -738,6 +741,9 @@ async def update_rom(
                         "url_cover": data.get("url_cover", rom.url_cover),
                         "path_cover_s": path_cover_s,
                         "path_cover_l": path_cover_l,
+                        "cover_placeholder": await fs_resource_handler.get_cover_placeholder(
+                            rom
+                        ),
                     }
                 )
 
@@ -826,6 +832,8 @@ async def add_rom_manuals(
     log.info(f"Uploading manual to {hl(str(file_location))}")
 
     await fs_resource_handler.make_directory(manuals_path)
+    # The manual may be a link to a blob shared with other roms, which must be kept
+    file_location.unlink(missing_ok=True)
 
     parser = StreamingFormDataParser(headers=request.headers)
     parser.register("x-upload-platform", NullTarget())
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from decorators.auth import protected_route
 from endpoints.responses.assets import SaveSchema
 from exceptions.endpoint_exceptions import RomNotFoundInDatabaseException
-from fastapi import HTTPException, Request, UploadFile, status
+from fastapi import BackgroundTasks, HTTPException, Request, UploadFile, status
 from handler.auth.constants import Scope
 from handler.database import db_rom_handler, db_save_handler, db_screenshot_handler
 from handler.filesystem import fs_asset_handler
@@ -23,6 +23,7 @@ router = APIRouter(
 async def add_save(
     request: Request,
     rom_id: int,
+    background_tasks: BackgroundTasks,
     emulator: str | None = None,
 ) -> SaveSchema:
     data = await request.form()
@@ -107,6 +108,9 @@ async def add_save(
             platform_fs_slug=rom.platform_slug,
             rom_id=rom.id,
         )
+        background_tasks.add_task(
+            fs_asset_handler.store_thumbnail, scanned_screenshot.full_path
+        )
         db_screenshot = db_screenshot_handler.get_screenshot(
             filename=screenshotFile.filename,
             rom_id=rom.id,
@@ -162,7 +166,9 @@ def get_save(request: Request, id: int) -> SaveSchema:
 
 
 @protected_route(router.put, "/{id}", [Scope.ASSETS_WRITE])
-async def update_save(request: Request, id: int) -> SaveSchema:
+async def update_save(
+    request: Request, id: int, background_tasks: BackgroundTasks
+) -> SaveSchema:
     data = await request.form()
 
     db_save = db_save_handler.get_save(user_id=request.user.id, id=id)
@@ -195,6 +201,9 @@ async def update_save(request: Request, id: int) -> SaveSchema:
             platform_fs_slug=db_save.rom.platform_slug,
             rom_id=db_save.rom.id,
         )
+        background_tasks.add_task(
+            fs_asset_handler.store_thumbnail, scanned_screenshot.full_path
+        )
         db_screenshot = db_screenshot_handler.get_screenshot(
             filename=screenshotFile.filename,
             rom_id=db_save.rom.id,
@@ -257,6 +266,7 @@ async def delete_saves(request: Request) -> list[int]:
             try:
                 file_path = f"{save.screenshot.file_path}/{save.screenshot.file_name}"
                 await fs_asset_handler.remove_file(file_path=file_path)
+                await fs_asset_handler.remove_thumbnail(file_path)
             except FileNotFoundError:
                 error = f"Screenshot file {hl(save.screenshot.file_name)} not found for save {hl(save.file_name)}[{hl(save.rom.platform_slug)}]"
                 log.error(error)
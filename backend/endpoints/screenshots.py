@@ -1,7 +1,7 @@
 from decorators.auth import protected_route
 from endpoints.responses.assets import ScreenshotSchema
 from exceptions.endpoint_exceptions import RomNotFoundInDatabaseException
-from fastapi import HTTPException, Request, UploadFile, status
+from fastapi import BackgroundTasks, HTTPException, Request, UploadFile, status
 from handler.auth.constants import Scope
 from handler.database import db_rom_handler, db_screenshot_handler
 from handler.filesystem import fs_asset_handler
@@ -21,6 +21,7 @@ router = APIRouter(
 async def add_screenshot(
     request: Request,
     rom_id: int,
+    background_tasks: BackgroundTasks,
 ) -> ScreenshotSchema:
     data = await request.form()
 
@@ -65,6 +66,9 @@ async def add_screenshot(
         platform_fs_slug=rom.platform_slug,
         rom_id=rom.id,
     )
+    background_tasks.add_task(
+        fs_asset_handler.store_thumbnail, scanned_screenshot.full_path
+    )
     db_screenshot = db_screenshot_handler.get_screenshot(
         filename=screenshotFile.filename,
         rom_id=rom.id,
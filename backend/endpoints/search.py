@@ -1,9 +1,14 @@
 import asyncio
+import json
+from collections.abc import AsyncIterator, Coroutine
+from typing import Any, Final
 
+from config import METADATA_SEARCH_CACHE_TTL
 from decorators.auth import protected_route
 from endpoints.responses.search import SearchCoverSchema, SearchRomSchema
 from exceptions.endpoint_exceptions import SGDBInvalidAPIKeyException
 from fastapi import HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from handler.auth.constants import Scope
 from handler.database import db_rom_handler
 from handler.metadata import (
@@ -12,15 +17,18 @@ from handler.metadata import (
     meta_sgdb_handler,
     meta_ss_handler,
 )
-from handler.metadata.igdb_handler import IGDB_API_ENABLED, IGDBRom
-from handler.metadata.moby_handler import MOBY_API_ENABLED, MobyGamesRom
+from handler.metadata.igdb_handler import IGDB_API_ENABLED
+from handler.metadata.moby_handler import MOBY_API_ENABLED
 from handler.metadata.sgdb_handler import STEAMGRIDDB_API_ENABLED, SGDBRom
-from handler.metadata.ss_handler import SS_API_ENABLED, SSRom
+from handler.metadata.ss_handler import SS_API_ENABLED
+from handler.redis_handler import async_cache
 from handler.scan_handler import get_main_platform_igdb_id
 from logger.formatter import BLUE, CYAN
 from logger.formatter import highlight as hl
 from logger.logger import log
+from models.rom import Rom
 from utils import emoji
+from utils.cache import LookupCache
 from utils.router import APIRouter
 
 router = APIRouter(
@@ -28,14 +36,237 @@ router = APIRouter(
     tags=["search"],
 )
 
+# Matched ROMs of a search are merged by normalized name, in this order of precedence
+SEARCH_PROVIDERS: Final = (
+    ("igdb", "igdb_id", meta_igdb_handler),
+    ("moby", "moby_id", meta_moby_handler),
+    ("ss", "ss_id", meta_ss_handler),
+)
+
+search_cache = LookupCache(async_cache, "search_roms", ttl=METADATA_SEARCH_CACHE_TTL)
+
+# Latest search of each session, set once a newer search supersedes it
+_superseded_events: dict[str, asyncio.Event] = {}
+
+
+class SearchSupersededError(Exception):
+    pass
+
+
+def _get_session_key(request: Request) -> str:
+    session_cookie = request.cookies.get("romm_session")
+    if session_cookie:
+        return f"session:{session_cookie}"
+    return f"user:{request.user.id}"
+
+
+def _merge_matched_roms(
+    rom: Rom,
+    provider_roms: dict[str, list[dict[str, Any]]],
+    sgdb_roms: dict[str, SGDBRom],
+) -> list[dict[str, Any]]:
+    merged_dict: dict[str, dict[str, Any]] = {}
+
+    for source, id_field, handler in SEARCH_PROVIDERS:
+        for provider_rom in provider_roms.get(source, []):
+            if not provider_rom[id_field]:
+                continue
+
+            name = handler.normalize_search_term(
+                provider_rom.get("name", ""),
+                remove_articles=False,
+            )
+            merged_dict[name] = {
+                **{k: v for k, v in provider_rom.items() if k != "url_cover"},
+                "platform_id": rom.platform_id,
+                f"{source}_url_cover": provider_rom.get("url_cover", ""),
+                **merged_dict.get(name, {}),
+            }
+
+    for name, sgdb_rom in sgdb_roms.items():
+        if name in merged_dict and sgdb_rom["sgdb_id"]:
+            merged_dict[name] = {
+                **merged_dict[name],
+                "sgdb_id": sgdb_rom.get("sgdb_id", ""),
+                "sgdb_url_cover": sgdb_rom.get("url_cover", ""),
+            }
+
+    return list(merged_dict.values())
+
+
+async def _wait_first(
+    pending: set[asyncio.Task], superseded: asyncio.Event
+) -> tuple[set[asyncio.Task], set[asyncio.Task]]:
+    """Wait for the first of the pending tasks to complete, unless the search is superseded."""
+    superseded_waiter = asyncio.create_task(superseded.wait())
+    try:
+        done, pending = await asyncio.wait(
+            pending | {superseded_waiter}, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        superseded_waiter.cancel()
 
-@protected_route(router.get, "/roms", [Scope.ROMS_READ])
+    if superseded.is_set():
+        raise SearchSupersededError()
+
+    pending.discard(superseded_waiter)
+    return done, pending
+
+
+async def _iter_matched_roms(
+    rom: Rom,
+    search_term: str,
+    search_by: str,
+    superseded: asyncio.Event,
+    failed_sources: set[str],
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield the merged matched ROMs every time a provider answers.
+
+    A provider that fails is left out of the results, and added to failed_sources.
+    """
+    provider_coros: dict[str, Coroutine[Any, Any, Any]] = {}
+    if search_by == "id":
+        provider_coros = {
+            "igdb": meta_igdb_handler.get_matched_rom_by_id(int(search_term)),
+            "moby": meta_moby_handler.get_matched_rom_by_id(int(search_term)),
+            "ss": meta_ss_handler.get_matched_rom_by_id(int(search_term)),
+        }
+    elif search_by == "name":
+        provider_coros = {
+            "igdb": meta_igdb_handler.get_matched_roms_by_name(
+                search_term, get_main_platform_igdb_id(rom.platform)
+            ),
+            "moby": meta_moby_handler.get_matched_roms_by_name(
+                search_term, rom.platform.moby_id
+            ),
+            "ss": meta_ss_handler.get_matched_roms_by_name(
+                search_term, rom.platform.ss_id
+            ),
+        }
+
+    provider_tasks = {
+        asyncio.create_task(coro): source for source, coro in provider_coros.items()
+    }
+    provider_roms: dict[str, list[dict[str, Any]]] = {}
+    sgdb_tasks: dict[asyncio.Task, str] = {}
+    sgdb_roms: dict[str, SGDBRom] = {}
+
+    try:
+        pending = set(provider_tasks)
+        while pending:
+            done, pending = await _wait_first(pending, superseded)
+            for task in done:
+                source = provider_tasks[task]
+                try:
+                    result = task.result()
+                except Exception as exc:
+                    log.error(f"Search error: {source} failed: {exc}")
+                    failed_sources.add(source)
+                    result = []
+                if search_by == "id":
+                    result = [result] if result else []
+                provider_roms[source] = result
+
+            yield _merge_matched_roms(rom, provider_roms, sgdb_roms)
+
+        if not provider_tasks:
+            yield []
+
+        sgdb_tasks = {
+            asyncio.create_task(meta_sgdb_handler.get_details_by_names([name])): name
+            for name in {
+                handler.normalize_search_term(
+                    provider_rom.get("name", ""), remove_articles=False
+                )
+                for source, id_field, handler in SEARCH_PROVIDERS
+                for provider_rom in provider_roms.get(source, [])
+                if provider_rom[id_field]
+            }
+        }
+        pending = set(sgdb_tasks)
+        while pending:
+            done, pending = await _wait_first(pending, superseded)
+            for task in done:
+                try:
+                    sgdb_roms[sgdb_tasks[task]] = task.result()
+                except Exception as exc:
+                    log.error(f"Search error: sgdb failed: {exc}")
+                    failed_sources.add("sgdb")
+
+        if sgdb_tasks:
+            yield _merge_matched_roms(rom, provider_roms, sgdb_roms)
+    finally:
+        for task in (*provider_tasks, *sgdb_tasks):
+            task.cancel()
+        await asyncio.gather(*provider_tasks, *sgdb_tasks, return_exceptions=True)
+
+
+async def _search_matched_roms(
+    request: Request, rom: Rom, search_term: str, search_by: str, cache_key: str
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Run a search, superseding the running search of the same session, and cache its results."""
+    session_key = _get_session_key(request)
+    previous_search = _superseded_events.get(session_key)
+    if previous_search:
+        previous_search.set()
+    superseded = asyncio.Event()
+    _superseded_events[session_key] = superseded
+
+    matched_roms: list[dict[str, Any]] = []
+    failed_sources: set[str] = set()
+    try:
+        async for matched_roms in _iter_matched_roms(
+            rom, search_term, search_by, superseded, failed_sources
+        ):
+            yield matched_roms
+    finally:
+        if _superseded_events.get(session_key) is superseded:
+            del _superseded_events[session_key]
+
+    # Don't keep the results of a failed provider out of the next searches
+    if not failed_sources:
+        await search_cache.set(cache_key, matched_roms)
+
+    log.info("Results:")
+    for m_rom in matched_roms:
+        log.info(f"\t - {m_rom['name']}")
+
+
+def _to_ndjson_line(matched_roms: list[dict[str, Any]]) -> str:
+    return (
+        json.dumps(
+            [
+                SearchRomSchema.model_validate(matched_rom).model_dump(mode="json")
+                for matched_rom in matched_roms
+            ]
+        )
+        + "\n"
+    )
+
+
+async def _stream_matched_roms(
+    matched_roms_iter: AsyncIterator[list[dict[str, Any]]],
+) -> AsyncIterator[str]:
+    try:
+        async for matched_roms in matched_roms_iter:
+            yield _to_ndjson_line(matched_roms)
+    except SearchSupersededError:
+        log.debug("Search superseded by a newer one, stopping")
+
+
+@protected_route(
+    router.get,
+    "/roms",
+    [Scope.ROMS_READ],
+    response_model=list[SearchRomSchema],
+)
 async def search_rom(
     request: Request,
     rom_id: int,
     search_term: str | None = None,
     search_by: str = "name",
-) -> list[SearchRomSchema]:
+    stream: bool = False,
+) -> list[SearchRomSchema] | StreamingResponse:
     """Search for rom in metadata providers
 
     Args:
@@ -45,6 +276,8 @@ async def search_rom(
         search_term (str, optional): Search term. Defaults to None.
         search_by (str, optional): Search by name or ID. Defaults to "name".
         search_extended (bool, optional): Search extended info. Defaults to False.
+        stream (bool, optional): Stream the matched roms as newline-delimited JSON, one
+            updated list per line as each provider answers. Defaults to False.
 
     Returns:
         list[SearchRomSchema]: List of matched roms
@@ -65,115 +298,53 @@ async def search_rom(
     if not search_term:
         return []
 
+    search_by = search_by.lower()
+    if search_by == "id" and not search_term.strip().isdigit():
+        log.error(f"Search error: invalid ID '{search_term}'")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Tried searching by ID, but '{search_term}' is not a valid ID",
+        )
+
     log.info(
         f"{emoji.EMOJI_MAGNIFYING_GLASS_TILTED_RIGHT} Searching metadata providers..."
     )
-    matched_roms: list = []
-
-    log.info(f"Searching by {hl(search_by.lower(), color=CYAN)}:")
+    log.info(f"Searching by {hl(search_by, color=CYAN)}:")
     log.info(
         f"{emoji.EMOJI_VIDEO_GAME} {hl(rom.platform_display_name, color=BLUE)} [{rom.platform_fs_slug}]: {hl(search_term)}[{rom.fs_name}]"
     )
 
-    igdb_matched_roms: list[IGDBRom] = []
-    moby_matched_roms: list[MobyGamesRom] = []
-    ss_matched_roms: list[SSRom] = []
-
-    if search_by.lower() == "id":
-        try:
-            igdb_rom, moby_rom, ss_rom = await asyncio.gather(
-                meta_igdb_handler.get_matched_rom_by_id(int(search_term)),
-                meta_moby_handler.get_matched_rom_by_id(int(search_term)),
-                meta_ss_handler.get_matched_rom_by_id(int(search_term)),
-            )
-        except ValueError as exc:
-            log.error(f"Search error: invalid ID '{search_term}'")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Tried searching by ID, but '{search_term}' is not a valid ID",
-            ) from exc
-        else:
-            igdb_matched_roms = [igdb_rom] if igdb_rom else []
-            moby_matched_roms = [moby_rom] if moby_rom else []
-            ss_matched_roms = [ss_rom] if ss_rom else []
-    elif search_by.lower() == "name":
-        (
-            igdb_matched_roms,
-            moby_matched_roms,
-            ss_matched_roms,
-        ) = await asyncio.gather(
-            meta_igdb_handler.get_matched_roms_by_name(
-                search_term, get_main_platform_igdb_id(rom.platform)
-            ),
-            meta_moby_handler.get_matched_roms_by_name(
-                search_term, rom.platform.moby_id
-            ),
-            meta_ss_handler.get_matched_roms_by_name(search_term, rom.platform.ss_id),
-        )
-
-    merged_dict: dict[str, dict] = {}
-
-    for igdb_rom in igdb_matched_roms:
-        if igdb_rom["igdb_id"]:
-            igdb_name = meta_igdb_handler.normalize_search_term(
-                igdb_rom.get("name", ""),
-                remove_articles=False,
-            )
-            merged_dict[igdb_name] = {
-                **igdb_rom,
-                "platform_id": rom.platform_id,
-                "igdb_url_cover": igdb_rom.pop("url_cover", ""),
-                **merged_dict.get(igdb_name, {}),
-            }
-
-    for moby_rom in moby_matched_roms:
-        if moby_rom["moby_id"]:
-            moby_name = meta_moby_handler.normalize_search_term(
-                moby_rom.get("name", ""),
-                remove_articles=False,
+    cache_key = f"{search_by}:{rom.platform_id}:{search_term.strip().lower()}"
+    cached_matched_roms = await search_cache.get(cache_key)
+    if cached_matched_roms is not None:
+        log.debug("Returning cached search results")
+        if stream:
+            return StreamingResponse(
+                iter([_to_ndjson_line(cached_matched_roms)]),
+                media_type="application/x-ndjson",
             )
-            merged_dict[moby_name] = {
-                **moby_rom,
-                "platform_id": rom.platform_id,
-                "moby_url_cover": moby_rom.pop("url_cover", ""),
-                **merged_dict.get(moby_name, {}),
-            }
-
-    for ss_rom in ss_matched_roms:
-        if ss_rom["ss_id"]:
-            ss_name = meta_ss_handler.normalize_search_term(
-                ss_rom.get("name", ""),
-                remove_articles=False,
-            )
-            merged_dict[ss_name] = {
-                **ss_rom,
-                "platform_id": rom.platform_id,
-                "ss_url_cover": ss_rom.pop("url_cover", ""),
-                **merged_dict.get(ss_name, {}),
-            }
-
-    async def get_sgdb_rom(name: str) -> tuple[str, SGDBRom]:
-        return name, await meta_sgdb_handler.get_details_by_names([name])
+        return cached_matched_roms
 
-    sgdb_roms = await asyncio.gather(
-        *[get_sgdb_rom(name) for name in list(merged_dict.keys())]
+    matched_roms_iter = _search_matched_roms(
+        request, rom, search_term, search_by, cache_key
     )
+    if stream:
+        return StreamingResponse(
+            _stream_matched_roms(matched_roms_iter),
+            media_type="application/x-ndjson",
+        )
 
-    for name, sgdb_rom in sgdb_roms:
-        if sgdb_rom["sgdb_id"]:
-            merged_dict[name] = {
-                **merged_dict[name],
-                "sgdb_id": sgdb_rom.get("sgdb_id", ""),
-                "sgdb_url_cover": sgdb_rom.get("url_cover", ""),
-            }
-
-    matched_roms = list(merged_dict.values())
-
-    log.info("Results:")
-    for m_rom in matched_roms:
-        log.info(f"\t - {m_rom['name']}")
+    matched_roms: list[dict[str, Any]] = []
+    try:
+        async for partial_matched_roms in matched_roms_iter:
+            matched_roms = partial_matched_roms
+    except SearchSupersededError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Search superseded by a newer one",
+        ) from exc
 
-    return matched_roms
+    return matched_roms  # type: ignore[return-value]
 
 
 @protected_route(router.get, "/cover", [Scope.ROMS_READ])
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from itertools import batched
 from typing import Any, Final
@@ -22,6 +23,7 @@ from handler.filesystem import (
     fs_rom_handler,
 )
 from handler.filesystem.roms_handler import FSRom
+from handler.metadata import meta_igdb_handler
 from handler.redis_handler import high_prio_queue, redis_client
 from handler.scan_handler import (
     ScanType,
@@ -264,39 +266,44 @@ async def _identify_rom(
     if _added_rom.ra_metadata:
         await fs_resource_handler.create_ra_resources_path(platform.id, _added_rom.id)
 
-        # Store the achievements badges
-        for ach in _added_rom.ra_metadata.get("achievements", []):
-            # Store both normal and locked version
-            badge_url_lock = ach.get("badge_url_lock", None)
-            badge_path_lock = ach.get("badge_path_lock", None)
-            if badge_url_lock and badge_path_lock:
-                await fs_resource_handler.store_ra_badge(
-                    badge_url_lock, badge_path_lock
-                )
-            badge_url = ach.get("badge_url", None)
-            badge_path = ach.get("badge_path", None)
-            if badge_url and badge_path:
-                await fs_resource_handler.store_ra_badge(badge_url, badge_path)
-
-    path_cover_s, path_cover_l = await fs_resource_handler.get_cover(
-        entity=_added_rom,
-        overwrite=True,
-        url_cover=_added_rom.url_cover,
-    )
-
-    path_manual = await fs_resource_handler.get_manual(
-        rom=_added_rom,
-        overwrite=True,
-        url_manual=_added_rom.url_manual,
-    )
-
-    path_screenshots = await fs_resource_handler.get_rom_screenshots(
-        rom=_added_rom,
-        url_screenshots=_added_rom.url_screenshots,
+    # Download all the resources of the rom at once, the handler caps the number
+    # of downloads running across all roms
+    (path_cover_s, path_cover_l), path_manual, path_screenshots, _ = (
+        await asyncio.gather(
+            fs_resource_handler.get_cover(
+                entity=_added_rom,
+                overwrite=True,
+                url_cover=_added_rom.url_cover,
+            ),
+            fs_resource_handler.get_manual(
+                rom=_added_rom,
+                overwrite=True,
+                url_manual=_added_rom.url_manual,
+            ),
+            fs_resource_handler.get_rom_screenshots(
+                rom=_added_rom,
+                url_screenshots=_added_rom.url_screenshots,
+            ),
+            # Store both normal and locked version of the achievements badges
+            fs_resource_handler.store_ra_badges(
+                [
+                    (url, path)
+                    for ach in (_added_rom.ra_metadata or {}).get("achievements", [])
+                    for url, path in (
+                        (ach.get("badge_url_lock"), ach.get("badge_path_lock")),
+                        (ach.get("badge_url"), ach.get("badge_path")),
+                    )
+                    if url and path
+                ]
+            ),
+        )
     )
 
     _added_rom.path_cover_s = path_cover_s
     _added_rom.path_cover_l = path_cover_l
+    _added_rom.cover_placeholder = await fs_resource_handler.get_cover_placeholder(
+        _added_rom
+    )
     _added_rom.path_screenshots = path_screenshots
     _added_rom.path_manual = path_manual
 
@@ -306,6 +313,7 @@ async def _identify_rom(
         {
             "path_cover_s": path_cover_s,
             "path_cover_l": path_cover_l,
+            "cover_placeholder": _added_rom.cover_placeholder,
             "path_screenshots": path_screenshots,
             "path_manual": path_manual,
         },
@@ -408,6 +416,20 @@ async def _identify_platform(
             fs_names={fs_rom["fs_name"] for fs_rom in fs_roms_batch},
         )
 
+        # Load the fixture index entries of the roms to be identified in one go
+        await meta_igdb_handler.prefetch_fixture_indexes(
+            platform.slug,
+            [
+                fs_rom["fs_name"]
+                for fs_rom in fs_roms_batch
+                if _should_scan_rom(
+                    scan_type=scan_type,
+                    rom=rom_by_filename_map.get(fs_rom["fs_name"]),
+                    roms_ids=roms_ids,
+                )
+            ],
+        )
+
         for fs_rom in fs_roms_batch:
             scan_stats += await _identify_rom(
                 platform=platform,
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from decorators.auth import protected_route
 from endpoints.responses.assets import StateSchema
 from exceptions.endpoint_exceptions import RomNotFoundInDatabaseException
-from fastapi import HTTPException, Request, UploadFile, status
+from fastapi import BackgroundTasks, HTTPException, Request, UploadFile, status
 from handler.auth.constants import Scope
 from handler.database import db_rom_handler, db_screenshot_handler, db_state_handler
 from handler.filesystem import fs_asset_handler
@@ -23,6 +23,7 @@ router = APIRouter(
 async def add_state(
     request: Request,
     rom_id: int,
+    background_tasks: BackgroundTasks,
     emulator: str | None = None,
 ) -> StateSchema:
     data = await request.form()
@@ -107,6 +108,9 @@ async def add_state(
             platform_fs_slug=rom.platform_slug,
             rom_id=rom.id,
         )
+        background_tasks.add_task(
+            fs_asset_handler.store_thumbnail, scanned_screenshot.full_path
+        )
         db_screenshot = db_screenshot_handler.get_screenshot(
             filename=screenshotFile.filename,
             rom_id=rom.id,
@@ -164,7 +168,9 @@ def get_state(request: Request, id: int) -> StateSchema:
 
 
 @protected_route(router.put, "/{id}", [Scope.ASSETS_WRITE])
-async def update_state(request: Request, id: int) -> StateSchema:
+async def update_state(
+    request: Request, id: int, background_tasks: BackgroundTasks
+) -> StateSchema:
     data = await request.form()
 
     db_state = db_state_handler.get_state(user_id=request.user.id, id=id)
@@ -197,6 +203,9 @@ async def update_state(request: Request, id: int) -> StateSchema:
             platform_fs_slug=db_state.rom.platform_slug,
             rom_id=db_state.rom.id,
         )
+        background_tasks.add_task(
+            fs_asset_handler.store_thumbnail, scanned_screenshot.full_path
+        )
         db_screenshot = db_screenshot_handler.get_screenshot(
             filename=screenshotFile.filename,
             rom_id=db_state.rom.id,
@@ -261,6 +270,7 @@ async def delete_states(request: Request) -> list[int]:
             try:
                 file_path = f"{state.screenshot.file_path}/{state.screenshot.file_name}"
                 await fs_asset_handler.remove_file(file_path=file_path)
+                await fs_asset_handler.remove_thumbnail(file_path)
             except FileNotFoundError:
                 error = f"Screenshot file {hl(state.screenshot.file_name)} not found for state {hl(state.file_name)}[{hl(state.rom.platform_slug)}]"
                 log.error(error)
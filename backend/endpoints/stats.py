@@ -1,5 +1,10 @@
+from decorators.auth import protected_route
 from endpoints.responses.stats import StatsReturn
+from fastapi import Request
+from handler.auth.constants import Scope
 from handler.database import db_stats_handler
+from utils.http_transport import HTTPHostMetrics, get_http_metrics
+from utils.instrumentation import ProviderMetrics, get_provider_metrics
 from utils.router import APIRouter
 
 router = APIRouter(
@@ -24,3 +29,25 @@ def stats() -> StatsReturn:
         "SCREENSHOTS": db_stats_handler.get_screenshots_count(),
         "TOTAL_FILESIZE_BYTES": db_stats_handler.get_total_filesize(),
     }
+
+
+@protected_route(router.get, "/http", [Scope.TASKS_RUN])
+async def http_stats(request: Request) -> list[HTTPHostMetrics]:
+    """Endpoint to return the request count, errors and average latency of each external host
+
+    Returns:
+        list[HTTPHostMetrics]: Metrics of each host RomM sent requests to
+    """
+
+    return await get_http_metrics()
+
+
+@protected_route(router.get, "/providers", [Scope.TASKS_RUN])
+async def provider_stats(request: Request) -> list[ProviderMetrics]:
+    """Endpoint to return the call count, errors, cache hits and average latency of each metadata provider call
+
+    Returns:
+        list[ProviderMetrics]: Metrics of each provider and endpoint
+    """
+
+    return await get_provider_metrics()
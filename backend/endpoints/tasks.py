@@ -12,6 +12,8 @@ from handler.auth.constants import Scope
 from handler.redis_handler import low_prio_queue
 from rq.job import Job
 from tasks.manual.cleanup_orphaned_resources import cleanup_orphaned_resources_task
+from tasks.manual.import_dat_files import import_dat_files_task
+from tasks.manual.purge_lookup_cache import purge_lookup_cache_task
 from tasks.scheduled.scan_library import scan_library_task
 from tasks.scheduled.update_launchbox_metadata import update_launchbox_metadata_task
 from tasks.scheduled.update_switch_titledb import update_switch_titledb_task
@@ -31,6 +33,8 @@ scheduled_tasks: dict[str, Task] = {
 
 manual_tasks: dict[str, Task] = {
     "cleanup_orphaned_resources": cleanup_orphaned_resources_task,
+    "import_dat_files": import_dat_files_task,
+    "purge_lookup_cache": purge_lookup_cache_task,
 }
 
 
@@ -59,6 +59,10 @@ class DBPlatformsHandler(DBBaseHandler):
     ) -> Sequence[Platform]:
         return session.scalars(query.order_by(Platform.name.asc())).unique().all()
 
+    @begin_session
+    def get_platform_ids(self, session: Session = None) -> set[int]:
+        return set(session.scalars(select(Platform.id)).all())
+
     @begin_session
     @with_firmware
     def get_platform_by_fs_slug(
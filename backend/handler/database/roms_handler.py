@@ -6,6 +6,7 @@ from config import ROMM_DB_DRIVER
 from decorators.database import begin_session
 from handler.metadata.base_hander import UniversalPlatformSlug as UPS
 from models.assets import Save, Screenshot, State
+from models.collection import SmartCollection
 from models.platform import Platform
 from models.rom import Rom, RomFile, RomMetadata, RomUser
 from sqlalchemy import (
@@ -25,7 +26,14 @@ from sqlalchemy import (
     text,
     update,
 )
-from sqlalchemy.orm import Query, Session, joinedload, noload, selectinload
+from sqlalchemy.orm import (
+    Query,
+    Session,
+    joinedload,
+    load_only,
+    noload,
+    selectinload,
+)
 
 from .base_handler import DBBaseHandler
 
@@ -148,6 +156,29 @@ class DBRomsHandler(DBBaseHandler):
     ) -> Rom | None:
         return session.scalar(query.filter_by(id=id).limit(1))
 
+    @begin_session
+    def get_rom_ids_by_platform(self, session: Session = None) -> dict[int, set[int]]:
+        """Retrieve the ids of all roms by platform id, without loading the roms."""
+        rom_ids: dict[int, set[int]] = {}
+        for platform_id, rom_id in session.execute(select(Rom.platform_id, Rom.id)):
+            rom_ids.setdefault(platform_id, set()).add(rom_id)
+        return rom_ids
+
+    @begin_session
+    def get_roms_by_ids(
+        self, ids: Iterable[int], session: Session = None
+    ) -> Sequence[Rom]:
+        """Retrieve roms by id, with only the columns locating their resources."""
+        return session.scalars(
+            select(Rom)
+            .options(
+                load_only(Rom.id, Rom.platform_id, Rom.path_cover_s),
+                noload(Rom.platform),
+                noload(Rom.metadatum),
+            )
+            .filter(Rom.id.in_(ids))
+        ).all()
+
     def filter_by_platform_id(self, query: Query, platform_id: int):
         return query.filter(Rom.platform_id == platform_id)
 
@@ -756,13 +787,67 @@ class DBRomsHandler(DBBaseHandler):
 
     @begin_session
     def update_rom(self, id: int, data: dict, session: Session = None) -> Rom:
+        previous_covers = (
+            session.execute(
+                select(Rom.path_cover_s, Rom.path_cover_l).where(Rom.id == id)
+            ).one_or_none()
+            if "path_cover_s" in data or "path_cover_l" in data
+            else None
+        )
+
         session.execute(
             update(Rom)
             .where(Rom.id == id)
             .values(**data)
             .execution_options(synchronize_session="evaluate")
         )
-        return session.query(Rom).filter_by(id=id).one()
+        rom = session.query(Rom).filter_by(id=id).one()
+
+        if previous_covers and tuple(previous_covers) != (
+            rom.path_cover_s,
+            rom.path_cover_l,
+        ):
+            self._update_smart_collections_covers(rom.id, session=session)
+
+        return rom
+
+    def _update_smart_collections_covers(self, rom_id: int, session: Session) -> None:
+        """Rebuild the cover URLs of the smart collections of a rom whose cover changed.
+
+        Smart collections store the URLs of the covers of their first roms, and
+        the previous cover files are removed when a cover changes.
+        """
+        for smart_collection in session.scalars(select(SmartCollection)).unique():
+            if rom_id not in smart_collection.rom_ids:
+                continue
+
+            roms_by_id = {
+                rom.id: rom
+                for rom in session.scalars(
+                    select(Rom)
+                    .options(
+                        load_only(Rom.id, Rom.path_cover_s, Rom.path_cover_l),
+                        noload(Rom.platform),
+                        noload(Rom.metadatum),
+                    )
+                    .where(
+                        Rom.id.in_(smart_collection.rom_ids),
+                        or_(Rom.path_cover_s != "", Rom.path_cover_l != ""),
+                    )
+                )
+            }
+            session.execute(
+                update(SmartCollection)
+                .where(SmartCollection.id == smart_collection.id)
+                .values(
+                    **smart_collection.get_covers(
+                        roms_by_id[id]
+                        for id in smart_collection.rom_ids
+                        if id in roms_by_id
+                    )
+                )
+                .execution_options(synchronize_session="evaluate")
+            )
 
     @begin_session
     def delete_rom(self, id: int, session: Session = None) -> None:
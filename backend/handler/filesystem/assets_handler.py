@@ -1,10 +1,24 @@
 import os
+from pathlib import Path
+from typing import Final
 
 from config import ASSETS_BASE_PATH
+from logger.logger import log
 from models.user import User
+from PIL import Image, UnidentifiedImageError
+from utils.images import (
+    RENDITION_FORMAT,
+    ImageFormat,
+    render_resized_image,
+    run_image_task,
+)
 
 from .base_handler import FSHandler
 
+# Thumbnails of the image assets, such as screenshots, mirror the tree of the assets
+ASSET_THUMBNAILS_PATH: Final = "thumbnails"
+ASSET_THUMBNAIL_WIDTH: Final = 512
+
 
 class FSAssetsHandler(FSHandler):
     def __init__(self) -> None:
@@ -64,3 +78,65 @@ class FSAssetsHandler(FSHandler):
         return self._build_asset_file_path(
             user, "screenshots", platform_fs_slug, rom_id
         )
+
+    # /thumbnails/users/557365723a31/screenshots/n64/{rom.id}/{file_name}.webp
+    def build_thumbnail_path(self, asset_path: str) -> str:
+        return os.path.join(ASSET_THUMBNAILS_PATH, f"{asset_path}.{RENDITION_FORMAT}")
+
+    async def get_thumbnail(self, asset_path: str) -> str:
+        """Get the thumbnail of an image asset, rendering it if missing or outdated.
+
+        Args:
+            asset_path: Relative path of the asset
+        Returns
+            Relative path of the thumbnail
+
+        Raises:
+            FileNotFoundError: If the asset does not exist
+            ValueError: If the path is invalid
+        """
+        source_file = self.validate_path(asset_path)
+        if Path(asset_path).parts[:1] == (ASSET_THUMBNAILS_PATH,):
+            raise ValueError("Thumbnails don't have thumbnails")
+        if not source_file.is_file():
+            raise FileNotFoundError(f"File not found: {source_file}")
+
+        thumbnail_path = self.build_thumbnail_path(asset_path)
+        thumbnail_file = self.validate_path(thumbnail_path)
+
+        lock = await self._get_file_lock(f"render:{thumbnail_path}")
+        async with lock:
+            if (
+                thumbnail_file.is_file()
+                and thumbnail_file.stat().st_mtime_ns >= source_file.stat().st_mtime_ns
+            ):
+                return thumbnail_path
+
+            thumbnail_file.parent.mkdir(parents=True, exist_ok=True)
+            await run_image_task(
+                render_resized_image,
+                str(source_file),
+                str(thumbnail_file),
+                ASSET_THUMBNAIL_WIDTH,
+                ImageFormat.WEBP,
+            )
+
+        return thumbnail_path
+
+    async def store_thumbnail(self, asset_path: str) -> None:
+        """Render the thumbnail of an uploaded image asset, ahead of its first display."""
+        try:
+            await self.get_thumbnail(asset_path)
+        except (
+            FileNotFoundError,
+            ValueError,
+            UnidentifiedImageError,
+            Image.DecompressionBombError,
+            OSError,
+        ) as exc:
+            log.error(f"Unable to render thumbnail of {asset_path}: {str(exc)}")
+
+    async def remove_thumbnail(self, asset_path: str) -> None:
+        self.validate_path(self.build_thumbnail_path(asset_path)).unlink(
+            missing_ok=True
+        )
@@ -3,6 +3,7 @@ import fnmatch
 import os
 import re
 import shutil
+import weakref
 from contextlib import asynccontextmanager
 from enum import Enum
 from io import BytesIO
@@ -78,6 +79,7 @@ LANGUAGES_NAME_KEYS = frozenset(lang[1].lower() for lang in LANGUAGES)
 
 
 class CoverSize(Enum):
+    THUMB = "thumb"
     SMALL = "small"
     BIG = "big"
 
@@ -91,7 +93,11 @@ class Asset(Enum):
 class FSHandler:
     def __init__(self, base_path: str):
         self.base_path = Path(base_path).resolve()
-        self._locks: dict[str, asyncio.Lock] = {}
+        # Locks are dropped once no caller holds them, so that per URL and per
+        # rendition locks don't pile up in long-running processes
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
         self._lock_mutex = asyncio.Lock()
 
         # Create base directory synchronously during initialization
@@ -100,9 +106,11 @@ class FSHandler:
     async def _get_file_lock(self, file_path: str) -> asyncio.Lock:
         """Get or create a lock for a specific file path."""
         async with self._lock_mutex:
-            if file_path not in self._locks:
-                self._locks[file_path] = asyncio.Lock()
-            return self._locks[file_path]
+            lock = self._locks.get(file_path)
+            if lock is None:
+                lock = asyncio.Lock()
+                self._locks[file_path] = lock
+            return lock
 
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename to prevent path traversal and other attacks."""
@@ -1,26 +1,266 @@
+import asyncio
+import hashlib
+import json
 import os
+import shutil
+import time
+import uuid
+from collections.abc import Sequence
 from io import BytesIO
 from pathlib import Path
+from typing import Final, TypedDict
 
 import httpx
-from config import RESOURCES_BASE_PATH
+from anyio import open_file
+from config import RESIZED_IMAGES_CACHE_SIZE_MB, RESOURCES_BASE_PATH
 from fastapi import status
+from handler.redis_handler import async_cache
 from logger.logger import log
 from models.collection import Collection
 from models.rom import Rom
-from PIL import Image, ImageFile, UnidentifiedImageError
-from utils.context import ctx_httpx_client
+from PIL import Image, UnidentifiedImageError
+from utils.concurrency import LoopBoundSemaphore
+from utils.context import get_httpx_client
+from utils.filesystem import CONTENT_HASH_LENGTH, evict_lru_files
+from utils.http_transport import HTTPX_POOL_SETTINGS, HTTPPool
+from utils.images import (
+    RENDITION_FORMAT,
+    ImageFormat,
+    render_placeholder,
+    render_renditions,
+    render_resized_image,
+    render_sprite,
+    run_image_task,
+)
 
 from .base_handler import CoverSize, FSHandler
 
+# Downloads running at once across all ROMs, up to the size of the downloads
+# connection pool so that no download waits for a connection once started
+RESOURCES_MAX_CONCURRENT_DOWNLOADS: Final = HTTPX_POOL_SETTINGS[
+    HTTPPool.DOWNLOADS
+].max_connections
+
+# Downloaded resources are stored once under the hash of their content, and
+# linked into the resources path of every rom or collection using them
+RESOURCES_BLOBS_PATH: Final = "blobs"
+
+# Blob downloaded from every source URL, with the validators of the response
+RESOURCE_URLS_KEY: Final = "romm:resource_urls"
+# Seconds before a downloaded URL is checked for changes again, with a conditional
+# request, when the server sent an ETag or Last-Modified header
+RESOURCE_REVALIDATE_INTERVAL: Final = 24 * 60 * 60
+
+# Max height of the renditions of every cover, rendered next to the cover blob
+COVER_RENDITION_HEIGHTS: Final = {
+    CoverSize.THUMB: 128,
+    CoverSize.SMALL: 400,
+    CoverSize.BIG: 1200,
+}
+
+# Images resized on demand, evicted when they exceed the cache size
+RESIZED_IMAGES_PATH: Final = os.path.join("cache", "images")
+RESIZED_IMAGES_MAX_SIZE: Final = RESIZED_IMAGES_CACHE_SIZE_MB * 1024 * 1024
+# Eviction leaves the cache at this fraction of its max size
+RESIZED_IMAGES_EVICTION_RATIO: Final = 0.8
+# Requested widths are rounded up to one of these, to bound the number of renditions
+RESIZED_IMAGE_WIDTHS: Final = (64, 128, 256, 384, 512, 768, 1024, 1536, 2048)
+
+# Size of the resized images cache, as of the last eviction plus the images added
+RESIZED_IMAGES_SIZE_KEY: Final = "romm:resized_images_size"
+RESIZED_IMAGES_EVICTION_LOCK_KEY: Final = "romm:resized_images_eviction"
+
+# Cover sprite sheets pack the thumbnails of a page of ROMs, in the resized images cache
+COVER_SPRITE_MAX_COVERS: Final = 200
+# Supported tile widths, tiles are twice as high to fit portrait covers
+COVER_SPRITE_WIDTHS: Final = (64, 128, 192, 256)
+
+
+class BlobSource(TypedDict):
+    hash: str
+    etag: str | None
+    last_modified: str | None
+    checked_at: float
+
+
+class CoverSpriteTile(TypedDict):
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+class CoverSprite(TypedDict):
+    path: str
+    width: int
+    height: int
+    tiles: dict[int, CoverSpriteTile]
+
 
 class FSResourcesHandler(FSHandler):
     def __init__(self) -> None:
         super().__init__(base_path=RESOURCES_BASE_PATH)
+        self.download_slots = LoopBoundSemaphore(RESOURCES_MAX_CONCURRENT_DOWNLOADS)
 
     def get_platform_resources_path(self, platform_id: int) -> str:
         return os.path.join("roms", str(platform_id))
 
+    def _get_blob_path(self, content_hash: str) -> str:
+        return os.path.join(RESOURCES_BLOBS_PATH, content_hash[:2], content_hash)
+
+    async def _download_blob(
+        self, url: str, source: BlobSource | None = None
+    ) -> BlobSource | None:
+        """Download a resource into the blob store, unless unchanged since `source`."""
+        headers = {}
+        if source and source["etag"]:
+            headers["If-None-Match"] = source["etag"]
+        if source and source["last_modified"]:
+            headers["If-Modified-Since"] = source["last_modified"]
+
+        tmp_path = self._get_blob_tmp_path()
+        content_hash = hashlib.sha256()
+        httpx_client = get_httpx_client(HTTPPool.DOWNLOADS)
+        try:
+            async with (
+                self.download_slots,
+                httpx_client.stream(
+                    "GET", url, headers=headers, timeout=120
+                ) as response,
+            ):
+                if source and response.status_code == status.HTTP_304_NOT_MODIFIED:
+                    log.debug(f"Resource at {url} not modified, skipping download")
+                    return BlobSource(
+                        hash=source["hash"],
+                        etag=response.headers.get("ETag") or source["etag"],
+                        last_modified=source["last_modified"],
+                        checked_at=time.time(),
+                    )
+
+                if response.status_code != status.HTTP_200_OK:
+                    return None
+
+                async with await open_file(tmp_path, "wb") as f:
+                    async for chunk in response.aiter_raw():
+                        content_hash.update(chunk)
+                        await f.write(chunk)
+        except httpx.TransportError as exc:
+            log.error(f"Unable to fetch resource at {url}: {str(exc)}")
+            tmp_path.unlink(missing_ok=True)
+            return None
+
+        self._commit_blob(tmp_path, content_hash.hexdigest())
+        return BlobSource(
+            hash=content_hash.hexdigest(),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            checked_at=time.time(),
+        )
+
+    def _get_blob_tmp_path(self) -> Path:
+        tmp_directory = self.validate_path(os.path.join(RESOURCES_BLOBS_PATH, "tmp"))
+        tmp_directory.mkdir(parents=True, exist_ok=True)
+        return tmp_directory / uuid.uuid4().hex
+
+    def _commit_blob(self, tmp_path: Path, content_hash: str) -> None:
+        blob_path = self.validate_path(self._get_blob_path(content_hash))
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        if blob_path.exists():
+            # Same content already stored from another source
+            tmp_path.unlink()
+        else:
+            os.replace(tmp_path, blob_path)
+
+    async def write_blob(self, content: bytes) -> str:
+        """Store content in the blob store, returning the path of its blob."""
+        content_hash = hashlib.sha256(content).hexdigest()
+        tmp_path = self._get_blob_tmp_path()
+        async with await open_file(tmp_path, "wb") as f:
+            await f.write(content)
+
+        self._commit_blob(tmp_path, content_hash)
+        return self._get_blob_path(content_hash)
+
+    async def _get_blob_source(self, url: str) -> BlobSource | None:
+        source = await async_cache.hget(RESOURCE_URLS_KEY, url)
+        if not source:
+            return None
+
+        try:
+            source = BlobSource(**json.loads(source))
+        except (ValueError, TypeError):
+            # Entry stored in a previous format, download again
+            return None
+
+        if not await self.file_exists(self._get_blob_path(source["hash"])):
+            return None
+        return source
+
+    def _should_revalidate(self, source: BlobSource) -> bool:
+        # Without validators the URL is assumed to always serve the same content
+        return bool(source["etag"] or source["last_modified"]) and (
+            time.time() - source["checked_at"] > RESOURCE_REVALIDATE_INTERVAL
+        )
+
+    async def fetch_blob(self, url: str) -> str | None:
+        """Get the blob store path of the resource at `url`, downloading it if needed.
+
+        Resources are only downloaded once per URL, and identical content served by
+        different URLs is only stored once. Known URLs are checked for changes with
+        a conditional request once every RESOURCE_REVALIDATE_INTERVAL.
+
+        Args:
+            url: URL of the resource
+        Returns
+            Path of the blob, or None if the resource couldn't be fetched
+        """
+        lock = await self._get_file_lock(f"url:{url}")
+        async with lock:
+            source = await self._get_blob_source(url)
+            if source is None or self._should_revalidate(source):
+                downloaded_source = await self._download_blob(url, source)
+                if downloaded_source:
+                    source = downloaded_source
+                    await async_cache.hset(RESOURCE_URLS_KEY, url, json.dumps(source))
+
+            # A failed revalidation keeps the blob downloaded before
+            return self._get_blob_path(source["hash"]) if source else None
+
+    async def link_blob(self, blob_path: str, path: str, filename: str) -> None:
+        """Make a file of a rom or collection point to a blob, without copying it when possible.
+
+        Args:
+            blob_path: Path of the blob
+            path: Relative path of the directory of the file
+            filename: Name of the file
+        """
+        blob_file = self.validate_path(blob_path)
+        target_directory = self.validate_path(path)
+        target_file = target_directory / self._sanitize_filename(filename)
+
+        lock = await self._get_file_lock(str(target_file))
+        async with lock:
+            await asyncio.to_thread(self._link_file, blob_file, target_file)
+
+    @staticmethod
+    def _link_file(blob_file: Path, target_file: Path) -> None:
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        if target_file.exists() and os.path.samefile(target_file, blob_file):
+            return
+
+        tmp_file = target_file.parent / f".tmp_{uuid.uuid4().hex}"
+        try:
+            os.link(blob_file, tmp_file)
+        except OSError:
+            # Hard links are not supported by every filesystem
+            shutil.copyfile(blob_file, tmp_file)
+        os.replace(tmp_file, target_file)
+
+    async def _store_blob(self, url: str, path: str, filename: str) -> None:
+        blob_path = await self.fetch_blob(url)
+        if blob_path:
+            await self.link_blob(blob_path, path, filename)
+
     def cover_exists(self, entity: Rom | Collection, size: CoverSize) -> bool:
         """Check if rom cover exists in filesystem
 
@@ -36,55 +276,83 @@ class FSResourcesHandler(FSHandler):
             return True  # At least one file found
         return False
 
-    def resize_cover_to_small(self, cover: ImageFile.ImageFile, save_path: str) -> None:
-        """Resize cover to small size, and save it to filesystem."""
-        if cover.height >= 1000:
-            ratio = 0.2
-        else:
-            ratio = 0.4
+    def _get_file_hash(self, path: str) -> str:
+        with open(self.validate_path(path), "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    def _get_cover_rendition_path(self, blob_path: str, size: CoverSize) -> str:
+        return f"{blob_path}.{size.value}.{RENDITION_FORMAT}"
+
+    async def _render_cover(self, blob_path: str) -> dict[CoverSize, str] | None:
+        """Render the renditions of a cover blob that aren't rendered yet.
+
+        Args:
+            blob_path: Path of the cover blob
+        Returns
+            Blob path of every rendition, or None if the cover couldn't be rendered
+        """
+        rendition_paths = {
+            size: self._get_cover_rendition_path(blob_path, size)
+            for size in COVER_RENDITION_HEIGHTS
+        }
+
+        lock = await self._get_file_lock(f"render:{blob_path}")
+        async with lock:
+            missing_renditions = {
+                str(self.validate_path(rendition_path)): COVER_RENDITION_HEIGHTS[size]
+                for size, rendition_path in rendition_paths.items()
+                if not self.validate_path(rendition_path).is_file()
+            }
+            if not missing_renditions:
+                return rendition_paths
 
-        small_width = int(cover.width * ratio)
-        small_height = int(cover.height * ratio)
-        small_size = (small_width, small_height)
-        small_img = cover.resize(small_size)
+            try:
+                await run_image_task(
+                    render_renditions,
+                    str(self.validate_path(blob_path)),
+                    missing_renditions,
+                )
+            except (
+                UnidentifiedImageError,
+                Image.DecompressionBombError,
+                OSError,
+            ) as exc:
+                log.error(f"Unable to render image {blob_path}: {str(exc)}")
+                return None
 
-        small_img.save(save_path)
+        return rendition_paths
 
-    async def _store_cover(
-        self, entity: Rom | Collection, url_cover: str, size: CoverSize
+    async def _link_cover(
+        self, entity: Rom | Collection, rendition_paths: dict[CoverSize, str]
     ) -> None:
-        """Store roms resources in filesystem
+        cover_path = f"{entity.fs_resources_path}/cover"
+        for size, rendition_path in rendition_paths.items():
+            # Named after their content, so that their URL can be cached forever
+            content_hash = await asyncio.to_thread(self._get_file_hash, rendition_path)
+            filename = (
+                f"{size.value}.{content_hash[:CONTENT_HASH_LENGTH]}.{RENDITION_FORMAT}"
+            )
+            await self.link_blob(rendition_path, cover_path, filename)
+
+            # Previous covers, or covers stored in other formats by previous versions
+            for cover_file in self.validate_path(cover_path).glob(f"{size.value}.*"):
+                if cover_file.name != filename:
+                    cover_file.unlink()
+
+    async def _store_cover(self, entity: Rom | Collection, url_cover: str) -> None:
+        """Store the renditions of a cover in filesystem
 
         Args:
-            fs_slug: short name of the platform
-            rom_name: name of rom file
+            entity: Rom or Collection object
             url_cover: url to get the cover
-            size: size of the cover
         """
-        cover_file = f"{entity.fs_resources_path}/cover"
-        await self.make_directory(f"{cover_file}")
-
-        httpx_client = ctx_httpx_client.get()
-        try:
-            async with httpx_client.stream("GET", url_cover, timeout=120) as response:
-                if response.status_code == status.HTTP_200_OK:
-                    async with await self.write_file_streamed(
-                        path=cover_file, filename=f"{size.value}.png"
-                    ) as f:
-                        async for chunk in response.aiter_raw():
-                            await f.write(chunk)
-        except httpx.TransportError as exc:
-            log.error(f"Unable to fetch cover at {url_cover}: {str(exc)}")
+        blob_path = await self.fetch_blob(url_cover)
+        if not blob_path:
             return None
 
-        if size == CoverSize.SMALL:
-            try:
-                image_path = self.validate_path(f"{cover_file}/{size.value}.png")
-                with Image.open(image_path) as img:
-                    self.resize_cover_to_small(img, save_path=str(image_path))
-            except UnidentifiedImageError as exc:
-                log.error(f"Unable to identify image {cover_file}: {str(exc)}")
-                return None
+        rendition_paths = await self._render_cover(blob_path)
+        if rendition_paths:
+            await self._link_cover(entity, rendition_paths)
 
     def _get_cover_path(self, entity: Rom | Collection, size: CoverSize) -> str | None:
         """Returns rom cover filesystem path adapted to frontend folder structure
@@ -106,9 +374,12 @@ class FSResourcesHandler(FSHandler):
             return None, None
 
         small_cover_exists = self.cover_exists(entity, CoverSize.SMALL)
-        if url_cover and (overwrite or not small_cover_exists):
-            await self._store_cover(entity, url_cover, CoverSize.SMALL)
+        big_cover_exists = self.cover_exists(entity, CoverSize.BIG)
+
+        if url_cover and (overwrite or not small_cover_exists or not big_cover_exists):
+            await self._store_cover(entity, url_cover)
             small_cover_exists = self.cover_exists(entity, CoverSize.SMALL)
+            big_cover_exists = self.cover_exists(entity, CoverSize.BIG)
 
         path_cover_s = (
             self._get_cover_path(entity, CoverSize.SMALL)
@@ -116,17 +387,26 @@ class FSResourcesHandler(FSHandler):
             else None
         )
 
-        big_cover_exists = self.cover_exists(entity, CoverSize.BIG)
-        if url_cover and (overwrite or not big_cover_exists):
-            await self._store_cover(entity, url_cover, CoverSize.BIG)
-            big_cover_exists = self.cover_exists(entity, CoverSize.BIG)
-
         path_cover_l = (
             self._get_cover_path(entity, CoverSize.BIG) if big_cover_exists else None
         )
 
         return path_cover_s, path_cover_l
 
+    async def get_cover_placeholder(self, entity: Rom | Collection) -> str | None:
+        """Get a tiny inline image of the cover, as a data URI."""
+        thumb_path = self._get_cover_path(entity, CoverSize.THUMB)
+        if not thumb_path:
+            return None
+
+        try:
+            return await run_image_task(
+                render_placeholder, str(self.validate_path(thumb_path))
+            )
+        except (UnidentifiedImageError, OSError) as exc:
+            log.error(f"Unable to render placeholder of {thumb_path}: {str(exc)}")
+            return None
+
     async def remove_cover(self, entity: Rom | Collection | None):
         if not entity:
             return {"path_cover_s": "", "path_cover_l": ""}
@@ -135,39 +415,18 @@ class FSResourcesHandler(FSHandler):
 
         return {"path_cover_s": "", "path_cover_l": ""}
 
-    async def _build_artwork_path(
-        self, entity: Rom | Collection, file_ext: str
-    ) -> tuple[Path, Path]:
-        path_cover = f"{entity.fs_resources_path}/cover"
-        path_cover_l = self.validate_path(
-            f"{path_cover}/{CoverSize.BIG.value}.{file_ext}"
-        )
-        path_cover_s = self.validate_path(
-            f"{path_cover}/{CoverSize.SMALL.value}.{file_ext}"
-        )
-
-        await self.make_directory(path_cover)
-
-        return path_cover_l, path_cover_s
-
     async def store_artwork(
-        self, entity: Rom | Collection, artwork: BytesIO, file_ext: str
+        self, entity: Rom | Collection, artwork: BytesIO
     ) -> tuple[str | None, str | None]:
         """Store artwork in filesystem and return paths."""
-        path_cover_l, path_cover_s = await self._build_artwork_path(entity, file_ext)
-
-        try:
-            with Image.open(artwork) as img:
-                img.save(path_cover_l)
-                self.resize_cover_to_small(img, save_path=str(path_cover_s))
-        except UnidentifiedImageError as exc:
-            log.error(
-                f"Unable to identify image for {entity.fs_resources_path}: {str(exc)}"
-            )
+        blob_path = await self.write_blob(artwork.getvalue())
+        rendition_paths = await self._render_cover(blob_path)
+        if not rendition_paths:
             return None, None
 
-        return str(path_cover_l.relative_to(self.base_path)), str(
-            path_cover_s.relative_to(self.base_path)
+        await self._link_cover(entity, rendition_paths)
+        return self._get_cover_path(entity, CoverSize.BIG), self._get_cover_path(
+            entity, CoverSize.SMALL
         )
 
     async def _store_screenshot(self, rom: Rom, url_screenhot: str, idx: int):
@@ -178,21 +437,7 @@ class FSResourcesHandler(FSHandler):
             url_screenhot: URL to get the screenshot
         """
         screenshot_path = f"{rom.fs_resources_path}/screenshots"
-
-        httpx_client = ctx_httpx_client.get()
-        try:
-            async with httpx_client.stream(
-                "GET", url_screenhot, timeout=120
-            ) as response:
-                if response.status_code == status.HTTP_200_OK:
-                    async with await self.write_file_streamed(
-                        path=screenshot_path, filename=f"{idx}.jpg"
-                    ) as f:
-                        async for chunk in response.aiter_raw():
-                            await f.write(chunk)
-        except httpx.TransportError as exc:
-            log.error(f"Unable to fetch screenshot at {url_screenhot}: {str(exc)}")
-            return None
+        await self._store_blob(url_screenhot, screenshot_path, f"{idx}.jpg")
 
     def _get_screenshot_path(self, rom: Rom, idx: str):
         """Returns rom cover filesystem path adapted to frontend folder structure
@@ -209,12 +454,17 @@ class FSResourcesHandler(FSHandler):
         if not rom or not url_screenshots:
             return []
 
-        path_screenshots: list[str] = []
-        for idx, url_screenhot in enumerate(url_screenshots):
-            await self._store_screenshot(rom, url_screenhot, idx)
-            path_screenshots.append(self._get_screenshot_path(rom, str(idx)))
+        await asyncio.gather(
+            *(
+                self._store_screenshot(rom, url_screenhot, idx)
+                for idx, url_screenhot in enumerate(url_screenshots)
+            )
+        )
 
-        return path_screenshots
+        return [
+            self._get_screenshot_path(rom, str(idx))
+            for idx in range(len(url_screenshots))
+        ]
 
     def manual_exists(self, rom: Rom) -> bool:
         """Check if rom manual exists in filesystem
@@ -231,19 +481,7 @@ class FSResourcesHandler(FSHandler):
 
     async def _store_manual(self, rom: Rom, url_manual: str):
         manual_path = f"{rom.fs_resources_path}/manual"
-
-        httpx_client = ctx_httpx_client.get()
-        try:
-            async with httpx_client.stream("GET", url_manual, timeout=120) as response:
-                if response.status_code == status.HTTP_200_OK:
-                    async with await self.write_file_streamed(
-                        path=manual_path, filename=f"{rom.id}.pdf"
-                    ) as f:
-                        async for chunk in response.aiter_raw():
-                            await f.write(chunk)
-        except httpx.TransportError as exc:
-            log.error(f"Unable to fetch manual at {url_manual}: {str(exc)}")
-            return None
+        await self._store_blob(url_manual, manual_path, f"{rom.id}.pdf")
 
     def _get_manual_path(self, rom: Rom) -> str | None:
         """Returns rom manual filesystem path adapted to frontend folder structure
@@ -272,23 +510,17 @@ class FSResourcesHandler(FSHandler):
         return path_manual
 
     async def store_ra_badge(self, url: str, path: str) -> None:
-        httpx_client = ctx_httpx_client.get()
         directory, filename = os.path.split(path)
 
         if await self.file_exists(path):
             log.debug(f"Badge {path} already exists, skipping download")
             return
 
-        try:
-            async with httpx_client.stream("GET", url, timeout=120) as response:
-                if response.status_code == status.HTTP_200_OK:
-                    async with await self.write_file_streamed(
-                        path=directory, filename=filename
-                    ) as f:
-                        async for chunk in response.aiter_raw():
-                            await f.write(chunk)
-        except httpx.TransportError as exc:
-            log.error(f"Unable to fetch cover at {url}: {str(exc)}")
+        await self._store_blob(url, directory, filename)
+
+    async def store_ra_badges(self, badges: list[tuple[str, str]]) -> None:
+        """Store the (url, path) achievement badges that aren't stored yet, concurrently."""
+        await asyncio.gather(*(self.store_ra_badge(url, path) for url, path in badges))
 
     def get_ra_resources_path(self, platform_id: int, rom_id: int) -> str:
         return os.path.join(
@@ -303,3 +535,211 @@ class FSResourcesHandler(FSHandler):
 
     async def create_ra_resources_path(self, platform_id: int, rom_id: int) -> None:
         await self.make_directory(self.get_ra_resources_path(platform_id, rom_id))
+
+    async def _evict_resized_images(self) -> None:
+        # Only one process evicts at a time, the others keep adding images
+        if not await async_cache.set(
+            RESIZED_IMAGES_EVICTION_LOCK_KEY, 1, nx=True, ex=5 * 60
+        ):
+            return
+
+        try:
+            total_size = await asyncio.to_thread(
+                evict_lru_files,
+                str(self.validate_path(RESIZED_IMAGES_PATH)),
+                int(RESIZED_IMAGES_MAX_SIZE * RESIZED_IMAGES_EVICTION_RATIO),
+            )
+            await async_cache.set(RESIZED_IMAGES_SIZE_KEY, total_size)
+        finally:
+            await async_cache.delete(RESIZED_IMAGES_EVICTION_LOCK_KEY)
+
+    async def _add_resized_images_size(self, size: int) -> None:
+        total_size = await async_cache.incrby(RESIZED_IMAGES_SIZE_KEY, size)
+        if total_size > RESIZED_IMAGES_MAX_SIZE:
+            await self._evict_resized_images()
+
+    async def get_resized_image(
+        self, path: str, width: int, image_format: ImageFormat
+    ) -> str:
+        """Get an image of the resources scaled down to a width, resizing it if needed.
+
+        Resized images are cached on disk, and the least recently used ones are
+        evicted when the cache exceeds RESIZED_IMAGES_CACHE_SIZE_MB.
+
+        Args:
+            path: Relative path of the image
+            width: Requested width, rounded up to one of RESIZED_IMAGE_WIDTHS
+            image_format: Format of the resized image
+        Returns
+            Relative path of the resized image
+
+        Raises:
+            FileNotFoundError: If the image does not exist
+            ValueError: If the path is invalid
+        """
+        source_file = self.validate_path(path)
+        if Path(path).parts[:2] == Path(RESIZED_IMAGES_PATH).parts:
+            raise ValueError("Resized images can't be resized again")
+        if not source_file.is_file():
+            raise FileNotFoundError(f"File not found: {source_file}")
+
+        width = next(
+            (w for w in RESIZED_IMAGE_WIDTHS if w >= width), RESIZED_IMAGE_WIDTHS[-1]
+        )
+
+        # Keyed by inode rather than path, so that the linked blobs of different
+        # roms share their resized images, and by mtime to drop replaced images
+        stat = source_file.stat()
+        key = hashlib.sha256(
+            f"{stat.st_dev}:{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+        ).hexdigest()
+        resized_path = os.path.join(
+            RESIZED_IMAGES_PATH, key[:2], f"{key}_{width}.{image_format}"
+        )
+        resized_file = self.validate_path(resized_path)
+
+        lock = await self._get_file_lock(f"render:{resized_path}")
+        async with lock:
+            if resized_file.is_file():
+                # Mark as recently used for the eviction
+                os.utime(resized_file)
+                return resized_path
+
+            resized_file.parent.mkdir(parents=True, exist_ok=True)
+            await run_image_task(
+                render_resized_image,
+                str(source_file),
+                str(resized_file),
+                width,
+                image_format,
+            )
+
+        await self._add_resized_images_size(resized_file.stat().st_size)
+        return resized_path
+
+    def _find_sprite_covers(
+        self, roms: Sequence[Rom], sizes: Sequence[CoverSize], width: int
+    ) -> tuple[dict[int, Path], str]:
+        """Find the cover files of a sprite sheet, and the key they are cached under.
+
+        Args:
+            roms: Roms of the sprite sheet, in order
+            sizes: Cover renditions to render from, by order of preference
+            width: Max width of the covers in the sprite sheet
+        Returns
+            Cover file of each rom with a cover by rom id, and the cache key
+        """
+        covers: dict[int, Path] = {}
+        for rom in roms[:COVER_SPRITE_MAX_COVERS]:
+            if not rom.path_cover_s or rom.id in covers:
+                continue
+
+            for size in sizes:
+                # Older covers don't have a thumbnail rendition
+                cover_path = self._get_cover_path(rom, size)
+                if cover_path:
+                    covers[rom.id] = self.validate_path(cover_path)
+                    break
+
+        signatures = [str(width)]
+        for rom_id, cover_file in covers.items():
+            stat = cover_file.stat()
+            signatures.append(
+                f"{rom_id}:{stat.st_dev}:{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
+            )
+        return covers, hashlib.sha256("\n".join(signatures).encode()).hexdigest()
+
+    async def get_cover_sprite(
+        self, roms: Sequence[Rom], width: int
+    ) -> CoverSprite | None:
+        """Get a sprite sheet of the covers of roms, rendering it if needed.
+
+        Sprite sheets are cached with the resized images. They are keyed by the
+        tile width and the cover files, so that a changed cover renders a new
+        sprite sheet.
+
+        Args:
+            roms: Roms of the sprite sheet, in order
+            width: Max width of the covers in the sprite sheet, one of
+                COVER_SPRITE_WIDTHS
+        Returns
+            Relative path and size of the sprite sheet, and the tile of each rom
+            cover by rom id, or None if none of the roms has a cover
+        """
+        if width not in COVER_SPRITE_WIDTHS:
+            raise ValueError(f"Unsupported sprite width: {width}")
+
+        tile_size = (width, width * 2)
+        # Render from the smallest rendition that is high enough for the tiles
+        sizes = (
+            (CoverSize.THUMB, CoverSize.SMALL)
+            if tile_size[1] <= COVER_RENDITION_HEIGHTS[CoverSize.THUMB]
+            else (CoverSize.SMALL, CoverSize.THUMB)
+        )
+
+        # Globbing and stating hundreds of covers would block the event loop
+        covers, key = await asyncio.to_thread(
+            self._find_sprite_covers, roms, sizes, width
+        )
+        if not covers:
+            return None
+
+        sprite_path = os.path.join(
+            RESIZED_IMAGES_PATH,
+            key[:2],
+            f"sprite.{key[:CONTENT_HASH_LENGTH]}.{RENDITION_FORMAT}",
+        )
+        sprite_file = self.validate_path(sprite_path)
+        # The tiles are written after the sprite sheet, and flag it as complete
+        tiles_file = sprite_file.with_suffix(".json")
+
+        lock = await self._get_file_lock(f"render:{sprite_path}")
+        async with lock:
+            if sprite_file.is_file() and tiles_file.is_file():
+                # Mark as recently used for the eviction
+                os.utime(sprite_file)
+                os.utime(tiles_file)
+                async with await open_file(tiles_file, "r") as f:
+                    cached = json.loads(await f.read())
+                return CoverSprite(
+                    path=sprite_path,
+                    width=cached["width"],
+                    height=cached["height"],
+                    tiles={
+                        int(rom_id): tile for rom_id, tile in cached["tiles"].items()
+                    },
+                )
+
+            sprite_file.parent.mkdir(parents=True, exist_ok=True)
+            (sprite_width, sprite_height), boxes = await run_image_task(
+                render_sprite,
+                [str(cover_file) for cover_file in covers.values()],
+                str(sprite_file),
+                tile_size,
+            )
+            tiles: dict[int, CoverSpriteTile] = {}
+            for rom_id, box in zip(covers, boxes, strict=True):
+                if box:
+                    x, y, tile_width, tile_height = box
+                    tiles[rom_id] = CoverSpriteTile(
+                        x=x, y=y, width=tile_width, height=tile_height
+                    )
+            if not tiles:
+                return None
+
+            sprite = CoverSprite(
+                path=sprite_path, width=sprite_width, height=sprite_height, tiles=tiles
+            )
+            tmp_path = tiles_file.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            async with await open_file(tmp_path, "w") as f:
+                await f.write(
+                    json.dumps(
+                        {"width": sprite_width, "height": sprite_height, "tiles": tiles}
+                    )
+                )
+            os.replace(tmp_path, tiles_file)
+
+        await self._add_resized_images_size(
+            sprite_file.stat().st_size + tiles_file.stat().st_size
+        )
+        return sprite
@@ -1,21 +1,32 @@
+import asyncio
 import enum
 import json
 import re
 import unicodedata
+from collections.abc import Awaitable, Callable, Collection, Sequence
 from functools import lru_cache
 from pathlib import Path
-from typing import Final, NotRequired, TypedDict
+from typing import Final, NotRequired, TypedDict, TypeVar
 
+from config import (
+    METADATA_MATCH_CANDIDATES_CACHE_SIZE,
+    METADATA_NORMALIZE_CACHE_SIZE,
+    METADATA_SPECULATIVE_SEARCH,
+)
 from handler.redis_handler import async_cache
 from logger.logger import log
-from strsimpy.jaro_winkler import JaroWinkler
+from rapidfuzz import process
+from rapidfuzz.distance import JaroWinkler
 from tasks.scheduled.update_switch_titledb import (
     SWITCH_PRODUCT_ID_KEY,
     SWITCH_TITLEDB_INDEX_KEY,
     update_switch_titledb_task,
 )
+from utils.cache import FixtureIndexCache
+
+T = TypeVar("T")
 
-jarowinkler = JaroWinkler()
+PERFECT_MATCH_SCORE: Final = 1.0
 
 
 METADATA_FIXTURES_DIR: Final = Path(__file__).parent / "fixtures"
@@ -44,6 +55,9 @@ COMMA_ARTICLE_PATTERN = re.compile(r",\s(a|an|the)\b$")
 NON_WORD_SPACE_PATTERN = re.compile(r"[^\w\s]")
 MULTIPLE_SPACE_PATTERN = re.compile(r"\s+")
 
+# Local copy of the fixture indexes above, invalidated when they are rewritten
+fixture_index_cache = FixtureIndexCache(async_cache)
+
 
 class BaseRom(TypedDict):
     name: NotRequired[str]
@@ -54,7 +68,7 @@ class BaseRom(TypedDict):
 
 
 # This caches results to avoid repeated normalization of the same search term
-@lru_cache(maxsize=1024)
+@lru_cache(maxsize=METADATA_NORMALIZE_CACHE_SIZE)
 def _normalize_search_term(
     name: str, remove_articles: bool = True, remove_punctuation: bool = True
 ) -> str:
@@ -79,6 +93,42 @@ def _normalize_search_term(
     return name.strip()
 
 
+# Provider result sets are often the same for several files (e.g. multi-disc games)
+@lru_cache(maxsize=METADATA_MATCH_CANDIDATES_CACHE_SIZE)
+def _normalize_candidates(
+    game_names: tuple[str, ...], split_game_name: bool = False
+) -> tuple[str, ...]:
+    split_pattern = MetadataHandler.SEARCH_TERM_SPLIT_PATTERN
+    return tuple(
+        _normalize_search_term(
+            split_pattern.split(game_name)[-1]
+            if split_game_name and split_pattern.search(game_name)
+            else game_name
+        )
+        for game_name in game_names
+    )
+
+
+def _extract_best_candidate(
+    search_term: str, candidates: tuple[str, ...], min_similarity_score: float
+) -> tuple[int | None, float]:
+    """Return the index and score of the first best scoring candidate.
+
+    The whole candidate set is scored in a single native call.
+    """
+    result = process.extractOne(
+        search_term,
+        candidates,
+        scorer=JaroWinkler.normalized_similarity,
+        score_cutoff=min_similarity_score,
+    )
+    if result is None or result[1] <= 0.0:
+        return None, 0.0
+
+    _, best_score, best_index = result
+    return best_index, best_score
+
+
 class MetadataHandler:
     SEARCH_TERM_SPLIT_PATTERN = re.compile(r"[\:\-\/]")
     SEARCH_TERM_NORMALIZER = re.compile(r"\s*[:-]\s*")
@@ -112,36 +162,78 @@ class MetadataHandler:
         if not game_names:
             return None, 0.0
 
-        best_match = None
-        best_score = 0.0
-        search_term_normalized = self.normalize_search_term(search_term)
+        game_names_tuple = tuple(game_names)
+        best_index, best_score = _extract_best_candidate(
+            self.normalize_search_term(search_term),
+            _normalize_candidates(game_names_tuple, split_game_name),
+            min_similarity_score,
+        )
+        if best_index is None:
+            return None, 0.0
 
-        for game_name in game_names:
-            game_name_normalized = self.normalize_search_term(game_name)
+        return game_names_tuple[best_index], best_score
 
-            # If the game name is split, normalize the last term
-            if split_game_name and re.search(self.SEARCH_TERM_SPLIT_PATTERN, game_name):
-                game_name_normalized = self.normalize_search_term(
-                    re.split(self.SEARCH_TERM_SPLIT_PATTERN, game_name)[-1]
-                )
+    async def search_variants(
+        self,
+        search: Callable[[str, bool], Awaitable[tuple[T | None, float]]],
+        variants: Sequence[tuple[str, bool]],
+    ) -> T | None:
+        """
+        Search for a game with several variants of its name, returning the best match.
+
+        Variants are searched one after another until one matches, unless speculative
+        search is enabled: then they are all searched concurrently, the best scoring
+        match wins, and pending searches are cancelled once a perfect match is found.
 
-            score = jarowinkler.similarity(search_term_normalized, game_name_normalized)
-            if score > best_score:
-                best_score = score
-                best_match = game_name
+        Args:
+            search: Coroutine function returning the (match, score) of a (search term, split game name) variant
+            variants: The (search term, split game name) variants, by order of preference
 
-                # Early exit for perfect match
-                if score == 1.0:
+        Returns:
+            The best match, or None if no variant matched
+        """
+        if not METADATA_SPECULATIVE_SEARCH or len(variants) < 2:
+            for search_term, split_game_name in variants:
+                match, _ = await search(search_term, split_game_name)
+                if match:
+                    return match
+            return None
+
+        tasks = [
+            asyncio.create_task(search(search_term, split_game_name))
+            for search_term, split_game_name in variants
+        ]
+        pending: set[asyncio.Task[tuple[T | None, float]]] = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if any(
+                    task.result()[0] and task.result()[1] >= PERFECT_MATCH_SCORE
+                    for task in done
+                ):
                     break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-        if best_score >= min_similarity_score:
-            return best_match, best_score
+        # On equal scores, the earlier variant wins
+        best_match: T | None = None
+        best_score = 0.0
+        for task in tasks:
+            if task.cancelled():
+                continue
+            match, score = task.result()
+            if match and score > best_score:
+                best_match, best_score = match, score
 
-        return None, 0.0
+        return best_match
 
     async def _ps2_opl_format(self, match: re.Match[str], search_term: str) -> str:
         serial_code = match.group(1)
-        index_entry = await async_cache.hget(PS2_OPL_KEY, serial_code)
+        index_entry = await fixture_index_cache.hget(PS2_OPL_KEY, serial_code)
         if index_entry:
             index_entry = json.loads(index_entry)
             search_term = index_entry["Name"]  # type: ignore
@@ -149,7 +241,7 @@ class MetadataHandler:
         return search_term
 
     async def _sony_serial_format(self, index_key: str, serial_code: str) -> str | None:
-        index_entry = await async_cache.hget(index_key, serial_code)
+        index_entry = await fixture_index_cache.hget(index_key, serial_code)
         if index_entry:
             index_entry = json.loads(index_entry)
             return index_entry["title"]
@@ -182,15 +274,15 @@ class MetadataHandler:
     ) -> tuple[str, dict | None]:
         title_id = match.group(1)
 
-        if not (await async_cache.exists(SWITCH_TITLEDB_INDEX_KEY)):
+        if not (await fixture_index_cache.exists(SWITCH_TITLEDB_INDEX_KEY)):
             log.warning("Fetching the Switch titleID index file...")
             await update_switch_titledb_task.run(force=True)
 
-            if not (await async_cache.exists(SWITCH_TITLEDB_INDEX_KEY)):
+            if not (await fixture_index_cache.exists(SWITCH_TITLEDB_INDEX_KEY)):
                 log.error("Could not fetch the Switch titleID index file")
                 return search_term, None
 
-        index_entry = await async_cache.hget(SWITCH_TITLEDB_INDEX_KEY, title_id)
+        index_entry = await fixture_index_cache.hget(SWITCH_TITLEDB_INDEX_KEY, title_id)
         if index_entry:
             index_entry = json.loads(index_entry)
             return index_entry["name"], index_entry
@@ -207,15 +299,21 @@ class MetadataHandler:
         product_id[-3] = "0"
         product_id = "".join(product_id)
 
-        if not (await async_cache.exists(SWITCH_PRODUCT_ID_KEY)):
+        if not (await fixture_index_cache.exists(SWITCH_PRODUCT_ID_KEY)):
             log.warning("Fetching the Switch productID index file...")
             await update_switch_titledb_task.run(force=True)
 
-            if not (await async_cache.exists(SWITCH_PRODUCT_ID_KEY)):
+            if not (await fixture_index_cache.exists(SWITCH_PRODUCT_ID_KEY)):
                 log.error("Could not fetch the Switch productID index file")
                 return search_term, None
 
-        index_entry = await async_cache.hget(SWITCH_PRODUCT_ID_KEY, product_id)
+        titledb_key = await fixture_index_cache.hget(SWITCH_PRODUCT_ID_KEY, product_id)
+        if not titledb_key:
+            return search_term, None
+
+        index_entry = await fixture_index_cache.hget(
+            SWITCH_TITLEDB_INDEX_KEY, titledb_key
+        )
         if index_entry:
             index_entry = json.loads(index_entry)
             return index_entry["name"], index_entry
@@ -225,7 +323,7 @@ class MetadataHandler:
     async def _mame_format(self, search_term: str) -> str:
         from handler.filesystem import fs_rom_handler
 
-        index_entry = await async_cache.hget(MAME_XML_KEY, search_term)
+        index_entry = await fixture_index_cache.hget(MAME_XML_KEY, search_term)
         if index_entry:
             index_entry = json.loads(index_entry)
             search_term = fs_rom_handler.get_file_name_with_no_tags(
@@ -234,6 +332,56 @@ class MetadataHandler:
 
         return search_term
 
+    async def prefetch_fixture_indexes(
+        self, platform_slug: str, fs_names: Collection[str]
+    ) -> None:
+        """Load the fixture index entries a batch of files will look up, in bulk."""
+        from handler.filesystem import fs_rom_handler
+
+        if platform_slug == UniversalPlatformSlug.PS2:
+            await fixture_index_cache.prefetch(
+                PS2_OPL_KEY,
+                (m.group(1) for name in fs_names if (m := PS2_OPL_REGEX.match(name))),
+            )
+
+        sony_index_key = SONY_SERIAL_INDEX_KEYS.get(platform_slug)
+        if sony_index_key:
+            await fixture_index_cache.prefetch(
+                sony_index_key,
+                (
+                    m.group(1)
+                    for name in fs_names
+                    if (m := SONY_SERIAL_REGEX.search(name, re.IGNORECASE))
+                ),
+            )
+
+        if platform_slug == UniversalPlatformSlug.SWITCH:
+            title_ids = [
+                m.group(1)
+                for name in fs_names
+                if (m := SWITCH_TITLEDB_REGEX.search(name))
+            ]
+            product_ids = [
+                f"{m.group(1)[:-3]}0{m.group(1)[-2:]}"
+                for name in fs_names
+                if (m := SWITCH_PRODUCT_ID_REGEX.search(name))
+            ]
+            await fixture_index_cache.prefetch(SWITCH_PRODUCT_ID_KEY, product_ids)
+
+            for product_id in product_ids:
+                titledb_key = await fixture_index_cache.hget(
+                    SWITCH_PRODUCT_ID_KEY, product_id
+                )
+                if titledb_key:
+                    title_ids.append(titledb_key)
+            await fixture_index_cache.prefetch(SWITCH_TITLEDB_INDEX_KEY, title_ids)
+
+        if platform_slug in MAME_PLATFORM_SLUGS:
+            await fixture_index_cache.prefetch(
+                MAME_XML_KEY,
+                (fs_rom_handler.get_file_name_with_no_tags(name) for name in fs_names),
+            )
+
     def _mask_sensitive_values(self, values: dict[str, str]) -> dict[str, str]:
         """
         Mask sensitive values (headers or params), leaving only the first 3 and last 3 characters of the token.
@@ -739,3 +887,18 @@ class UniversalPlatformSlug(enum.StrEnum):
     ZX80 = "zx80"
     ZX81 = "zx81"
     ZXS = "zxs"
+
+
+# Platforms whose files are looked up in the fixture indexes
+SONY_SERIAL_INDEX_KEYS: Final = {
+    UniversalPlatformSlug.PSX: PS1_SERIAL_INDEX_KEY,
+    UniversalPlatformSlug.PS2: PS2_SERIAL_INDEX_KEY,
+    UniversalPlatformSlug.PSP: PSP_SERIAL_INDEX_KEY,
+}
+MAME_PLATFORM_SLUGS: Final = frozenset(
+    {
+        UniversalPlatformSlug.ARCADE,
+        UniversalPlatformSlug.NEOGEOAES,
+        UniversalPlatformSlug.NEOGEOMVS,
+    }
+)
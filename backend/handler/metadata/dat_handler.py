@@ -0,0 +1,68 @@
+import json
+from typing import NotRequired, TypedDict
+
+from handler.redis_handler import async_cache
+from models.rom import RomFile
+from tasks.manual.import_dat_files import DAT_HASH_INDEX_KEY, get_dat_hash_field
+from utils.instrumentation import instrument_provider
+
+from .hasheous_handler import HasheousMetadata
+
+
+class DatRomMatch(TypedDict):
+    name: str | None
+    dat_set: NotRequired[str]
+    hasheous_metadata: NotRequired[HasheousMetadata]
+
+
+class DatHandler:
+    """
+    Handler for the local index of user-supplied DAT files (No-Intro, Redump, TOSEC, MAME),
+    built by the import DAT files task.
+    """
+
+    @instrument_provider("dat")
+    async def lookup_rom(self, files: list[RomFile]) -> DatRomMatch:
+        """
+        Match the hashes of the ROM files against the DAT files index.
+
+        :param files: The files of the ROM.
+        :return: A DatRomMatch with the name of the first matched game and the
+            match flags of every DAT file any of the ROM files was found in.
+        """
+        fields = [
+            get_dat_hash_field(hash_type, hash_value)
+            for file in files
+            for hash_type, hash_value in (
+                ("crc", file.crc_hash),
+                ("md5", file.md5_hash),
+                ("sha1", file.sha1_hash),
+            )
+            if hash_value
+        ]
+        if not fields:
+            return DatRomMatch(name=None)
+
+        entries = [
+            json.loads(entry)
+            for entry in await async_cache.hmget(DAT_HASH_INDEX_KEY, fields)
+            if entry
+        ]
+        if not entries:
+            return DatRomMatch(name=None)
+
+        sources = {entry["source"] for entry in entries}
+        return DatRomMatch(
+            name=entries[0]["name"],
+            dat_set=entries[0]["set"],
+            hasheous_metadata=HasheousMetadata(
+                tosec_match="tosec" in sources,
+                mame_arcade_match="mame_arcade" in sources,
+                mame_mess_match="mame_mess" in sources,
+                nointro_match="nointro" in sources,
+                redump_match="redump" in sources,
+                whdload_match="whdload" in sources,
+                ra_match=False,
+                fbneo_match="fbneo" in sources,
+            ),
+        )
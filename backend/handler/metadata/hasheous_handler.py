@@ -6,10 +6,15 @@ import httpx
 import pydash
 from config import DEV_MODE, HASHEOUS_API_ENABLED
 from fastapi import HTTPException, status
+from handler.redis_handler import async_cache
 from logger.logger import log
 from models.rom import RomFile
 from utils import get_version
-from utils.context import ctx_httpx_client
+from utils.cache import LookupCache
+from utils.circuit_breaker import CircuitBreaker
+from utils.context import get_httpx_client
+from utils.http_transport import HTTPPool
+from utils.instrumentation import instrument_provider, mark_status
 
 from .base_hander import BaseRom, MetadataHandler
 from .base_hander import UniversalPlatformSlug as UPS
@@ -117,26 +122,40 @@ class HasheousHandler(MetadataHandler):
         self.proxy_igdb_game_endpoint = f"{self.BASE_URL}/MetadataProxy/IGDB/Game"
         self.proxy_igdb_cover_endpoint = f"{self.BASE_URL}/MetadataProxy/IGDB/Cover"
         self.proxy_ra_game_endpoint = f"{self.BASE_URL}/MetadataProxy/RA/Game"
+        self.circuit_breaker = CircuitBreaker("Hasheous")
+        self.lookup_cache = LookupCache(async_cache, "hasheous")
         self.app_api_key = (
             "UUvh9ef_CddMM4xXO1iqxl9FqEt764v33LU-UiGFc0P34odXjMP9M6MTeE4JZRxZ"
             if DEV_MODE
             else "JNoFBA-jEh4HbxuxEHM6MVzydKoAXs9eCcp2dvcg5LRCnpp312voiWmjuaIssSzS"
         )
 
+    @instrument_provider("hasheous")
     async def _request(
         self,
         url: str,
         method: str = "POST",
         params: dict | None = None,
         data: dict | None = None,
+        cache_key: str | None = None,
     ) -> dict:
-        httpx_client = ctx_httpx_client.get()
+        httpx_client = get_httpx_client(HTTPPool.HASHEOUS)
 
         # Normalize method to uppercase
         method = method.upper()
         if method not in ["GET", "POST"]:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
+        # Responses, including not found ones, are cached when a key is given
+        if cache_key:
+            cached_response = await self.lookup_cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+
+        if not await self.circuit_breaker.allow_request():
+            mark_status("circuit_open")
+            return {}
+
         try:
             log.debug(
                 "API request: Method=%s, URL=%s, Params=%s, Data=%s",
@@ -164,13 +183,19 @@ class HasheousHandler(MetadataHandler):
 
             # Make the request
             res = await httpx_client.request(method, **request_kwargs)
+            await self.circuit_breaker.record_success()
 
             res.raise_for_status()
-            return res.json()
+            response = res.json()
+            if cache_key:
+                await self.lookup_cache.set(cache_key, response)
+            return response
         except httpx.HTTPStatusError as exc:
             # Check if its a 404 error
             if exc.response.status_code == status.HTTP_404_NOT_FOUND:
                 log.debug("Game not found in Hasheous API")
+                if cache_key:
+                    await self.lookup_cache.set(cache_key, {})
                 return {}
 
             log.error(
@@ -178,8 +203,9 @@ class HasheousHandler(MetadataHandler):
                 exc.response.status_code,
                 exc.response.text,
             )
-            pass
+            mark_status("http_error")
         except httpx.NetworkError as exc:
+            await self.circuit_breaker.record_failure()
             log.critical("Connection error: can't connect to Hasheous")
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -188,9 +214,11 @@ class HasheousHandler(MetadataHandler):
         except json.decoder.JSONDecodeError as exc:
             # Log the error and return an empty dict if the response is not valid JSON
             log.error(exc)
+            mark_status("invalid_response")
             return {}
         except httpx.TimeoutException:
-            pass
+            await self.circuit_breaker.record_failure()
+            mark_status("timeout")
 
         return {}
 
@@ -208,6 +236,7 @@ class HasheousHandler(MetadataHandler):
             ra_id=platform["ra_id"],
         )
 
+    @instrument_provider("hasheous")
     async def lookup_rom(self, platform_slug: str, files: list[RomFile]) -> HasheousRom:
         fallback_rom = HasheousRom(
             hasheous_id=None, igdb_id=None, tgdb_id=None, ra_id=None
@@ -260,6 +289,7 @@ class HasheousHandler(MetadataHandler):
                 "returnFields": "Signatures, Metadata, Attributes",
             },
             data=data,
+            cache_key=f"lookup:{md5_hash or ''}:{sha1_hash or ''}:{crc_hash or ''}".lower(),
         )
 
         if not hasheous_game:
@@ -313,6 +343,7 @@ class HasheousHandler(MetadataHandler):
             ),
         )
 
+    @instrument_provider("hasheous")
     async def get_igdb_game(self, hasheous_rom: HasheousRom) -> HasheousRom:
         if not HASHEOUS_API_ENABLED:
             return hasheous_rom
@@ -330,6 +361,7 @@ class HasheousHandler(MetadataHandler):
                 "expandColumns": "age_ratings, alternative_names, collections, cover, dlcs, expanded_games, franchise, franchises, game_modes, genres, involved_companies, platforms, ports, remakes, screenshots, similar_games, videos",
             },
             method="GET",
+            cache_key=f"igdb_game:{igdb_id}",
         )
 
         if not igdb_game:
@@ -357,6 +389,7 @@ class HasheousHandler(MetadataHandler):
             }
         )
 
+    @instrument_provider("hasheous")
     async def get_ra_game(self, hasheous_rom: HasheousRom) -> HasheousRom:
         if not HASHEOUS_API_ENABLED:
             return hasheous_rom
@@ -371,6 +404,7 @@ class HasheousHandler(MetadataHandler):
             self.proxy_ra_game_endpoint,
             params={"Id": ra_id},
             method="GET",
+            cache_key=f"ra_game:{ra_id}",
         )
 
         if not ra_game:
@@ -11,7 +11,10 @@ from fastapi import HTTPException, status
 from handler.redis_handler import async_cache
 from logger.logger import log
 from unidecode import unidecode as uc
-from utils.context import ctx_httpx_client
+from utils.circuit_breaker import CircuitBreaker
+from utils.context import get_httpx_client
+from utils.http_transport import HTTPPool
+from utils.instrumentation import instrument_provider, mark_status
 
 from .base_hander import (
     PS2_OPL_REGEX,
@@ -219,6 +222,7 @@ class IGDBHandler(MetadataHandler):
         self.search_fields = SEARCH_FIELDS
         self.pagination_limit = 200
         self.twitch_auth = TwitchAuth()
+        self.circuit_breaker = CircuitBreaker("IGDB")
         self.headers = {
             "Client-ID": IGDB_CLIENT_ID,
             "Accept": "application/json",
@@ -234,10 +238,15 @@ class IGDBHandler(MetadataHandler):
 
         return wrapper
 
+    @instrument_provider("igdb")
     async def _request(self, url: str, data: str) -> list:
-        httpx_client = ctx_httpx_client.get()
+        httpx_client = get_httpx_client(HTTPPool.IGDB)
         masked_headers = {}
 
+        if not await self.circuit_breaker.allow_request():
+            mark_status("circuit_open")
+            return []
+
         try:
             masked_headers = self._mask_sensitive_values(self.headers)
             log.debug(
@@ -253,7 +262,7 @@ class IGDBHandler(MetadataHandler):
                 headers=self.headers,
                 timeout=120,
             )
-
+            await self.circuit_breaker.record_success()
             res.raise_for_status()
             return res.json()
         except httpx.LocalProtocolError as exc:
@@ -270,6 +279,7 @@ class IGDBHandler(MetadataHandler):
                     detail="Can't connect to IGDB, check your internet connection",
                 ) from exc
         except httpx.NetworkError as exc:
+            await self.circuit_breaker.record_failure()
             log.critical("Connection error: can't connect to IGDB")
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -279,6 +289,7 @@ class IGDBHandler(MetadataHandler):
             # Retry once if the auth token is invalid
             if exc.response.status_code != 401:
                 log.error(exc)
+                mark_status("http_error")
                 return []  # All requests to the IGDB API return a list
 
             # Attempt to force a token refresh if the token is invalid
@@ -288,9 +299,10 @@ class IGDBHandler(MetadataHandler):
         except json.decoder.JSONDecodeError as exc:
             # Log the error and return an empty list if the response is not valid JSON
             log.error(exc)
+            mark_status("invalid_response")
             return []
         except httpx.TimeoutException:
-            pass
+            await self.circuit_breaker.record_failure()
 
         # Retry once the request if it times out
         try:
@@ -307,9 +319,20 @@ class IGDBHandler(MetadataHandler):
                 headers=self.headers,
                 timeout=120,
             )
+            await self.circuit_breaker.record_success()
             res.raise_for_status()
             return res.json()
         except (httpx.HTTPError, json.decoder.JSONDecodeError) as exc:
+            if isinstance(exc, (httpx.NetworkError, httpx.TimeoutException)):
+                await self.circuit_breaker.record_failure()
+
+            if isinstance(exc, httpx.TimeoutException):
+                mark_status("timeout")
+            elif isinstance(exc, json.decoder.JSONDecodeError):
+                mark_status("invalid_response")
+            else:
+                mark_status(type(exc).__name__)
+
             # Log the error and return an empty list if the request fails again
             log.error(exc)
             return []
@@ -437,6 +460,7 @@ class IGDBHandler(MetadataHandler):
         return IGDBPlatform(igdb_id=None, slug=slug)
 
     @check_twitch_token
+    @instrument_provider("igdb")
     async def get_rom(self, fs_name: str, platform_igdb_id: int) -> IGDBRom:
         from handler.filesystem import fs_rom_handler
 
@@ -532,6 +556,7 @@ class IGDBHandler(MetadataHandler):
         )
 
     @check_twitch_token
+    @instrument_provider("igdb")
     async def get_rom_by_id(self, igdb_id: int) -> IGDBRom:
         if not IGDB_API_ENABLED:
             return IGDBRom(igdb_id=None)
@@ -671,7 +696,7 @@ class TwitchAuth(MetadataHandler):
         token = None
         expires_in = 0
 
-        httpx_client = ctx_httpx_client.get()
+        httpx_client = get_httpx_client(HTTPPool.IGDB)
         try:
             log.debug(
                 "API request: URL=%s, Params=%s, Timeout=%s",
@@ -1,6 +1,6 @@
 import json
 from datetime import datetime
-from typing import NotRequired, TypedDict
+from typing import Final, NotRequired, TypedDict
 
 import pydash
 from config import LAUNCHBOX_API_ENABLED, str_to_bool
@@ -11,12 +11,20 @@ from tasks.scheduled.update_launchbox_metadata import (  # LAUNCHBOX_MAME_KEY,
     LAUNCHBOX_METADATA_DATABASE_ID_KEY,
     LAUNCHBOX_METADATA_IMAGE_KEY,
     LAUNCHBOX_METADATA_NAME_KEY,
+    LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY,
+    decode_launchbox_game,
     update_launchbox_metadata_task,
 )
+from utils.cache import get_generation_key
+from utils.instrumentation import instrument_provider
+from utils.title_index import TrigramTitleIndex
 
 from .base_hander import BaseRom, MetadataHandler
 from .base_hander import UniversalPlatformSlug as UPS
 
+# Fuzzy title index candidates scored with find_best_match
+LAUNCHBOX_FUZZY_CANDIDATES: Final = 10
+
 
 class LaunchboxPlatform(TypedDict):
     slug: str
@@ -50,6 +58,10 @@ class LaunchboxRom(BaseRom):
     launchbox_metadata: NotRequired[LaunchboxMetadata]
 
 
+def _to_str(value: str | bytes) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
 def extract_video_id_from_youtube_url(url: str | None) -> str:
     """
     Extracts the video ID from a YouTube URL.
@@ -115,6 +127,54 @@ def extract_metadata_from_launchbox_rom(
 
 
 class LaunchboxHandler(MetadataHandler):
+    def __init__(self) -> None:
+        # Fuzzy title indexes and title to DatabaseID maps by platform name,
+        # along with the generation of the platform titles they were built from
+        self._title_indexes: dict[
+            str, tuple[str | None, TrigramTitleIndex, dict[str, str]]
+        ] = {}
+
+    async def _get_title_index(
+        self, platform_name: str
+    ) -> tuple[TrigramTitleIndex, dict[str, str]]:
+        generation = await async_cache.get(
+            get_generation_key(LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY)
+        )
+        cached = self._title_indexes.get(platform_name)
+        if cached and cached[0] == generation:
+            return cached[1], cached[2]
+
+        platform_titles = await async_cache.hgetall(
+            f"{LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY}:{platform_name}"
+        )
+        title_ids = {
+            _to_str(title): _to_str(database_id)
+            for title, database_id in platform_titles.items()
+        }
+        title_index = TrigramTitleIndex(
+            (self.normalize_search_term(title), title) for title in title_ids
+        )
+
+        self._title_indexes[platform_name] = (generation, title_index, title_ids)
+        return title_index, title_ids
+
+    async def _get_fuzzy_database_id(
+        self, file_name: str, platform_name: str
+    ) -> str | None:
+        title_index, title_ids = await self._get_title_index(platform_name)
+        candidates = title_index.search(
+            self.normalize_search_term(file_name), LAUNCHBOX_FUZZY_CANDIDATES
+        )
+
+        best_match, best_score = self.find_best_match(file_name, candidates)
+        if not best_match:
+            return None
+
+        log.debug(
+            f"Found fuzzy match for '{file_name}' -> '{best_match}' (score: {best_score:.3f})"
+        )
+        return title_ids[best_match]
+
     async def _get_rom_from_metadata(
         self, file_name: str, platform_slug: str
     ) -> dict | None:
@@ -131,24 +191,26 @@ class LaunchboxHandler(MetadataHandler):
         if not platform_name:
             return None
 
-        metadata_name_index_entry = await async_cache.hget(
+        # Both name indexes only hold the DatabaseID of the game record
+        database_id = await async_cache.hget(
             LAUNCHBOX_METADATA_NAME_KEY, f"{file_name}:{platform_name}"
         )
+        if not database_id:
+            database_id = await async_cache.hget(
+                LAUNCHBOX_METADATA_ALTERNATE_NAME_KEY, file_name
+            )
 
-        if metadata_name_index_entry:
-            return json.loads(metadata_name_index_entry)
-
-        metadata_alternate_name_index_entry = await async_cache.hget(
-            LAUNCHBOX_METADATA_ALTERNATE_NAME_KEY, file_name
-        )
+        # Fall back to the closest title of the platform, to resolve small
+        # differences in file names locally instead of with online providers
+        if not database_id:
+            database_id = await self._get_fuzzy_database_id(file_name, platform_name)
 
-        if not metadata_alternate_name_index_entry:
+        if not database_id:
             return None
 
-        metadata_alternate_name_index_entry = json.loads(
-            metadata_alternate_name_index_entry
-        )
-        database_id = metadata_alternate_name_index_entry["DatabaseID"]
+        return await self._get_game(database_id)
+
+    async def _get_game(self, database_id: str) -> dict | None:
         metadata_database_index_entry = await async_cache.hget(
             LAUNCHBOX_METADATA_DATABASE_ID_KEY, database_id
         )
@@ -156,7 +218,7 @@ class LaunchboxHandler(MetadataHandler):
         if not metadata_database_index_entry:
             return None
 
-        return json.loads(metadata_database_index_entry)
+        return decode_launchbox_game(metadata_database_index_entry)
 
     async def _get_game_images(self, database_id: str) -> list[dict] | None:
         metadata_image_index_entry = await async_cache.hget(
@@ -210,6 +272,7 @@ class LaunchboxHandler(MetadataHandler):
             name=platform["name"],
         )
 
+    @instrument_provider("launchbox")
     async def get_rom(self, fs_name: str, platform_slug: str) -> LaunchboxRom:
         from handler.filesystem import fs_rom_handler
 
@@ -253,14 +316,12 @@ class LaunchboxHandler(MetadataHandler):
 
         return LaunchboxRom({k: v for k, v in rom.items() if v})  # type: ignore[misc]
 
+    @instrument_provider("launchbox")
     async def get_rom_by_id(self, database_id: int) -> LaunchboxRom:
         if not LAUNCHBOX_API_ENABLED:
             return LaunchboxRom(launchbox_id=None)
 
-        metadata_database_index_entry = await async_cache.hget(
-            LAUNCHBOX_METADATA_DATABASE_ID_KEY, str(database_id)
-        )
-
+        metadata_database_index_entry = await self._get_game(str(database_id))
         if not metadata_database_index_entry:
             return LaunchboxRom(launchbox_id=None)
 
@@ -8,6 +8,7 @@ from adapters.services.mobygames_types import MobyGame
 from config import MOBYGAMES_API_KEY
 from logger.logger import log
 from unidecode import unidecode as uc
+from utils.instrumentation import instrument_provider
 
 from .base_hander import (
     PS2_OPL_REGEX,
@@ -79,16 +80,16 @@ class MobyGamesHandler(MetadataHandler):
 
     async def _search_rom(
         self, search_term: str, platform_moby_id: int, split_game_name: bool = False
-    ) -> MobyGame | None:
+    ) -> tuple[MobyGame | None, float]:
         if not platform_moby_id:
-            return None
+            return None, 0.0
 
         roms = await self.moby_service.list_games(
             platform_ids=[platform_moby_id],
             title=quote(uc(search_term), safe="/ "),
         )
         if not roms:
-            return None
+            return None, 0.0
 
         games_by_name: dict[str, MobyGame] = {}
         for game in roms:
@@ -108,9 +109,9 @@ class MobyGamesHandler(MetadataHandler):
             log.debug(
                 f"Found match for '{search_term}' -> '{best_match}' (score: {best_score:.3f})"
             )
-            return games_by_name[best_match]
+            return games_by_name[best_match], best_score
 
-        return None
+        return None, 0.0
 
     def get_platform(self, slug: str) -> MobyGamesPlatform:
         if slug not in MOBYGAMES_PLATFORM_LIST:
@@ -125,6 +126,7 @@ class MobyGamesHandler(MetadataHandler):
             name=platform["name"],
         )
 
+    @instrument_provider("mobygames")
     async def get_rom(self, fs_name: str, platform_moby_id: int) -> MobyGamesRom:
         from handler.filesystem import fs_rom_handler
 
@@ -195,18 +197,18 @@ class MobyGamesHandler(MetadataHandler):
         normalized_search_term = self.normalize_search_term(
             search_term, remove_punctuation=False
         )
-        res = await self._search_rom(
-            self.SEARCH_TERM_NORMALIZER.sub(": ", normalized_search_term),
-            platform_moby_id,
+        terms = re.split(self.SEARCH_TERM_SPLIT_PATTERN, search_term)
+        res = await self.search_variants(
+            lambda term, split_game_name: self._search_rom(
+                term, platform_moby_id, split_game_name=split_game_name
+            ),
+            [
+                (self.SEARCH_TERM_NORMALIZER.sub(": ", normalized_search_term), False),
+                # Moby API doesn't handle some special characters well
+                (terms[-1], True),
+            ],
         )
 
-        # Moby API doesn't handle some special characters well
-        if not res:
-            terms = re.split(self.SEARCH_TERM_SPLIT_PATTERN, search_term)
-            res = await self._search_rom(
-                terms[-1], platform_moby_id, split_game_name=True
-            )
-
         if not res:
             return fallback_rom
 
@@ -221,6 +223,7 @@ class MobyGamesHandler(MetadataHandler):
 
         return MobyGamesRom({k: v for k, v in rom.items() if v})  # type: ignore[misc]
 
+    @instrument_provider("mobygames")
     async def get_rom_by_id(self, moby_id: int) -> MobyGamesRom:
         if not MOBY_API_ENABLED:
             return MobyGamesRom(moby_id=None)
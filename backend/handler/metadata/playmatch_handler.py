@@ -6,10 +6,15 @@ import httpx
 import yarl
 from config import PLAYMATCH_API_ENABLED
 from fastapi import HTTPException, status
+from handler.redis_handler import async_cache
 from logger.logger import log
 from models.rom import RomFile
 from utils import get_version
-from utils.context import ctx_httpx_client
+from utils.cache import LookupCache
+from utils.circuit_breaker import CircuitBreaker
+from utils.context import get_httpx_client
+from utils.http_transport import HTTPPool
+from utils.instrumentation import instrument_provider, mark_status
 
 
 class PlaymatchProvider(str, Enum):
@@ -46,17 +51,32 @@ class PlaymatchHandler:
     def __init__(self):
         self.base_url = "https://playmatch.retrorealm.dev/api"
         self.identify_url = f"{self.base_url}/identify/ids"
+        self.circuit_breaker = CircuitBreaker("Playmatch")
+        self.lookup_cache = LookupCache(async_cache, "playmatch")
 
-    async def _request(self, url: str, query: dict) -> dict:
+    @instrument_provider("playmatch")
+    async def _request(
+        self, url: str, query: dict, cache_key: str | None = None
+    ) -> dict:
         """
         Sends a Request to Playmatch API.
 
         :param url: The API endpoint URL.
         :param query: A dictionary containing the query parameters.
+        :param cache_key: If given, the key the response is cached under.
         :return: A dictionary with the json result.
         :raises HTTPException: If the request fails or the service is unavailable.
         """
-        httpx_client = ctx_httpx_client.get()
+        httpx_client = get_httpx_client(HTTPPool.PLAYMATCH)
+
+        if cache_key:
+            cached_response = await self.lookup_cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+
+        if not await self.circuit_breaker.allow_request():
+            mark_status("circuit_open")
+            return {}
 
         filtered_query = {
             key: value
@@ -80,9 +100,16 @@ class PlaymatchHandler:
             res = await httpx_client.get(
                 str(url_with_query), headers=headers, timeout=60
             )
+            await self.circuit_breaker.record_success()
             res.raise_for_status()
-            return res.json()
+            response = res.json()
+            if cache_key:
+                await self.lookup_cache.set(cache_key, response)
+            return response
         except (httpx.HTTPStatusError, httpx.ConnectError, httpx.ReadTimeout) as exc:
+            if not isinstance(exc, httpx.HTTPStatusError):
+                await self.circuit_breaker.record_failure()
+
             log.warning("Connection error: can't connect to Playmatch", exc_info=True)
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -90,8 +117,10 @@ class PlaymatchHandler:
             ) from exc
         except json.JSONDecodeError as exc:
             log.error("Error decoding JSON response from ScreenScraper: %s", exc)
+            mark_status("invalid_response")
             return {}
 
+    @instrument_provider("playmatch")
     async def lookup_rom(self, files: list[RomFile]) -> PlaymatchRomMatch:
         """
         Identify a ROM file using Playmatch API.
@@ -123,6 +152,10 @@ class PlaymatchHandler:
                     "md5": first_file.md5_hash,
                     "sha1": first_file.sha1_hash,
                 },
+                cache_key=(
+                    f"identify:{first_file.md5_hash or ''}:{first_file.sha1_hash or ''}:"
+                    f"{first_file.file_size_bytes}:{first_file.file_name}"
+                ).lower(),
             )
         except httpx.HTTPStatusError:
             # We silently fail if the service is unavailable as this should not block the rest of RomM.
@@ -1,7 +1,9 @@
 import json
 import os
 import time
+from collections import defaultdict
 from datetime import datetime
+from itertools import batched
 from typing import Final, NotRequired, TypedDict
 
 import pydash
@@ -15,7 +17,10 @@ from config import (
     RETROACHIEVEMENTS_API_KEY,
 )
 from handler.filesystem import fs_resource_handler
+from handler.redis_handler import async_cache
 from models.rom import Rom
+from utils.concurrency import LoopBoundSemaphore
+from utils.instrumentation import instrument_provider
 
 from .base_hander import BaseRom, MetadataHandler
 from .base_hander import UniversalPlatformSlug as UPS
@@ -23,6 +28,13 @@ from .base_hander import UniversalPlatformSlug as UPS
 # Used to display the Retroachievements API status in the frontend
 RA_API_ENABLED: Final = bool(RETROACHIEVEMENTS_API_KEY)
 
+REFRESH_RETROACHIEVEMENTS_CACHE_SECONDS: Final = (
+    REFRESH_RETROACHIEVEMENTS_CACHE_DAYS * 24 * 60 * 60
+)
+RA_HASHES_INDEX_KEY: Final = "romm:ra_hashes"
+# Marks the index as built, even for platforms without any hashes
+RA_HASHES_INDEX_BUILT_FIELD: Final = "__built_at__"
+
 
 class RAGamesPlatform(TypedDict):
     slug: str
@@ -123,6 +135,10 @@ class RAHandler(MetadataHandler):
     def __init__(self) -> None:
         self.ra_service = RetroAchievementsService()
         self.HASHES_FILE_NAME = "ra_hashes.json"
+        # One holder at a time, on each of the event loops of the tasks using them
+        self._index_locks: defaultdict[int, LoopBoundSemaphore] = defaultdict(
+            lambda: LoopBoundSemaphore(1)
+        )
 
     def _get_hashes_file_path(self, platform_id: int) -> str:
         platform_resources_path = fs_resource_handler.get_platform_resources_path(
@@ -130,60 +146,94 @@ class RAHandler(MetadataHandler):
         )
         return os.path.join(platform_resources_path, self.HASHES_FILE_NAME)
 
-    async def _exists_cache_file(self, platform_id: int) -> bool:
-        return await fs_resource_handler.file_exists(
-            self._get_hashes_file_path(platform_id)
-        )
+    def _get_hashes_index_key(self, platform_id: int) -> str:
+        return f"{RA_HASHES_INDEX_KEY}:{platform_id}"
 
-    async def _days_since_last_cache_file_update(self, platform_id: int) -> int:
+    async def _seconds_since_last_cache_file_update(self, platform_id: int) -> int:
         file_path = self._get_hashes_file_path(platform_id)
         if not await fs_resource_handler.file_exists(file_path):
-            return REFRESH_RETROACHIEVEMENTS_CACHE_DAYS + 1
+            return REFRESH_RETROACHIEVEMENTS_CACHE_SECONDS + 1
 
         full_path = fs_resource_handler.validate_path(file_path)
-        return int((time.time() - os.path.getmtime(full_path)) / (24 * 3600))
+        return int(time.time() - os.path.getmtime(full_path))
 
-    async def _search_rom(self, rom: Rom, ra_hash: str) -> RAGameListItem | None:
-        if not rom.platform.ra_id:
-            return None
+    async def _build_hashes_index(
+        self, platform_id: int, roms: list[RAGameListItem], ttl: int
+    ) -> None:
+        """Index the game list of a platform by lowercase hash in a redis hash."""
+        index: dict[str, str] = {}
+        for r in roms:
+            game = json.dumps({k: v for k, v in r.items() if k != "Hashes"})
+            for h in r.get("Hashes", ()):
+                index[h.lower()] = game
+
+        index_key = self._get_hashes_index_key(platform_id)
+        async with async_cache.pipeline() as pipe:
+            pipe.delete(index_key)
+            for data_batch in batched(index.items(), 2000):
+                pipe.hset(index_key, mapping=dict(data_batch))
+            pipe.hset(index_key, RA_HASHES_INDEX_BUILT_FIELD, int(time.time()))
+            pipe.expire(index_key, max(ttl, 1))
+            await pipe.execute()
+
+    async def _refresh_hashes_index(self, rom: Rom) -> None:
+        """Build the hashes index from the cache file, or from the API if it's stale."""
+        async with self._index_locks[rom.platform.id]:
+            if await async_cache.exists(self._get_hashes_index_key(rom.platform.id)):
+                return
+
+            roms: list[RAGameListItem]
+            file_age = await self._seconds_since_last_cache_file_update(rom.platform.id)
+            if file_age < REFRESH_RETROACHIEVEMENTS_CACHE_SECONDS:
+                # Read the roms result from the JSON file
+                json_file_bytes = await fs_resource_handler.read_file(
+                    self._get_hashes_file_path(rom.platform.id)
+                )
+                roms = json.loads(json_file_bytes.decode("utf-8"))
+            else:
+                # Write the roms result to a JSON file if older than REFRESH_RETROACHIEVEMENTS_CACHE_DAYS days
+                roms = await self.ra_service.get_game_list(
+                    system_id=rom.platform.ra_id,
+                    only_games_with_achievements=True,
+                    include_hashes=True,
+                )
 
-        # Fetch all hashes for specific platform
-        roms: list[RAGameListItem]
-        if (
-            REFRESH_RETROACHIEVEMENTS_CACHE_DAYS
-            <= await self._days_since_last_cache_file_update(rom.platform.id)
-            or not await self._exists_cache_file(rom.platform.id)
-        ):
-            # Write the roms result to a JSON file if older than REFRESH_RETROACHIEVEMENTS_CACHE_DAYS days
-            roms = await self.ra_service.get_game_list(
-                system_id=rom.platform.ra_id,
-                only_games_with_achievements=True,
-                include_hashes=True,
-            )
+                platform_resources_path = (
+                    fs_resource_handler.get_platform_resources_path(rom.platform.id)
+                )
 
-            platform_resources_path = fs_resource_handler.get_platform_resources_path(
-                rom.platform.id
-            )
+                json_file = json.dumps(roms, indent=4)
+                await fs_resource_handler.write_file(
+                    json_file.encode("utf-8"),
+                    platform_resources_path,
+                    self.HASHES_FILE_NAME,
+                )
+                file_age = 0
 
-            json_file = json.dumps(roms, indent=4)
-            await fs_resource_handler.write_file(
-                json_file.encode("utf-8"),
-                platform_resources_path,
-                self.HASHES_FILE_NAME,
+            await self._build_hashes_index(
+                rom.platform.id,
+                roms,
+                ttl=REFRESH_RETROACHIEVEMENTS_CACHE_SECONDS - file_age,
             )
-        else:
-            # Read the roms result from the JSON file
-            json_file_bytes = await fs_resource_handler.read_file(
-                self._get_hashes_file_path(rom.platform.id)
-            )
-            roms = json.loads(json_file_bytes.decode("utf-8"))
 
+    async def _search_rom(self, rom: Rom, ra_hash: str) -> RAGameListItem | None:
+        if not rom.platform.ra_id:
+            return None
+
+        index_key = self._get_hashes_index_key(rom.platform.id)
         ra_hash_lower = ra_hash.lower()
-        for r in roms:
-            if any(ra_hash_lower == h.lower() for h in r.get("Hashes", ())):
-                return r
 
-        return None
+        # Single round-trip when the platform index is already built
+        async with async_cache.pipeline(transaction=False) as pipe:
+            pipe.hget(index_key, ra_hash_lower)
+            pipe.hexists(index_key, RA_HASHES_INDEX_BUILT_FIELD)
+            game, index_built = await pipe.execute()
+
+        if not index_built:
+            await self._refresh_hashes_index(rom)
+            game = await async_cache.hget(index_key, ra_hash_lower)
+
+        return json.loads(game) if game else None
 
     def get_platform(self, slug: str) -> RAGamesPlatform:
         if slug not in RA_PLATFORM_LIST:
@@ -197,6 +247,7 @@ class RAHandler(MetadataHandler):
             name=platform["name"],
         )
 
+    @instrument_provider("retroachievements")
     async def get_rom(self, rom: Rom, ra_hash: str) -> RAGameRom:
         if not rom.platform.ra_id or not ra_hash:
             return RAGameRom(ra_id=None)
@@ -234,6 +285,7 @@ class RAHandler(MetadataHandler):
         except KeyError:
             return RAGameRom(ra_id=None)
 
+    @instrument_provider("retroachievements")
     async def get_rom_by_id(self, rom: Rom, ra_id: int) -> RAGameRom:
         if not ra_id:
             return RAGameRom(ra_id=None)
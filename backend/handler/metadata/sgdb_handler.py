@@ -1,16 +1,33 @@
 import asyncio
-from typing import Final, NotRequired, TypedDict
+from collections.abc import Awaitable, Callable
+from contextlib import aclosing
+from typing import Final, NotRequired, TypedDict, TypeVar
 
 from adapters.services.steamgriddb import SteamGridDBService
 from adapters.services.steamgriddb_types import SGDBDimension, SGDBGame, SGDBType
 from config import STEAMGRIDDB_API_KEY
 from logger.logger import log
+from utils.concurrency import LoopBoundSemaphore
+from utils.instrumentation import instrument_provider
 
 from .base_hander import MetadataHandler
 
 # Used to display the Mobygames API status in the frontend
 STEAMGRIDDB_API_ENABLED: Final = bool(STEAMGRIDDB_API_KEY)
 
+# Lookups running at once against SteamGridDB, shared by all callers
+SGDB_MAX_CONCURRENT_LOOKUPS: Final = 4
+
+T = TypeVar("T")
+
+DEFAULT_COVER_DIMENSIONS: Final = (
+    SGDBDimension.STEAM_VERTICAL,
+    SGDBDimension.GOG_GALAXY_TILE,
+    SGDBDimension.GOG_GALAXY_COVER,
+    SGDBDimension.SQUARE_512,
+    SGDBDimension.SQUARE_1024,
+)
+
 
 class SGDBResource(TypedDict):
     thumb: str
@@ -32,7 +49,15 @@ class SGDBBaseHandler(MetadataHandler):
     def __init__(self) -> None:
         self.sgdb_service = SteamGridDBService()
         self.min_similarity_score: Final = 0.98
+        self.lookup_slots = LoopBoundSemaphore(SGDB_MAX_CONCURRENT_LOOKUPS)
+
+    async def _limit_concurrency(self, lookup: Callable[[], Awaitable[T]]) -> T:
+        # The lookup only starts once a slot is free, so that lookups cancelled
+        # while queued never leave an unawaited coroutine behind
+        async with self.lookup_slots:
+            return await lookup()
 
+    @instrument_provider("steamgriddb")
     async def get_details(self, search_term: str) -> list[SGDBResult]:
         if not STEAMGRIDDB_API_ENABLED:
             return []
@@ -43,73 +68,103 @@ class SGDBBaseHandler(MetadataHandler):
             return []
 
         tasks = [
-            self._get_game_covers(game_id=game["id"], game_name=game["name"])
+            self._limit_concurrency(
+                lambda game=game: self._get_game_covers(
+                    game_id=game["id"], game_name=game["name"]
+                )
+            )
             for game in games
         ]
         results = await asyncio.gather(*tasks)
 
         return list(filter(None, results))
 
+    @instrument_provider("steamgriddb")
     async def get_details_by_names(self, game_names: list[str]) -> SGDBRom:
+        """Find the cover of the first of the game names that matches on SteamGridDB.
+
+        Names are looked up concurrently, and pending lookups are cancelled as
+        soon as the result of the earliest name with a match is known.
+        """
         if not STEAMGRIDDB_API_ENABLED:
             return SGDBRom(sgdb_id=None)
 
-        for game_name in game_names:
-            search_term = self.normalize_search_term(game_name, remove_articles=False)
-            games = await self.sgdb_service.search_games(term=search_term)
-            if not games:
-                log.debug(f"Could not find '{search_term}' on SteamGridDB")
-                continue
-
-            games_by_name: dict[str, SGDBGame] = {}
-            for game in games:
-                if (
-                    game["name"] not in games_by_name
-                    or game["id"] < games_by_name[game["name"]]["id"]
-                ):
-                    games_by_name[game["name"]] = game
-
-            best_match, best_score = self.find_best_match(
-                search_term,
-                list(games_by_name.keys()),
-                min_similarity_score=self.min_similarity_score,
+        tasks = [
+            asyncio.create_task(
+                self._limit_concurrency(lambda name=name: self._get_rom_by_name(name))
             )
-            if best_match:
-                game_details = await self._get_game_covers(
-                    game_id=games_by_name[best_match]["id"],
-                    game_name=games_by_name[best_match]["name"],
-                    types=(SGDBType.STATIC,),
-                    is_nsfw=False,
-                    is_humor=False,
-                    is_epilepsy=False,
-                )
-
-                first_resource = next(
-                    (res for res in game_details["resources"] if res["url"]), None
-                )
-                if first_resource:
-                    log.debug(
-                        f"Found match for '{search_term}' -> '{best_match}' (score: {best_score:.3f})"
-                    )
-                    return SGDBRom(
-                        sgdb_id=games_by_name[best_match]["id"],
-                        url_cover=first_resource["url"],
-                    )
+            for name in game_names
+        ]
+        try:
+            for task in tasks:
+                sgdb_rom = await task
+                if sgdb_rom["sgdb_id"]:
+                    return sgdb_rom
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         log.debug(f"No good match found for '{', '.join(game_names)}' on SteamGridDB")
         return SGDBRom(sgdb_id=None)
 
+    async def _get_rom_by_name(self, game_name: str) -> SGDBRom:
+        search_term = self.normalize_search_term(game_name, remove_articles=False)
+        games = await self.sgdb_service.search_games(term=search_term)
+        if not games:
+            log.debug(f"Could not find '{search_term}' on SteamGridDB")
+            return SGDBRom(sgdb_id=None)
+
+        games_by_name: dict[str, SGDBGame] = {}
+        for game in games:
+            if (
+                game["name"] not in games_by_name
+                or game["id"] < games_by_name[game["name"]]["id"]
+            ):
+                games_by_name[game["name"]] = game
+
+        best_match, best_score = self.find_best_match(
+            search_term,
+            list(games_by_name.keys()),
+            min_similarity_score=self.min_similarity_score,
+        )
+        if not best_match:
+            return SGDBRom(sgdb_id=None)
+
+        url_cover = await self._get_first_static_cover_url(
+            game_id=games_by_name[best_match]["id"]
+        )
+        if not url_cover:
+            return SGDBRom(sgdb_id=None)
+
+        log.debug(
+            f"Found match for '{search_term}' -> '{best_match}' (score: {best_score:.3f})"
+        )
+        return SGDBRom(sgdb_id=games_by_name[best_match]["id"], url_cover=url_cover)
+
+    async def _get_first_static_cover_url(self, game_id: int) -> str | None:
+        # Closing the iterator early stops fetching the next pages of grids
+        async with aclosing(
+            self.sgdb_service.iter_grids_for_game(
+                game_id=game_id,
+                dimensions=DEFAULT_COVER_DIMENSIONS,
+                types=(SGDBType.STATIC,),
+                is_nsfw=False,
+                is_humor=False,
+                is_epilepsy=False,
+            )
+        ) as game_covers:
+            async for cover in game_covers:
+                if cover["url"]:
+                    return cover["url"]
+
+        return None
+
     async def _get_game_covers(
         self,
         game_id: int,
         game_name: str,
-        dimensions: tuple[SGDBDimension, ...] = (
-            SGDBDimension.STEAM_VERTICAL,
-            SGDBDimension.GOG_GALAXY_TILE,
-            SGDBDimension.GOG_GALAXY_COVER,
-            SGDBDimension.SQUARE_512,
-            SGDBDimension.SQUARE_1024,
-        ),
+        dimensions: tuple[SGDBDimension, ...] = DEFAULT_COVER_DIMENSIONS,
         types: tuple[SGDBType, ...] = (SGDBType.STATIC, SGDBType.ANIMATED),
         is_nsfw: bool | None = None,
         is_humor: bool | None = None,
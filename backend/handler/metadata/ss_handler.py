@@ -10,6 +10,7 @@ from adapters.services.screenscraper_types import SSGame, SSGameDate
 from config import SCREENSCRAPER_PASSWORD, SCREENSCRAPER_USER
 from logger.logger import log
 from unidecode import unidecode as uc
+from utils.instrumentation import instrument_provider
 
 from .base_hander import (
     PS2_OPL_REGEX,
@@ -278,9 +279,9 @@ class SSHandler(MetadataHandler):
 
     async def _search_rom(
         self, search_term: str, platform_ss_id: int, split_game_name: bool = False
-    ) -> SSGame | None:
+    ) -> tuple[SSGame | None, float]:
         if not platform_ss_id:
-            return None
+            return None, 0.0
 
         roms = await self.ss_service.search_games(
             term=quote(uc(search_term), safe="/ "),
@@ -304,9 +305,9 @@ class SSHandler(MetadataHandler):
             log.debug(
                 f"Found match for '{search_term}' -> '{best_match}' (score: {best_score:.3f})"
             )
-            return games_by_name[best_match]
+            return games_by_name[best_match], best_score
 
-        return None
+        return None, 0.0
 
     def get_platform(self, slug: str) -> SSPlatform:
         if slug not in SCREENSAVER_PLATFORM_LIST:
@@ -320,6 +321,7 @@ class SSHandler(MetadataHandler):
             name=platform["name"],
         )
 
+    @instrument_provider("screenscraper")
     async def get_rom(self, file_name: str, platform_ss_id: int) -> SSRom:
         from handler.filesystem import fs_rom_handler
 
@@ -393,23 +395,28 @@ class SSHandler(MetadataHandler):
         normalized_search_term = self.normalize_search_term(
             search_term, remove_punctuation=False
         )
-        res = await self._search_rom(
-            self.SEARCH_TERM_NORMALIZER.sub(" : ", normalized_search_term),
-            platform_ss_id,
-        )
+        variants = [
+            (self.SEARCH_TERM_NORMALIZER.sub(" : ", normalized_search_term), False)
+        ]
 
         # SS API doesn't handle some special characters well
-        if not res and " : " in search_term:
+        if " : " in search_term:
             terms = re.split(self.SEARCH_TERM_SPLIT_PATTERN, search_term)
-            res = await self._search_rom(
-                terms[-1], platform_ss_id, split_game_name=True
-            )
+            variants.append((terms[-1], True))
+
+        res = await self.search_variants(
+            lambda term, split_game_name: self._search_rom(
+                term, platform_ss_id, split_game_name=split_game_name
+            ),
+            variants,
+        )
 
         if not res or not res.get("id"):
             return fallback_rom
 
         return build_ss_rom(res)
 
+    @instrument_provider("screenscraper")
     async def get_rom_by_id(self, ss_id: int) -> SSRom:
         if not SS_API_ENABLED:
             return SSRom(ss_id=None)
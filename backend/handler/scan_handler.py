@@ -4,9 +4,10 @@ from typing import Any
 
 from config.config_manager import config_manager as cm
 from handler.database import db_platform_handler
-from handler.filesystem import fs_asset_handler, fs_firmware_handler
+from handler.filesystem import fs_asset_handler, fs_firmware_handler, fs_rom_handler
 from handler.filesystem.roms_handler import FSRom
 from handler.metadata import (
+    meta_dat_handler,
     meta_hasheous_handler,
     meta_igdb_handler,
     meta_launchbox_handler,
@@ -290,6 +291,7 @@ async def scan_rom(
                 "hasheous_metadata": rom.hasheous_metadata,
                 "path_cover_s": rom.path_cover_s,
                 "path_cover_l": rom.path_cover_l,
+                "cover_placeholder": rom.cover_placeholder,
                 "path_screenshots": rom.path_screenshots,
                 "path_manual": rom.path_manual,
                 "url_cover": rom.url_cover,
@@ -298,9 +300,29 @@ async def scan_rom(
             }
         )
 
+    # Local DAT files are checked before any network provider
+    dat_hash_match = await meta_dat_handler.lookup_rom(fs_rom["files"])
+
+    # The canonical title of a DAT match is searched instead of the file name
+    search_fs_name = rom_attrs["fs_name"]
+    if dat_hash_match["name"]:
+        log.debug(
+            f"{hl(rom_attrs['fs_name'])} identified by DAT file "
+            f"{hl(dat_hash_match.get('dat_set', ''), color=BLUE)} as "
+            f"{hl(dat_hash_match['name'])} {emoji.EMOJI_ALIEN_MONSTER}",
+            extra=LOGGER_MODULE_NAME,
+        )
+        fs_extension = fs_rom_handler.parse_file_extension(fs_rom["fs_name"])
+        search_fs_name = (
+            f"{dat_hash_match['name']}.{fs_extension}"
+            if fs_extension
+            else dat_hash_match["name"]
+        )
+
     async def fetch_playmatch_hash_match() -> PlaymatchRomMatch:
         if (
-            MetadataSource.IGDB in metadata_sources
+            not dat_hash_match["name"]
+            and MetadataSource.IGDB in metadata_sources
             and platform.igdb_id
             and (
                 newly_added
@@ -315,7 +337,8 @@ async def scan_rom(
 
     async def fetch_hasheous_hash_match() -> HasheousRom:
         if (
-            MetadataSource.HASHEOUS in metadata_sources
+            not dat_hash_match["name"]
+            and MetadataSource.HASHEOUS in metadata_sources
             and platform.hasheous_id
             and (
                 newly_added
@@ -383,7 +406,7 @@ async def scan_rom(
             # If no matches found, use the file name to get the IGDB ID
             main_platform_igdb_id = get_main_platform_igdb_id(platform)
             return await meta_igdb_handler.get_rom(
-                rom_attrs["fs_name"], main_platform_igdb_id or platform.igdb_id
+                search_fs_name, main_platform_igdb_id or platform.igdb_id
             )
 
         return IGDBRom(igdb_id=None)
@@ -404,7 +427,7 @@ async def scan_rom(
             )
         ):
             return await meta_moby_handler.get_rom(
-                rom_attrs["fs_name"], platform_moby_id=platform.moby_id
+                search_fs_name, platform_moby_id=platform.moby_id
             )
 
         return MobyGamesRom(moby_id=None)
@@ -425,7 +448,7 @@ async def scan_rom(
             )
         ):
             return await meta_ss_handler.get_rom(
-                rom_attrs["fs_name"], platform_ss_id=platform.ss_id
+                search_fs_name, platform_ss_id=platform.ss_id
             )
 
         return SSRom(ss_id=None)
@@ -441,9 +464,7 @@ async def scan_rom(
             )
             or (scan_type == ScanType.UNIDENTIFIED and rom.is_unidentified)
         ):
-            return await meta_launchbox_handler.get_rom(
-                rom_attrs["fs_name"], platform_slug
-            )
+            return await meta_launchbox_handler.get_rom(search_fs_name, platform_slug)
 
         return LaunchboxRom(launchbox_id=None)
 
@@ -568,6 +589,14 @@ async def scan_rom(
         }
     )
 
+    # Keep the DAT file matches along with the ones found by Hasheous
+    if dat_hash_match.get("hasheous_metadata"):
+        current_hasheous_metadata = rom_attrs.get("hasheous_metadata") or {}
+        rom_attrs["hasheous_metadata"] = {
+            key: match or bool(current_hasheous_metadata.get(key))
+            for key, match in dat_hash_match["hasheous_metadata"].items()
+        }
+
     # Don't overwrite existing fields on partial scans
     if not newly_added and scan_type == ScanType.PARTIAL:
         rom_attrs.update(
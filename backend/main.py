@@ -25,6 +25,7 @@ from endpoints import (
     heartbeat,
     platform,
     raw,
+    resources,
     rom,
     rom_verification,
     saves,
@@ -48,7 +49,9 @@ from startup import main
 from utils import get_version
 from utils.context import (
     ctx_aiohttp_session,
+    ctx_aiohttp_sessions,
     ctx_httpx_client,
+    ctx_httpx_clients,
     initialize_context,
     set_context_middleware,
 )
@@ -61,6 +64,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     async with initialize_context():
         app.state.aiohttp_session = ctx_aiohttp_session.get()
         app.state.httpx_client = ctx_httpx_client.get()
+        app.state.aiohttp_sessions = ctx_aiohttp_sessions.get()
+        app.state.httpx_clients = ctx_httpx_clients.get()
         yield
 
 
@@ -127,6 +132,7 @@ app.include_router(feeds.router, prefix="/api")
 app.include_router(configs.router, prefix="/api")
 app.include_router(stats.router, prefix="/api")
 app.include_router(raw.router, prefix="/api")
+app.include_router(resources.router, prefix="/api")
 app.include_router(screenshots.router, prefix="/api")
 app.include_router(firmware.router, prefix="/api")
 app.include_router(collections.router, prefix="/api")
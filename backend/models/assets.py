@@ -92,3 +92,7 @@ class Screenshot(RomAsset):
 
     rom: Mapped[Rom] = relationship(lazy="joined", back_populates="screenshots")
     user: Mapped[User] = relationship(lazy="joined", back_populates="screenshots")
+
+    @cached_property
+    def thumbnail_path(self) -> str:
+        return f"/api/raw/thumbnails/{self.full_path}?timestamp={self.updated_at}"
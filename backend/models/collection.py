@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import base64
 import json
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
-from config import FRONTEND_RESOURCES_PATH
 from models.base import BaseModel
 from sqlalchemy import ForeignKey, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from utils.database import CustomJSON
+from utils.filesystem import get_resource_url
 
 if TYPE_CHECKING:
     from models.rom import Rom
@@ -59,7 +60,7 @@ class Collection(BaseModel):
     @property
     def path_cover_small(self) -> str | None:
         return (
-            f"{FRONTEND_RESOURCES_PATH}/{self.path_cover_s}?ts={self.updated_at}"
+            get_resource_url(self.path_cover_s, self.updated_at)
             if self.path_cover_s
             else None
         )
@@ -67,7 +68,7 @@ class Collection(BaseModel):
     @property
     def path_cover_large(self) -> str | None:
         return (
-            f"{FRONTEND_RESOURCES_PATH}/{self.path_cover_l}?ts={self.updated_at}"
+            get_resource_url(self.path_cover_l, self.updated_at)
             if self.path_cover_l
             else None
         )
@@ -75,7 +76,7 @@ class Collection(BaseModel):
     @property
     def path_covers_small(self) -> list[str]:
         return [
-            f"{FRONTEND_RESOURCES_PATH}/{r.path_cover_s}?ts={self.updated_at}"
+            get_resource_url(r.path_cover_s, self.updated_at)
             for r in self.roms
             if r.path_cover_s
         ]
@@ -83,7 +84,7 @@ class Collection(BaseModel):
     @property
     def path_covers_large(self) -> list[str]:
         return [
-            f"{FRONTEND_RESOURCES_PATH}/{r.path_cover_l}?ts={self.updated_at}"
+            get_resource_url(r.path_cover_l, self.updated_at)
             for r in self.roms
             if r.path_cover_l
         ]
@@ -150,15 +151,13 @@ class VirtualCollection(BaseModel):
     @property
     def path_covers_small(self) -> list[str]:
         return [
-            f"{FRONTEND_RESOURCES_PATH}/{cover}?ts={self.updated_at}"
-            for cover in self.path_covers_s
+            get_resource_url(cover, self.updated_at) for cover in self.path_covers_s
         ]
 
     @property
     def path_covers_large(self) -> list[str]:
         return [
-            f"{FRONTEND_RESOURCES_PATH}/{cover}?ts={self.updated_at}"
-            for cover in self.path_covers_l
+            get_resource_url(cover, self.updated_at) for cover in self.path_covers_l
         ]
 
     __table_args__ = (
@@ -204,29 +203,40 @@ class SmartCollection(BaseModel):
 
         roms = db_collection_handler.get_smart_collection_roms(self, user_id)
 
-        roms_with_small_covers = [r for r in roms if r.path_cover_s][
-            :SMART_COLLECTION_MAX_COVERS
-        ]
-        roms_with_large_covers = [r for r in roms if r.path_cover_l][
-            :SMART_COLLECTION_MAX_COVERS
-        ]
-
         return db_collection_handler.update_smart_collection(
             self.id,
             {
                 "rom_count": len(roms),
                 "rom_ids": [rom.id for rom in roms],
-                "path_covers_small": [
-                    f"{FRONTEND_RESOURCES_PATH}/{r.path_cover_s}?ts={self.updated_at}"
-                    for r in roms_with_small_covers
-                ],
-                "path_covers_large": [
-                    f"{FRONTEND_RESOURCES_PATH}/{r.path_cover_l}?ts={self.updated_at}"
-                    for r in roms_with_large_covers
-                ],
+                **self.get_covers(roms),
             },
         )
 
+    def get_covers(self, roms: Iterable[Rom]) -> dict[str, list[str]]:
+        """Cover URLs of the first roms with a cover, as stored in the collection.
+
+        The URLs change with the content of the covers, so they are rebuilt
+        whenever the cover of one of the roms changes.
+        """
+        roms = list(roms)
+        roms_with_small_covers = [r for r in roms if r.path_cover_s][
+            :SMART_COLLECTION_MAX_COVERS
+        ]
+        roms_with_large_covers = [r for r in roms if r.path_cover_l][
+            :SMART_COLLECTION_MAX_COVERS
+        ]
+
+        return {
+            "path_covers_small": [
+                get_resource_url(r.path_cover_s, self.updated_at)
+                for r in roms_with_small_covers
+            ],
+            "path_covers_large": [
+                get_resource_url(r.path_cover_l, self.updated_at)
+                for r in roms_with_large_covers
+            ],
+        }
+
     @property
     def user__username(self) -> str:
         return self.user.username
@@ -25,6 +25,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from utils.database import CustomJSON
+from utils.filesystem import get_resource_url
 
 if TYPE_CHECKING:
     from models.assets import Save, Screenshot, State
@@ -182,6 +183,9 @@ class Rom(BaseModel):
 
     path_cover_s: Mapped[str | None] = mapped_column(Text, default="")
     path_cover_l: Mapped[str | None] = mapped_column(Text, default="")
+    cover_placeholder: Mapped[str | None] = mapped_column(
+        Text, doc="Tiny inline image of the cover, shown while the cover loads"
+    )
     url_cover: Mapped[str | None] = mapped_column(
         Text, default="", doc="URL to cover image stored in IGDB"
     )
@@ -288,7 +292,7 @@ class Rom(BaseModel):
     @property
     def path_cover_small(self) -> str:
         return (
-            f"{FRONTEND_RESOURCES_PATH}/{self.path_cover_s}?ts={self.updated_at}"
+            get_resource_url(self.path_cover_s, self.updated_at)
             if self.path_cover_s
             else ""
         )
@@ -296,7 +300,7 @@ class Rom(BaseModel):
     @property
     def path_cover_large(self) -> str:
         return (
-            f"{FRONTEND_RESOURCES_PATH}/{self.path_cover_l}?ts={self.updated_at}"
+            get_resource_url(self.path_cover_l, self.updated_at)
             if self.path_cover_l
             else ""
         )
@@ -1,86 +1,245 @@
+import asyncio
 import os
 import shutil
+import time
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final, TypedDict
 
 from config import RESOURCES_BASE_PATH
 from handler.database import db_platform_handler, db_rom_handler
+from handler.filesystem.resources_handler import RESOURCES_BLOBS_PATH
 from logger.logger import log
 from tasks.tasks import Task
 from utils.context import initialize_context
 
+# Blobs and downloads more recent than this may be about to be linked by a scan
+ORPHANED_BLOB_MIN_AGE: Final = 60 * 60
+# Orphaned resources removed at once
+CLEANUP_MAX_WORKERS: Final = 8
+
+# Hard links by (device, inode)
+LinkCounts = Mapping[tuple[int, int], int]
+
+
+class OrphanedResourcesReport(TypedDict):
+    dry_run: bool
+    directories: int
+    blobs: int
+    # Size of the files that are not linked from other resources, and so freed
+    bytes: int
+    errors: int
+
+
+def _find_orphaned_rom_directories(
+    roms_path: str, platform_ids: set[int], rom_ids: dict[int, set[int]]
+) -> list[str]:
+    """List the directories of platforms and roms that are not in the database."""
+    if not os.path.isdir(roms_path):
+        return []
+
+    existing_platforms = {str(platform_id) for platform_id in platform_ids}
+    orphaned_paths = []
+    with os.scandir(roms_path) as platform_entries:
+        for platform_entry in platform_entries:
+            if not platform_entry.is_dir(follow_symlinks=False):
+                continue
+
+            if platform_entry.name not in existing_platforms:
+                orphaned_paths.append(platform_entry.path)
+                continue
+
+            existing_roms = {
+                str(rom_id) for rom_id in rom_ids.get(int(platform_entry.name), ())
+            }
+            with os.scandir(platform_entry.path) as rom_entries:
+                orphaned_paths.extend(
+                    rom_entry.path
+                    for rom_entry in rom_entries
+                    if rom_entry.is_dir(follow_symlinks=False)
+                    and rom_entry.name not in existing_roms
+                )
+
+    return orphaned_paths
+
+
+def _count_links(paths: list[str]) -> Counter[tuple[int, int]]:
+    """Count the hard links held by the files of directories, by inode."""
+    links: Counter[tuple[int, int]] = Counter()
+    for path in paths:
+        for root, _, files in os.walk(path):
+            for file in files:
+                stat = os.stat(os.path.join(root, file), follow_symlinks=False)
+                if stat.st_nlink > 1:
+                    links[(stat.st_dev, stat.st_ino)] += 1
+    return links
+
+
+def _get_link_count(stat: os.stat_result, removed_links: LinkCounts) -> int:
+    return stat.st_nlink - removed_links.get((stat.st_dev, stat.st_ino), 0)
+
+
+def _find_orphaned_blobs(
+    blobs_path: str, max_mtime: float, removed_links: LinkCounts
+) -> list[str]:
+    """List the blobs, renditions and interrupted downloads that no resource links to.
+
+    A blob and its renditions, named "{hash}.{size}.{extension}", are kept as long
+    as one of them is linked, not counting the links in removed_links.
+    """
+    if not os.path.isdir(blobs_path):
+        return []
+
+    orphaned_paths = []
+    with os.scandir(blobs_path) as directory_entries:
+        for directory_entry in directory_entries:
+            if not directory_entry.is_dir(follow_symlinks=False):
+                continue
+
+            blob_paths: dict[str, list[str]] = {}
+            used_blobs: set[str] = set()
+            with os.scandir(directory_entry.path) as blob_entries:
+                for blob_entry in blob_entries:
+                    if not blob_entry.is_file(follow_symlinks=False):
+                        continue
+
+                    blob_name = blob_entry.name.split(".", 1)[0]
+                    blob_paths.setdefault(blob_name, []).append(blob_entry.path)
+                    stat = blob_entry.stat(follow_symlinks=False)
+                    if (
+                        _get_link_count(stat, removed_links) > 1
+                        or stat.st_mtime >= max_mtime
+                    ):
+                        used_blobs.add(blob_name)
+
+            for blob_name, paths in blob_paths.items():
+                if blob_name not in used_blobs:
+                    orphaned_paths.extend(paths)
+
+    return orphaned_paths
+
+
+def _get_freed_size(path: str, removed_links: LinkCounts) -> int:
+    if not os.path.isdir(path):
+        stat = os.stat(path, follow_symlinks=False)
+        return stat.st_size if _get_link_count(stat, removed_links) == 1 else 0
+
+    freed_size = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            stat = os.stat(os.path.join(root, file), follow_symlinks=False)
+            if stat.st_nlink == 1:
+                freed_size += stat.st_size
+    return freed_size
+
+
+def _remove_orphaned_path(
+    path: str, dry_run: bool, removed_links: LinkCounts
+) -> int | None:
+    """Remove an orphaned file or directory, returning the freed size or None on error."""
+    try:
+        freed_size = _get_freed_size(path, removed_links)
+        if not dry_run:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+    except OSError as e:
+        log.error(f"Failed to remove orphaned resource {path}: {e}")
+        return None
+
+    if not dry_run:
+        log.debug(f"Removed orphaned resource {path}")
+    return freed_size
+
+
+def _remove_orphaned_paths(
+    paths: list[str],
+    dry_run: bool,
+    report: OrphanedResourcesReport,
+    removed_links: LinkCounts | None = None,
+) -> None:
+    removed_links = removed_links or {}
+    with ThreadPoolExecutor(max_workers=CLEANUP_MAX_WORKERS) as executor:
+        for freed_size in executor.map(
+            _remove_orphaned_path,
+            paths,
+            [dry_run] * len(paths),
+            [removed_links] * len(paths),
+        ):
+            if freed_size is None:
+                report["errors"] += 1
+            else:
+                report["bytes"] += freed_size
+
 
 class CleanupOrphanedResourcesTask(Task):
     def __init__(self):
         super().__init__(
             title="Cleanup orphaned resources",
-            description="Clean up orphaned resources in the ROMs directory",
+            description="Clean up the resources of deleted platforms and ROMs, and the unused downloaded resources",
             enabled=True,
             manual_run=True,
             cron_string=None,
         )
 
     @initialize_context()
-    async def run(self) -> None:
-        """Clean up orphaned resources."""
+    async def run(self, dry_run: bool = False) -> OrphanedResourcesReport:
+        """Clean up orphaned resources.
+
+        Args:
+            dry_run: Only report the orphaned resources, without removing them
+        """
         log.info(f"Starting {self.title} task...")
 
-        removed_count = 0
+        report = OrphanedResourcesReport(
+            dry_run=dry_run, directories=0, blobs=0, bytes=0, errors=0
+        )
 
-        roms_resources_path = os.path.join(RESOURCES_BASE_PATH, "roms")
-        if not os.path.exists(roms_resources_path):
-            log.info("Resources path does not exist, skipping cleanup")
-            return None
+        platform_ids = db_platform_handler.get_platform_ids()
+        rom_ids = db_rom_handler.get_rom_ids_by_platform()
+        log.debug(f"Found {len(platform_ids)} platforms in database")
 
-        existing_platforms = {
-            str(platform.id) for platform in db_platform_handler.get_platforms()
-        }
-        log.debug(f"Found {len(existing_platforms)} platforms in database")
+        orphaned_directories = await asyncio.to_thread(
+            _find_orphaned_rom_directories,
+            os.path.join(RESOURCES_BASE_PATH, "roms"),
+            platform_ids,
+            rom_ids,
+        )
+        report["directories"] = len(orphaned_directories)
+        await asyncio.to_thread(
+            _remove_orphaned_paths, orphaned_directories, dry_run, report
+        )
 
-        for platform_dir in os.listdir(roms_resources_path):
-            platform_path = os.path.join(roms_resources_path, platform_dir)
-            if not os.path.isdir(platform_path):
-                continue
+        # A dry run leaves the directories, don't count the blob links they hold
+        removed_links = (
+            await asyncio.to_thread(_count_links, orphaned_directories)
+            if dry_run
+            else {}
+        )
 
-            # Check if platform exists in database
-            if platform_dir not in existing_platforms:
-                try:
-                    # Remove entire platform directory if platform doesn't exist
-                    shutil.rmtree(platform_path)
-                    removed_count += 1
-                    log.info(f"Removed orphaned platform directory: {platform_dir}")
-                except Exception as e:
-                    log.error(
-                        f"Failed to remove platform directory {platform_dir}: {e}"
-                    )
-                continue
+        # Scanned after the directories, to also remove the blobs only they linked to
+        orphaned_blobs = await asyncio.to_thread(
+            _find_orphaned_blobs,
+            os.path.join(RESOURCES_BASE_PATH, RESOURCES_BLOBS_PATH),
+            time.time() - ORPHANED_BLOB_MIN_AGE,
+            removed_links,
+        )
+        report["blobs"] = len(orphaned_blobs)
+        await asyncio.to_thread(
+            _remove_orphaned_paths, orphaned_blobs, dry_run, report, removed_links
+        )
 
-            platform_id = int(platform_dir)
-            existing_roms = {
-                str(rom.id)
-                for rom in db_rom_handler.get_roms_scalar(platform_id=platform_id)
-            }
-            log.debug(f"Found {len(existing_roms)} ROMs for platform {platform_id}")
-
-            for rom_dir in os.listdir(platform_path):
-                rom_path = os.path.join(platform_path, rom_dir)
-                if not os.path.isdir(rom_path):
-                    continue
-
-                # Check if ROM exists in database
-                if rom_dir not in existing_roms:
-                    try:
-                        # Remove ROM directory if ROM doesn't exist
-                        shutil.rmtree(rom_path)
-                        removed_count += 1
-                        log.info(
-                            f"Removed orphaned ROM directory: {platform_dir}/{rom_dir}"
-                        )
-                    except Exception as e:
-                        log.error(
-                            f"Failed to remove ROM directory {platform_dir}/{rom_dir}: {e}"
-                        )
-
-        log.info(f"Removed {removed_count} orphaned resource directories")
+        log.info(
+            f"{'Found' if dry_run else 'Removed'} {report['directories']} orphaned "
+            f"resource directories and {report['blobs']} orphaned blobs "
+            f"({report['bytes']} bytes)"
+        )
+        if report["errors"]:
+            log.warning(f"Failed to remove {report['errors']} orphaned resources")
         log.info("Cleanup of orphaned resources completed!")
+        return report
 
 
 cleanup_orphaned_resources_task = CleanupOrphanedResourcesTask()
@@ -0,0 +1,183 @@
+import asyncio
+import json
+import os
+from collections.abc import Iterator
+from typing import Final
+from xml.etree.ElementTree import Element, ParseError
+
+from config import DATS_BASE_PATH
+from defusedxml import DefusedXmlException
+from defusedxml import ElementTree as ET
+from handler.redis_handler import async_cache
+from logger.logger import log
+from tasks.tasks import Task
+from utils.context import initialize_context
+
+# Index from "{hash type}:{hash}" to the DAT entry of the file
+DAT_HASH_INDEX_KEY: Final = "romm:dat_hashes"
+DAT_HASH_TYPES: Final = ("crc", "md5", "sha1")
+DAT_FILE_EXTENSIONS: Final = (".dat", ".xml")
+
+# Number of games parsed before their entries are written to the index
+DAT_PIPELINE_BATCH_SIZE: Final = 5000
+
+# Keywords in the DAT header identifying the group that maintains it, checked in
+# order, mapped to the `hasheous_metadata` match flag they fill
+DAT_SOURCE_KEYWORDS: Final = (
+    ("no-intro", "nointro"),
+    ("redump", "redump"),
+    ("tosec", "tosec"),
+    ("whdload", "whdload"),
+    ("fbneo", "fbneo"),
+    ("finalburn neo", "fbneo"),
+    ("mess", "mame_mess"),
+    ("mame", "mame_arcade"),
+)
+
+
+def get_dat_hash_field(hash_type: str, hash_value: str) -> str:
+    return f"{hash_type}:{hash_value.lower()}"
+
+
+def _get_dat_source(root_tag: str, header: Element | None) -> str | None:
+    header_text = (
+        " ".join(
+            (header.findtext(tag) or "")
+            for tag in ("name", "description", "homepage", "url")
+        ).lower()
+        if header is not None
+        else ""
+    )
+
+    for keyword, source in DAT_SOURCE_KEYWORDS:
+        if keyword in header_text:
+            return source
+
+    # MAME -listxml output has no header
+    return "mame_arcade" if root_tag == "mame" else None
+
+
+def _iter_dat_batches(
+    path: str, file_name: str
+) -> Iterator[tuple[int, dict[str, str]]]:
+    """Parse a Logiqx XML DAT file, yielding its games count and index entries in batches."""
+    with open(path, "rb") as f:
+        ctx = ET.iterparse(f, events=("start", "end"))
+        _, root = next(ctx)
+
+        dat_name = file_name
+        source = _get_dat_source(root.tag, None)
+        count = 0
+        mapping: dict[str, str] = {}
+
+        for event, elem in ctx:
+            if event != "end":
+                continue
+
+            if elem.tag == "header":
+                dat_name = elem.findtext("name") or file_name
+                source = _get_dat_source(root.tag, elem)
+                root.clear()
+                continue
+
+            if elem.tag not in ("game", "machine"):
+                continue
+
+            entry = json.dumps(
+                {"name": elem.get("name"), "set": dat_name, "source": source},
+                separators=(",", ":"),
+            )
+            mapping.update(
+                (get_dat_hash_field(hash_type, file_elem.get(hash_type, "")), entry)
+                for file_elem in (*elem.iter("rom"), *elem.iter("disk"))
+                for hash_type in DAT_HASH_TYPES
+                if file_elem.get(hash_type)
+            )
+
+            root.clear()
+            count += 1
+            if count == DAT_PIPELINE_BATCH_SIZE:
+                yield count, mapping
+                count, mapping = 0, {}
+
+        if count:
+            yield count, mapping
+
+
+def _list_dat_files() -> list[str] | None:
+    if not os.path.isdir(DATS_BASE_PATH):
+        return None
+
+    return sorted(
+        file_name
+        for file_name in os.listdir(DATS_BASE_PATH)
+        if file_name.lower().endswith(DAT_FILE_EXTENSIONS)
+    )
+
+
+class ImportDatFilesTask(Task):
+    def __init__(self):
+        super().__init__(
+            title="Import DAT files",
+            description="Index the hashes of the No-Intro, Redump, TOSEC and MAME DAT files in the DATs directory",
+            enabled=True,
+            manual_run=True,
+            cron_string=None,
+        )
+
+    async def _import_dat(self, file_name: str, key: str) -> int:
+        """Index the files of a Logiqx XML DAT file, returning the number of games."""
+        # The file is read and parsed off the event loop, one batch of games at a time
+        batches = _iter_dat_batches(os.path.join(DATS_BASE_PATH, file_name), file_name)
+        total_count = 0
+        try:
+            while batch := await asyncio.to_thread(next, batches, None):
+                count, mapping = batch
+                if mapping:
+                    await async_cache.hset(key, mapping=mapping)
+
+                total_count += count
+                log.info(f"Processed {total_count} games from {file_name}")
+        finally:
+            batches.close()
+
+        return total_count
+
+    @initialize_context()
+    async def run(self) -> None:
+        log.info(f"Starting {self.title} task...")
+
+        dat_files = await asyncio.to_thread(_list_dat_files)
+        if dat_files is None:
+            log.info("DATs path does not exist, skipping import")
+            return None
+
+        # The index is built under a temporary key and swapped in at the end,
+        # so lookups during the import keep using the previous index
+        tmp_key = f"{DAT_HASH_INDEX_KEY}:tmp"
+        await async_cache.delete(tmp_key)
+
+        total_count = 0
+        try:
+            for file_name in dat_files:
+                try:
+                    count = await self._import_dat(file_name, tmp_key)
+                except (ParseError, DefusedXmlException, OSError) as exc:
+                    log.error(f"Could not import DAT file {file_name}: {exc}")
+                    continue
+
+                log.info(f"Imported {count} games from {file_name}")
+                total_count += count
+
+            if await async_cache.exists(tmp_key):
+                await async_cache.rename(tmp_key, DAT_HASH_INDEX_KEY)
+            else:
+                await async_cache.delete(DAT_HASH_INDEX_KEY)
+        finally:
+            # Left behind when the import fails
+            await async_cache.delete(tmp_key)
+
+        log.info(f"Imported {total_count} games from {len(dat_files)} DAT files")
+
+
+import_dat_files_task = ImportDatFilesTask()
@@ -0,0 +1,27 @@
+from handler.redis_handler import async_cache
+from logger.logger import log
+from tasks.tasks import Task
+from utils.cache import purge_lookup_cache
+from utils.context import initialize_context
+
+
+class PurgeLookupCacheTask(Task):
+    def __init__(self):
+        super().__init__(
+            title="Purge metadata lookup cache",
+            description="Clear the cached Hasheous and Playmatch lookups, so ROMs are matched again on the next scan",
+            enabled=True,
+            manual_run=True,
+            cron_string=None,
+        )
+
+    @initialize_context()
+    async def run(self) -> None:
+        log.info(f"Starting {self.title} task...")
+
+        purged_count = await purge_lookup_cache(async_cache)
+
+        log.info(f"Purged {purged_count} cached metadata lookups")
+
+
+purge_lookup_cache_task = PurgeLookupCacheTask()
@@ -1,7 +1,11 @@
+import base64
 import json
+import tempfile
 import zipfile
-from io import BytesIO
-from typing import Any, Final
+import zlib
+from collections.abc import Iterator
+from typing import IO, Any, Final
+from xml.etree.ElementTree import Element
 
 from config import (
     ENABLE_SCHEDULED_UPDATE_LAUNCHBOX_METADATA,
@@ -11,17 +15,79 @@ from config import (
 from defusedxml import ElementTree as ET
 from handler.redis_handler import async_cache
 from logger.logger import log
+from redis.asyncio.client import Pipeline
 from tasks.tasks import RemoteFilePullTask
+from utils.cache import get_generation_key
 from utils.context import initialize_context
 
 LAUNCHBOX_PLATFORMS_KEY: Final = "romm:launchbox_platforms"
-LAUNCHBOX_METADATA_DATABASE_ID_KEY: Final = "romm:launchbox_metadata_database_id"
-LAUNCHBOX_METADATA_NAME_KEY: Final = "romm:launchbox_metadata_name"
-LAUNCHBOX_METADATA_ALTERNATE_NAME_KEY: Final = "romm:launchbox_metadata_alternate_name"
+# Game records, stored once and compressed, by DatabaseID
+LAUNCHBOX_METADATA_DATABASE_ID_KEY: Final = "romm:launchbox_metadata_games"
+# Indexes from "{name}:{platform}" and alternate names to DatabaseID
+LAUNCHBOX_METADATA_NAME_KEY: Final = "romm:launchbox_metadata_name_ids"
+LAUNCHBOX_METADATA_ALTERNATE_NAME_KEY: Final = (
+    "romm:launchbox_metadata_alternate_name_ids"
+)
+# Per platform indexes from names and alternate names to DatabaseID, suffixed
+# with ":{platform}", used to build the fuzzy title indexes of the handler
+LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY: Final = (
+    "romm:launchbox_metadata_platform_titles"
+)
 LAUNCHBOX_METADATA_IMAGE_KEY: Final = "romm:launchbox_metadata_image"
 LAUNCHBOX_MAME_KEY: Final = "romm:launchbox_mame"
 LAUNCHBOX_FILES_KEY: Final = "romm:launchbox_files"
 
+# Number of XML elements processed before the redis pipeline is flushed
+LAUNCHBOX_PIPELINE_BATCH_SIZE: Final = 5000
+
+# Keys used before game records were deduplicated, dropped on the next update
+LAUNCHBOX_LEGACY_METADATA_KEYS: Final = (
+    "romm:launchbox_metadata_database_id",
+    "romm:launchbox_metadata_name",
+    "romm:launchbox_metadata_alternate_name",
+)
+
+
+def _iter_elements(f: IO[bytes], tags: set[str]) -> Iterator[Element]:
+    """Iterate over the top-level elements with the given tags of an XML file.
+
+    Elements are dropped from the tree once consumed, so memory usage stays
+    bounded no matter how large the file is.
+    """
+    ctx = ET.iterparse(f, events=("start", "end"))
+    _, root = next(ctx)
+
+    for event, elem in ctx:
+        if event == "end" and elem.tag in tags:
+            yield elem
+            root.clear()
+
+
+def _element_to_json(elem: Element) -> str:
+    return json.dumps({child.tag: child.text for child in elem})
+
+
+def encode_launchbox_game(game: dict[str, Any]) -> str:
+    """Serialize a game record into a compact string for storage in redis.
+
+    Empty fields are dropped and the JSON is zlib-compressed, then base64-encoded
+    since the redis client decodes all responses as text.
+    """
+    data = json.dumps(
+        {k: v for k, v in game.items() if v is not None}, separators=(",", ":")
+    )
+    return base64.b64encode(zlib.compress(data.encode("utf-8"), 9)).decode("ascii")
+
+
+def decode_launchbox_game(data: str | bytes) -> dict[str, Any]:
+    return json.loads(zlib.decompress(base64.b64decode(data)))
+
+
+async def _flush_pipeline(pipe: Pipeline, file: str, count: int) -> None:
+    if count % LAUNCHBOX_PIPELINE_BATCH_SIZE == 0:
+        await pipe.execute()
+        log.info(f"Processed {count} entries from launchbox {file}")
+
 
 class UpdateLaunchboxMetadataTask(RemoteFilePullTask):
     def __init__(self):
@@ -35,209 +101,180 @@ class UpdateLaunchboxMetadataTask(RemoteFilePullTask):
             url="https://gamesdb.launchbox-app.com/Metadata.zip",
         )
 
+    async def _import_platforms(self, f: IO[bytes]) -> None:
+        async with async_cache.pipeline() as pipe:
+            for count, elem in enumerate(_iter_elements(f, {"Platform"}), start=1):
+                name_elem = elem.find("Name")
+                if name_elem is not None and name_elem.text:
+                    await pipe.hset(
+                        LAUNCHBOX_PLATFORMS_KEY,
+                        mapping={name_elem.text: _element_to_json(elem)},
+                    )
+
+                elem.clear()
+                await _flush_pipeline(pipe, "Platforms.xml", count)
+            await pipe.execute()
+
+    async def _import_metadata(self, f: IO[bytes]) -> None:
+        async with async_cache.pipeline() as pipe:
+            pipe.delete(*LAUNCHBOX_LEGACY_METADATA_KEYS)
+
+            current_game_image_db_id = None
+            current_game_images: list[dict[str, Any]] = []
+            # Alternate names don't have a platform, so it's taken from the game
+            game_platforms: dict[str, str] = {}
+
+            for count, elem in enumerate(
+                _iter_elements(f, {"Game", "GameAlternateName", "GameImage"}),
+                start=1,
+            ):
+                if elem.tag == "Game":
+                    id_elem = elem.find("DatabaseID")
+                    if id_elem is None or not id_elem.text:
+                        elem.clear()
+                        continue
+
+                    await pipe.hset(
+                        LAUNCHBOX_METADATA_DATABASE_ID_KEY,
+                        mapping={
+                            id_elem.text: encode_launchbox_game(
+                                {child.tag: child.text for child in elem}
+                            )
+                        },
+                    )
+
+                    name_elem = elem.find("Name")
+                    platform_elem = elem.find("Platform")
+                    if (
+                        name_elem is not None
+                        and name_elem.text
+                        and platform_elem is not None
+                        and platform_elem.text
+                    ):
+                        # Use a unique combination of name and platform as the key
+                        await pipe.hset(
+                            LAUNCHBOX_METADATA_NAME_KEY,
+                            mapping={
+                                f"{name_elem.text}:{platform_elem.text}": id_elem.text
+                            },
+                        )
+                        await pipe.hset(
+                            f"{LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY}:{platform_elem.text}",
+                            mapping={name_elem.text: id_elem.text},
+                        )
+                        game_platforms[id_elem.text] = platform_elem.text
+
+                elif elem.tag == "GameAlternateName":
+                    alternate_name_elem = elem.find("AlternateName")
+                    id_elem = elem.find("DatabaseID")
+                    if (
+                        alternate_name_elem is not None
+                        and alternate_name_elem.text
+                        and id_elem is not None
+                        and id_elem.text
+                    ):
+                        await pipe.hset(
+                            LAUNCHBOX_METADATA_ALTERNATE_NAME_KEY,
+                            mapping={alternate_name_elem.text: id_elem.text},
+                        )
+
+                        platform = game_platforms.get(id_elem.text)
+                        if platform:
+                            await pipe.hset(
+                                f"{LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY}:{platform}",
+                                mapping={alternate_name_elem.text: id_elem.text},
+                            )
+
+                elif elem.tag == "GameImage":
+                    id_elem = elem.find("DatabaseID")
+                    if id_elem is not None and id_elem.text:
+                        image_id = str(id_elem.text)
+
+                        if (
+                            current_game_image_db_id is not None
+                            and image_id != current_game_image_db_id
+                        ):
+                            # Store the previous game's images
+                            await pipe.hset(
+                                LAUNCHBOX_METADATA_IMAGE_KEY,
+                                mapping={
+                                    current_game_image_db_id: json.dumps(
+                                        current_game_images
+                                    )
+                                },
+                            )
+                            current_game_images = []
+
+                        current_game_image_db_id = image_id
+                        current_game_images.append(
+                            {child.tag: child.text for child in elem}
+                        )
+
+                elem.clear()
+                await _flush_pipeline(pipe, "Metadata.xml", count)
+
+            # Store the last game's images
+            if current_game_image_db_id is not None:
+                await pipe.hset(
+                    LAUNCHBOX_METADATA_IMAGE_KEY,
+                    mapping={current_game_image_db_id: json.dumps(current_game_images)},
+                )
+            await pipe.incr(get_generation_key(LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY))
+            await pipe.execute()
+
+    async def _import_files(self, f: IO[bytes], file: str, tag: str, key: str) -> None:
+        async with async_cache.pipeline() as pipe:
+            for count, elem in enumerate(_iter_elements(f, {tag}), start=1):
+                filename_elem = elem.find("FileName")
+                if filename_elem is not None and filename_elem.text:
+                    await pipe.hset(
+                        key,
+                        mapping={filename_elem.text: _element_to_json(elem)},
+                    )
+
+                elem.clear()
+                await _flush_pipeline(pipe, file, count)
+            await pipe.execute()
+
     @initialize_context()
     async def run(self, force: bool = False) -> None:
         if not LAUNCHBOX_API_ENABLED:
             log.warning("Launchbox API is not enabled, skipping metadata update")
             return None
 
-        content = await super().run(force)
-        if content is None:
-            log.warning("No content received from launchbox metadata update")
-            return None
+        # The metadata archive is several hundred MBs, so it's streamed to disk
+        # and read from there instead of being held in memory
+        with tempfile.TemporaryFile() as tmp_file:
+            if not await self.stream_to_file(tmp_file, force):
+                log.warning("No content received from launchbox metadata update")
+                return None
 
-        try:
-            zip_file_bytes = BytesIO(content)
-            with zipfile.ZipFile(zip_file_bytes) as z:
-                for file in z.namelist():
-                    if file == "Platforms.xml":
-                        with z.open(file, "r") as f:
-                            async with async_cache.pipeline() as pipe:
-                                ctx = ET.iterparse(f, events=("end",))
-
-                                for _, elem in ctx:
-                                    if elem.tag == "Platform":
-                                        name_elem = elem.find("Name")
-                                        if name_elem is not None and name_elem.text:
-                                            await pipe.hset(
-                                                LAUNCHBOX_PLATFORMS_KEY,
-                                                mapping={
-                                                    name_elem.text: json.dumps(
-                                                        {
-                                                            child.tag: child.text
-                                                            for child in elem
-                                                        }
-                                                    )
-                                                },
-                                            )
-
-                                        elem.clear()
-                                await pipe.execute()
-
-                    elif file == "Metadata.xml":
-                        with z.open(file, "r") as f:
-                            async with async_cache.pipeline() as pipe:
-                                ctx = ET.iterparse(f, events=("end",))
-
-                                current_game_image_db_id = None
-                                current_game_images: list[dict[str, Any]] = []
-
-                                for _, elem in ctx:
-                                    if elem.tag == "Game":
-                                        id_elem = elem.find("DatabaseID")
-                                        if id_elem is not None and id_elem.text:
-                                            await pipe.hset(
-                                                LAUNCHBOX_METADATA_DATABASE_ID_KEY,
-                                                mapping={
-                                                    id_elem.text: json.dumps(
-                                                        {
-                                                            child.tag: child.text
-                                                            for child in elem
-                                                        }
-                                                    )
-                                                },
-                                            )
-
-                                        name_elem = elem.find("Name")
-                                        platform_elem = elem.find("Platform")
-                                        if (
-                                            name_elem is not None
-                                            and name_elem.text
-                                            and platform_elem is not None
-                                            and platform_elem.text
-                                        ):
-                                            # Use a unique combination of name and platform as the key
-                                            await pipe.hset(
-                                                LAUNCHBOX_METADATA_NAME_KEY,
-                                                mapping={
-                                                    f"{name_elem.text}:{platform_elem.text}": json.dumps(
-                                                        {
-                                                            child.tag: child.text
-                                                            for child in elem
-                                                        }
-                                                    )
-                                                },
-                                            )
-                                        elem.clear()
-
-                                    elif elem.tag == "GameAlternateName":
-                                        alternate_name_elem = elem.find("AlternateName")
-                                        if (
-                                            alternate_name_elem is not None
-                                            and alternate_name_elem.text
-                                        ):
-                                            await pipe.hset(
-                                                LAUNCHBOX_METADATA_ALTERNATE_NAME_KEY,
-                                                mapping={
-                                                    alternate_name_elem.text: json.dumps(
-                                                        {
-                                                            child.tag: child.text
-                                                            for child in elem
-                                                        }
-                                                    )
-                                                },
-                                            )
-
-                                        elem.clear()
-
-                                    elif elem.tag == "GameImage":
-                                        id_elem = elem.find("DatabaseID")
-                                        if id_elem is not None and id_elem.text:
-                                            image_id = str(id_elem.text)
-
-                                            if (
-                                                current_game_image_db_id is not None
-                                                and image_id != current_game_image_db_id
-                                            ):
-                                                # Store the previous game's images
-                                                await pipe.hset(
-                                                    LAUNCHBOX_METADATA_IMAGE_KEY,
-                                                    mapping={
-                                                        current_game_image_db_id: json.dumps(
-                                                            current_game_images
-                                                        )
-                                                    },
-                                                )
-                                                current_game_images = []
-
-                                            current_game_image_db_id = image_id
-                                            current_game_images.append(
-                                                {
-                                                    child.tag: child.text
-                                                    for child in elem
-                                                }
-                                            )
-                                        elem.clear()
-
-                                # Store the last game's images
-                                if current_game_image_db_id is not None:
-                                    await pipe.hset(
-                                        LAUNCHBOX_METADATA_IMAGE_KEY,
-                                        mapping={
-                                            current_game_image_db_id: json.dumps(
-                                                current_game_images
-                                            )
-                                        },
-                                    )
-                                await pipe.execute()
-
-                    elif file == "Mame.xml":
-                        with z.open(file, "r") as f:
-                            async with async_cache.pipeline() as pipe:
-                                ctx = ET.iterparse(f, events=("end",))
-
-                                for _, elem in ctx:
-                                    if elem.tag == "MameFile":
-                                        filename_elem = elem.find("FileName")
-                                        if (
-                                            filename_elem is not None
-                                            and filename_elem.text
-                                        ):
-                                            await pipe.hset(
-                                                LAUNCHBOX_MAME_KEY,
-                                                mapping={
-                                                    filename_elem.text: json.dumps(
-                                                        {
-                                                            child.tag: child.text
-                                                            for child in elem
-                                                        }
-                                                    )
-                                                },
-                                            )
-
-                                        elem.clear()
-                                await pipe.execute()
-
-                    elif file == "Files.xml":
-                        with z.open(file, "r") as f:
-                            async with async_cache.pipeline() as pipe:
-                                ctx = ET.iterparse(f, events=("end",))
-
-                                for _, elem in ctx:
-                                    if elem.tag == "File":
-                                        filename_elem = elem.find("FileName")
-                                        if (
-                                            filename_elem is not None
-                                            and filename_elem.text
-                                        ):
-                                            await pipe.hset(
-                                                LAUNCHBOX_FILES_KEY,
-                                                mapping={
-                                                    filename_elem.text: json.dumps(
-                                                        {
-                                                            child.tag: child.text
-                                                            for child in elem
-                                                        }
-                                                    )
-                                                },
-                                            )
-
-                                        elem.clear()
-                                await pipe.execute()
-
-        except zipfile.BadZipFile:
-            log.error("Bad zip file in launchbox metadata update")
-            return None
+            try:
+                with zipfile.ZipFile(tmp_file) as z:
+                    for file in z.namelist():
+                        if file == "Platforms.xml":
+                            with z.open(file, "r") as f:
+                                await self._import_platforms(f)
+
+                        elif file == "Metadata.xml":
+                            with z.open(file, "r") as f:
+                                await self._import_metadata(f)
+
+                        elif file == "Mame.xml":
+                            with z.open(file, "r") as f:
+                                await self._import_files(
+                                    f, file, "MameFile", LAUNCHBOX_MAME_KEY
+                                )
+
+                        elif file == "Files.xml":
+                            with z.open(file, "r") as f:
+                                await self._import_files(
+                                    f, file, "File", LAUNCHBOX_FILES_KEY
+                                )
+
+            except zipfile.BadZipFile:
+                log.error("Bad zip file in launchbox metadata update")
+                return None
 
         log.info("Scheduled launchbox metadata update completed!")
 
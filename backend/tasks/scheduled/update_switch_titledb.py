@@ -1,6 +1,7 @@
+import io
 import json
-from itertools import batched
-from typing import Final
+import tempfile
+from typing import IO, Final
 
 from config import (
     ENABLE_SCHEDULED_UPDATE_SWITCH_TITLEDB,
@@ -9,10 +10,19 @@ from config import (
 from handler.redis_handler import async_cache
 from logger.logger import log
 from tasks.tasks import RemoteFilePullTask
+from utils.cache import get_generation_key
 from utils.context import initialize_context
+from utils.json import iter_object_items
 
+# TitleDB entries, stored once by the TitleDB key
 SWITCH_TITLEDB_INDEX_KEY: Final = "romm:switch_titledb"
-SWITCH_PRODUCT_ID_KEY: Final = "romm:switch_product_id"
+# Index from product ID to TitleDB key
+SWITCH_PRODUCT_ID_KEY: Final = "romm:switch_product_ids"
+# Key used before the product ID index only referenced TitleDB entries
+SWITCH_LEGACY_PRODUCT_ID_KEY: Final = "romm:switch_product_id"
+
+# Number of titles processed before the redis pipeline is flushed
+SWITCH_TITLEDB_BATCH_SIZE: Final = 2000
 
 
 class UpdateSwitchTitleDBTask(RemoteFilePullTask):
@@ -27,29 +37,52 @@ class UpdateSwitchTitleDBTask(RemoteFilePullTask):
             url="https://raw.githubusercontent.com/blawar/titledb/master/US.en.json",
         )
 
-    @initialize_context()
-    async def run(self, force: bool = False) -> None:
-        content = await super().run(force)
-        if content is None:
-            return None
+    async def _import_titledb(self, f: IO[str]) -> None:
+        async with async_cache.pipeline() as pipe:
+            await pipe.delete(SWITCH_LEGACY_PRODUCT_ID_KEY)
 
-        index_json = json.loads(content)
-        relevant_data = {k: v for k, v in index_json.items() if k and v}
+            titledb_map: dict[str, str] = {}
+            product_map: dict[str, str] = {}
+            count = 0
 
-        async with async_cache.pipeline() as pipe:
-            for data_batch in batched(relevant_data.items(), 2000, strict=False):
-                titledb_map = {k: json.dumps(v) for k, v in dict(data_batch).items()}
+            for key, entry in iter_object_items(f):
+                if not key or not entry:
+                    continue
+
+                titledb_map[key] = json.dumps(entry)
+                if entry.get("id"):
+                    product_map[entry["id"]] = key
+
+                count += 1
+                if count % SWITCH_TITLEDB_BATCH_SIZE == 0:
+                    await pipe.hset(SWITCH_TITLEDB_INDEX_KEY, mapping=titledb_map)
+                    if product_map:
+                        await pipe.hset(SWITCH_PRODUCT_ID_KEY, mapping=product_map)
+                    await pipe.execute()
+                    log.info(f"Processed {count} entries from switch titledb")
+
+                    titledb_map = {}
+                    product_map = {}
+
+            if titledb_map:
                 await pipe.hset(SWITCH_TITLEDB_INDEX_KEY, mapping=titledb_map)
-            for data_batch in batched(relevant_data.items(), 2000, strict=False):
-                product_map = {
-                    v["id"]: json.dumps(v)
-                    for v in dict(data_batch).values()
-                    if v.get("id")
-                }
-                if product_map:
-                    await pipe.hset(SWITCH_PRODUCT_ID_KEY, mapping=product_map)
+            if product_map:
+                await pipe.hset(SWITCH_PRODUCT_ID_KEY, mapping=product_map)
+            # Drop the local copies metadata handlers keep of both indexes
+            await pipe.incr(get_generation_key(SWITCH_TITLEDB_INDEX_KEY))
+            await pipe.incr(get_generation_key(SWITCH_PRODUCT_ID_KEY))
             await pipe.execute()
 
+    @initialize_context()
+    async def run(self, force: bool = False) -> None:
+        # The file is streamed to disk and parsed incrementally to keep memory low
+        with tempfile.TemporaryFile() as tmp_file:
+            if not await self.stream_to_file(tmp_file, force):
+                return None
+
+            with io.TextIOWrapper(tmp_file, encoding="utf-8") as f:
+                await self._import_titledb(f)
+
         log.info("Scheduled switch titledb update completed!")
 
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import IO, Any
 
 import httpx
 from exceptions.task_exceptions import SchedulerException
@@ -112,13 +112,18 @@ class RemoteFilePullTask(PeriodicTask, ABC):
         super().__init__(*args, **kwargs)
         self.url = url
 
-    async def run(self, force: bool = False) -> bytes | None:
+    def _should_run(self, force: bool) -> bool:
         if not self.enabled and not force:
             log.info(f"Scheduled {self.description} not enabled, unscheduling...")
             self.unschedule()
-            return None
+            return False
 
         log.info(f"Scheduled {self.description} started...")
+        return True
+
+    async def run(self, force: bool = False) -> bytes | None:
+        if not self._should_run(force):
+            return None
 
         httpx_client = ctx_httpx_client.get()
         try:
@@ -129,3 +134,25 @@ class RemoteFilePullTask(PeriodicTask, ABC):
             log.error(f"Scheduled {self.description} failed", exc_info=True)
             log.error(e)
             return None
+
+    async def stream_to_file(self, file: IO[bytes], force: bool = False) -> bool:
+        """Stream the remote file into `file` instead of holding it in memory.
+
+        Returns whether the file was fully downloaded.
+        """
+        if not self._should_run(force):
+            return False
+
+        httpx_client = ctx_httpx_client.get()
+        try:
+            async with httpx_client.stream("GET", self.url, timeout=120) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    file.write(chunk)
+        except httpx.HTTPError as e:
+            log.error(f"Scheduled {self.description} failed", exc_info=True)
+            log.error(e)
+            return False
+
+        file.seek(0)
+        return True
@@ -95,7 +95,7 @@ class TestMobyGamesServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.mobygames.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request("https://api.mobygames.com/v1/games")
 
         assert result == {"games": [{"game_id": 1, "title": "Test Game"}]}
@@ -113,7 +113,7 @@ class TestMobyGamesServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.mobygames.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             with pytest.raises(HTTPException) as exc_info:
                 await service._request("https://api.mobygames.com/v1/games")
 
@@ -137,7 +137,7 @@ class TestMobyGamesServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.mobygames.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request("https://api.mobygames.com/v1/games")
 
         assert result == {"games": []}
@@ -157,7 +157,7 @@ class TestMobyGamesServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.mobygames.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request("https://api.mobygames.com/v1/games")
 
         assert result == {}
@@ -181,7 +181,7 @@ class TestMobyGamesServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.mobygames.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             with patch("asyncio.sleep") as mock_sleep:
                 result = await service._request("https://api.mobygames.com/v1/games")
 
@@ -202,7 +202,7 @@ class TestMobyGamesServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.mobygames.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request("https://api.mobygames.com/v1/games")
 
         assert result == {}
@@ -221,7 +221,7 @@ class TestMobyGamesServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.mobygames.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request("https://api.mobygames.com/v1/games")
 
         assert result == {}
@@ -424,9 +424,7 @@ class TestMobyGamesServiceIntegration:
     @pytest.mark.vcr
     async def test_list_games_real_api(self, service, mock_ctx_aiohttp_session):
         """Test list_games with real API call."""
-        with patch(
-            "adapters.services.mobygames.ctx_aiohttp_session", mock_ctx_aiohttp_session
-        ):
+        with patch("utils.context.ctx_aiohttp_session", mock_ctx_aiohttp_session):
             result = await service.list_games(limit=5)
 
         # Verify response structure
@@ -442,9 +440,7 @@ class TestMobyGamesServiceIntegration:
         self, service, mock_ctx_aiohttp_session
     ):
         """Test list_games with platform filter using real API call."""
-        with patch(
-            "adapters.services.mobygames.ctx_aiohttp_session", mock_ctx_aiohttp_session
-        ):
+        with patch("utils.context.ctx_aiohttp_session", mock_ctx_aiohttp_session):
             result = await service.list_games(platform_ids=[1], limit=3)  # PC platform
 
         # Verify response structure
@@ -461,9 +457,7 @@ class TestMobyGamesServiceIntegration:
         self, service, mock_ctx_aiohttp_session
     ):
         """Test list_games with title search using real API call."""
-        with patch(
-            "adapters.services.mobygames.ctx_aiohttp_session", mock_ctx_aiohttp_session
-        ):
+        with patch("utils.context.ctx_aiohttp_session", mock_ctx_aiohttp_session):
             result = await service.list_games(title="Sonic", limit=5)
 
         # Verify response structure
@@ -481,9 +475,7 @@ class TestMobyGamesServiceIntegration:
         self, service, mock_ctx_aiohttp_session
     ):
         """Test list_games with brief output format using real API call."""
-        with patch(
-            "adapters.services.mobygames.ctx_aiohttp_session", mock_ctx_aiohttp_session
-        ):
+        with patch("utils.context.ctx_aiohttp_session", mock_ctx_aiohttp_session):
             result = await service.list_games(output_format="brief", limit=3)
 
         # Verify response structure for brief format
@@ -503,9 +495,7 @@ class TestMobyGamesServiceIntegration:
         self, service, mock_ctx_aiohttp_session
     ):
         """Test list_games with ID output format using real API call."""
-        with patch(
-            "adapters.services.mobygames.ctx_aiohttp_session", mock_ctx_aiohttp_session
-        ):
+        with patch("utils.context.ctx_aiohttp_session", mock_ctx_aiohttp_session):
             result = await service.list_games(output_format="id", limit=5)
 
         # Verify response structure for ID format
@@ -520,9 +510,7 @@ class TestMobyGamesServiceIntegration:
         self, service, mock_ctx_aiohttp_session
     ):
         """Test list_games with normal output format using real API call."""
-        with patch(
-            "adapters.services.mobygames.ctx_aiohttp_session", mock_ctx_aiohttp_session
-        ):
+        with patch("utils.context.ctx_aiohttp_session", mock_ctx_aiohttp_session):
             result = await service.list_games(output_format="normal", limit=2)
 
         # Verify response structure for normal format
@@ -546,9 +534,7 @@ class TestMobyGamesServiceIntegration:
     @pytest.mark.vcr
     async def test_error_handling_real_api(self, service, mock_ctx_aiohttp_session):
         """Test error handling with real API calls."""
-        with patch(
-            "adapters.services.mobygames.ctx_aiohttp_session", mock_ctx_aiohttp_session
-        ):
+        with patch("utils.context.ctx_aiohttp_session", mock_ctx_aiohttp_session):
             with patch("adapters.services.mobygames.MOBYGAMES_API_KEY", "invalid_key"):
                 # This should handle the error gracefully
                 result = await service.list_games(game_id=INVALID_GAME_ID)
@@ -560,9 +546,7 @@ class TestMobyGamesServiceIntegration:
         self, service, mock_ctx_aiohttp_session
     ):
         """Test list_games with pagination using real API call."""
-        with patch(
-            "adapters.services.mobygames.ctx_aiohttp_session", mock_ctx_aiohttp_session
-        ):
+        with patch("utils.context.ctx_aiohttp_session", mock_ctx_aiohttp_session):
             result = await service.list_games(limit=2, offset=0)
 
         # Verify response structure
@@ -575,9 +559,7 @@ class TestMobyGamesServiceIntegration:
         self, service, mock_ctx_aiohttp_session
     ):
         """Test list_games with genre filter using real API call."""
-        with patch(
-            "adapters.services.mobygames.ctx_aiohttp_session", mock_ctx_aiohttp_session
-        ):
+        with patch("utils.context.ctx_aiohttp_session", mock_ctx_aiohttp_session):
             result = await service.list_games(genre_ids=[1], limit=3)  # Action genre
 
         # Verify response structure
@@ -630,7 +612,7 @@ class TestMobyGamesServicePerformance:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.mobygames.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://api.mobygames.com/v1/games", request_timeout=1
             )
@@ -724,7 +706,7 @@ class TestMobyGamesServiceEdgeCases:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.mobygames.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://api.mobygames.com/v1/games", request_timeout=30
             )
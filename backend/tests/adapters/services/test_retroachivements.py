@@ -67,9 +67,7 @@ class TestRetroAchievementsServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch(
-            "adapters.services.retroachievements.ctx_aiohttp_session", mock_context
-        ):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             with pytest.raises(HTTPException) as exc_info:
                 await service._request("https://retroachievements.org/API")
 
@@ -90,7 +88,7 @@ class TestRetroAchievementsServiceIntegration:
     ):
         """Test get_game_extended_details with real API call."""
         with patch(
-            "adapters.services.retroachievements.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_game_extended_details(1)
@@ -106,7 +104,7 @@ class TestRetroAchievementsServiceIntegration:
     async def test_get_game_list_real_api(self, service, mock_ctx_aiohttp_session):
         """Test get_game_list with real API call."""
         with patch(
-            "adapters.services.retroachievements.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_game_list(1, limit=5)
@@ -125,7 +123,7 @@ class TestRetroAchievementsServiceIntegration:
     ):
         """Test get_game_list with all options using real API call."""
         with patch(
-            "adapters.services.retroachievements.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_game_list(
@@ -147,7 +145,7 @@ class TestRetroAchievementsServiceIntegration:
     ):
         """Test get_user_completion_progress with real API call."""
         with patch(
-            "adapters.services.retroachievements.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_user_completion_progress("arcanecraeda", limit=5)
@@ -165,7 +163,7 @@ class TestRetroAchievementsServiceIntegration:
     ):
         """Test get_user_completion_progress with pagination using real API call."""
         with patch(
-            "adapters.services.retroachievements.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_user_completion_progress(
@@ -185,7 +183,7 @@ class TestRetroAchievementsServiceIntegration:
     ):
         """Test iter_user_completion_progress with real API call."""
         with patch(
-            "adapters.services.retroachievements.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             results = []
@@ -211,7 +209,7 @@ class TestRetroAchievementsServiceIntegration:
     ):
         """Test get_user_game_progress with real API call."""
         with patch(
-            "adapters.services.retroachievements.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_user_game_progress("Scott", 1)
@@ -228,7 +226,7 @@ class TestRetroAchievementsServiceIntegration:
     ):
         """Test get_user_game_progress with award metadata using real API call."""
         with patch(
-            "adapters.services.retroachievements.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_user_game_progress(
@@ -244,7 +242,7 @@ class TestRetroAchievementsServiceIntegration:
     async def test_error_handling_real_api(self, service, mock_ctx_aiohttp_session):
         """Test error handling with real API calls."""
         with patch(
-            "adapters.services.retroachievements.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             with patch(
@@ -133,7 +133,7 @@ class TestScreenScraperServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://api.screenscraper.fr/api2/jeuInfos.php"
             )
@@ -155,7 +155,7 @@ class TestScreenScraperServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             with pytest.raises(HTTPException) as exc_info:
                 await service._request("https://api.screenscraper.fr/api2/jeuInfos.php")
 
@@ -172,7 +172,7 @@ class TestScreenScraperServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             with pytest.raises(HTTPException) as exc_info:
                 await service._request("https://api.screenscraper.fr/api2/jeuInfos.php")
 
@@ -197,7 +197,7 @@ class TestScreenScraperServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://api.screenscraper.fr/api2/jeuInfos.php"
             )
@@ -219,7 +219,7 @@ class TestScreenScraperServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             with patch("asyncio.sleep") as mock_sleep:
                 result = await service._request(
                     "https://api.screenscraper.fr/api2/jeuInfos.php"
@@ -245,7 +245,7 @@ class TestScreenScraperServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://api.screenscraper.fr/api2/jeuInfos.php"
             )
@@ -265,7 +265,7 @@ class TestScreenScraperServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://api.screenscraper.fr/api2/jeuInfos.php"
             )
@@ -286,7 +286,7 @@ class TestScreenScraperServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://api.screenscraper.fr/api2/jeuInfos.php"
             )
@@ -570,7 +570,7 @@ class TestScreenScraperServiceIntegration:
     ):
         """Test get_game_info with CRC using real API call."""
         with patch(
-            "adapters.services.screenscraper.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_game_info(crc="abc123", system_id=1)
@@ -587,7 +587,7 @@ class TestScreenScraperServiceIntegration:
     ):
         """Test get_game_info with game ID using real API call."""
         with patch(
-            "adapters.services.screenscraper.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_game_info(game_id=1)
@@ -603,7 +603,7 @@ class TestScreenScraperServiceIntegration:
     async def test_search_games_real_api(self, service, mock_ctx_aiohttp_session):
         """Test search_games with real API call."""
         with patch(
-            "adapters.services.screenscraper.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.search_games(term="Mario")
@@ -622,7 +622,7 @@ class TestScreenScraperServiceIntegration:
     ):
         """Test search_games with system filter using real API call."""
         with patch(
-            "adapters.services.screenscraper.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.search_games(term="Sonic", system_id=1)
@@ -639,7 +639,7 @@ class TestScreenScraperServiceIntegration:
     async def test_error_handling_real_api(self, service, mock_ctx_aiohttp_session):
         """Test error handling with real API calls."""
         with patch(
-            "adapters.services.screenscraper.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             with patch(
@@ -665,7 +665,7 @@ class TestScreenScraperServiceIntegration:
     ):
         """Test get_game_info with non-existent game using real API call."""
         with patch(
-            "adapters.services.screenscraper.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_game_info(
@@ -682,7 +682,7 @@ class TestScreenScraperServiceIntegration:
     ):
         """Test search_games with term that returns no results using real API call."""
         with patch(
-            "adapters.services.screenscraper.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.search_games(term="ZZZNonexistentGameZZZ")
@@ -734,7 +734,7 @@ class TestScreenScraperServicePerformance:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://api.screenscraper.fr/api2/jeuInfos.php", request_timeout=1
             )
@@ -839,7 +839,7 @@ class TestScreenScraperServiceEdgeCases:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://api.screenscraper.fr/api2/jeuInfos.php", request_timeout=30
             )
@@ -865,7 +865,7 @@ class TestScreenScraperServiceEdgeCases:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.screenscraper.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             with pytest.raises(HTTPException) as exc_info:
                 await service._request("https://api.screenscraper.fr/api2/jeuInfos.php")
 
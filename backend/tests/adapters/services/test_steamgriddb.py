@@ -91,7 +91,7 @@ class TestSteamGridDBServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.steamgriddb.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://steamgriddb.com/api/v2/search/test"
             )
@@ -115,7 +115,7 @@ class TestSteamGridDBServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.steamgriddb.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             with pytest.raises(HTTPException) as exc_info:
                 await service._request("https://steamgriddb.com/api/v2/search/test")
             assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
@@ -134,7 +134,7 @@ class TestSteamGridDBServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.steamgriddb.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://steamgriddb.com/api/v2/search/test"
             )
@@ -153,7 +153,7 @@ class TestSteamGridDBServiceUnit:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.steamgriddb.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://steamgriddb.com/api/v2/search/test"
             )
@@ -544,7 +544,7 @@ class TestSteamGridDBServiceIntegration:
     async def test_search_games_real_api(self, service, mock_ctx_aiohttp_session):
         """Test search_games with real API call."""
         with patch(
-            "adapters.services.steamgriddb.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.search_games("Mario")
@@ -563,7 +563,7 @@ class TestSteamGridDBServiceIntegration:
     async def test_get_grids_for_game_real_api(self, service, mock_ctx_aiohttp_session):
         """Test get_grids_for_game with real API call."""
         with patch(
-            "adapters.services.steamgriddb.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_grids_for_game(1, limit=5)
@@ -589,7 +589,7 @@ class TestSteamGridDBServiceIntegration:
     ):
         """Test get_grids_for_game with filters using real API call."""
         with patch(
-            "adapters.services.steamgriddb.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.get_grids_for_game(
@@ -607,7 +607,7 @@ class TestSteamGridDBServiceIntegration:
     ):
         """Test iter_grids_for_game with real API call."""
         with patch(
-            "adapters.services.steamgriddb.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             results = []
@@ -631,7 +631,7 @@ class TestSteamGridDBServiceIntegration:
     async def test_error_handling_real_api(self, service, mock_ctx_aiohttp_session):
         """Test error handling with real API calls."""
         with patch(
-            "adapters.services.steamgriddb.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             with patch(
@@ -653,7 +653,7 @@ class TestSteamGridDBServiceIntegration:
     ):
         """Test search_games with term that returns no results using real API call."""
         with patch(
-            "adapters.services.steamgriddb.ctx_aiohttp_session",
+            "utils.context.ctx_aiohttp_session",
             mock_ctx_aiohttp_session,
         ):
             result = await service.search_games("ZZZNonexistentGameZZZ")
@@ -811,7 +811,7 @@ class TestSteamGridDBServiceEdgeCases:
         mock_context = MagicMock()
         mock_context.get.return_value = mock_session
 
-        with patch("adapters.services.steamgriddb.ctx_aiohttp_session", mock_context):
+        with patch("utils.context.ctx_aiohttp_session", mock_context):
             result = await service._request(
                 "https://steamgriddb.com/api/v2/search/test", request_timeout=30
             )
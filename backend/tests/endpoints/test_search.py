@@ -0,0 +1,45 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from endpoints.search import _iter_matched_roms
+
+
+async def test_iter_matched_roms_skips_failed_provider():
+    rom = MagicMock(platform_id=1)
+    failed_sources: set[str] = set()
+
+    with (
+        patch("endpoints.search.meta_igdb_handler") as igdb,
+        patch("endpoints.search.meta_moby_handler") as moby,
+        patch("endpoints.search.meta_ss_handler") as ss,
+        patch("endpoints.search.meta_sgdb_handler") as sgdb,
+    ):
+        igdb.get_matched_rom_by_id = AsyncMock(
+            return_value={"igdb_id": 1, "name": "Game"}
+        )
+        moby.get_matched_rom_by_id = AsyncMock(side_effect=RuntimeError("down"))
+        ss.get_matched_rom_by_id = AsyncMock(return_value=None)
+        sgdb.get_details_by_names = AsyncMock(
+            return_value={"sgdb_id": 2, "url_cover": "cover.png"}
+        )
+        for handler in (igdb, moby, ss):
+            handler.normalize_search_term.side_effect = lambda name, **_: name
+
+        results = [
+            matched_roms
+            async for matched_roms in _iter_matched_roms(
+                rom, "1", "id", asyncio.Event(), failed_sources
+            )
+        ]
+
+    assert failed_sources == {"moby"}
+    assert results[-1] == [
+        {
+            "igdb_id": 1,
+            "name": "Game",
+            "platform_id": 1,
+            "igdb_url_cover": "",
+            "sgdb_id": 2,
+            "sgdb_url_cover": "cover.png",
+        }
+    ]
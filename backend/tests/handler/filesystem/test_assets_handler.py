@@ -1,10 +1,15 @@
 import os
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
-from handler.filesystem.assets_handler import ASSETS_BASE_PATH, FSAssetsHandler
+from handler.filesystem.assets_handler import (
+    ASSET_THUMBNAIL_WIDTH,
+    ASSETS_BASE_PATH,
+    FSAssetsHandler,
+)
 from models.user import User
+from PIL import Image
 
 
 class TestFSAssetsHandler:
@@ -325,3 +330,67 @@ class TestFSAssetsHandler:
         assert emulator in saves_with_emulator
         assert emulator not in saves_without_emulator
         assert saves_with_emulator.startswith(saves_without_emulator)
+
+
+class TestAssetThumbnails:
+    """Test suite for the image asset thumbnails of FSAssetsHandler"""
+
+    SCREENSHOT_PATH = "users/557365723a31/screenshots/n64/1/screenshot.png"
+
+    @pytest.fixture
+    def handler(self, tmp_path: Path):
+        with patch("handler.filesystem.assets_handler.ASSETS_BASE_PATH", str(tmp_path)):
+            yield FSAssetsHandler()
+
+    def _store_screenshot(self, handler: FSAssetsHandler, size: tuple[int, int]):
+        screenshot_file = handler.base_path / self.SCREENSHOT_PATH
+        screenshot_file.parent.mkdir(parents=True, exist_ok=True)
+        Image.new("RGB", size, "blue").save(screenshot_file, format="PNG")
+        return screenshot_file
+
+    async def test_get_thumbnail_renders_scaled_down_webp(
+        self, handler: FSAssetsHandler
+    ):
+        self._store_screenshot(handler, (1280, 720))
+
+        thumbnail_path = await handler.get_thumbnail(self.SCREENSHOT_PATH)
+
+        assert thumbnail_path == f"thumbnails/{self.SCREENSHOT_PATH}.webp"
+        with Image.open(handler.base_path / thumbnail_path) as thumbnail:
+            assert thumbnail.format == "WEBP"
+            assert thumbnail.size == (ASSET_THUMBNAIL_WIDTH, 288)
+
+    async def test_get_thumbnail_rerenders_outdated_thumbnail(
+        self, handler: FSAssetsHandler
+    ):
+        screenshot_file = self._store_screenshot(handler, (1280, 720))
+        thumbnail_path = await handler.get_thumbnail(self.SCREENSHOT_PATH)
+        thumbnail_file = handler.base_path / thumbnail_path
+        thumbnail_mtime_ns = thumbnail_file.stat().st_mtime_ns
+
+        self._store_screenshot(handler, (320, 240))
+        os.utime(screenshot_file, ns=(thumbnail_mtime_ns + 1, thumbnail_mtime_ns + 1))
+        await handler.get_thumbnail(self.SCREENSHOT_PATH)
+
+        with Image.open(thumbnail_file) as thumbnail:
+            assert thumbnail.size == (320, 240)
+
+    async def test_get_thumbnail_missing_asset(self, handler: FSAssetsHandler):
+        with pytest.raises(FileNotFoundError):
+            await handler.get_thumbnail(self.SCREENSHOT_PATH)
+
+    async def test_get_thumbnail_of_thumbnail(self, handler: FSAssetsHandler):
+        self._store_screenshot(handler, (1280, 720))
+        thumbnail_path = await handler.get_thumbnail(self.SCREENSHOT_PATH)
+
+        with pytest.raises(ValueError):
+            await handler.get_thumbnail(thumbnail_path)
+
+    async def test_remove_thumbnail(self, handler: FSAssetsHandler):
+        self._store_screenshot(handler, (1280, 720))
+        thumbnail_path = await handler.get_thumbnail(self.SCREENSHOT_PATH)
+
+        await handler.remove_thumbnail(self.SCREENSHOT_PATH)
+        await handler.remove_thumbnail(self.SCREENSHOT_PATH)
+
+        assert not (handler.base_path / thumbnail_path).exists()
@@ -158,6 +158,23 @@ class TestFSHandler:
             assert "game.rom" in result
             assert "data.json" in result
 
+    async def test_get_file_lock_reuses_held_lock(self, handler: FSHandler):
+        """Test that callers of the same path share a lock while it is held"""
+        lock = await handler._get_file_lock("url:https://example.com/cover.png")
+
+        assert await handler._get_file_lock("url:https://example.com/cover.png") is lock
+        assert (
+            await handler._get_file_lock("url:https://example.com/other.png")
+            is not lock
+        )
+
+    async def test_get_file_lock_drops_released_lock(self, handler: FSHandler):
+        """Test that locks no caller holds anymore are not kept around"""
+        async with await handler._get_file_lock("render:cover.webp"):
+            assert "render:cover.webp" in handler._locks
+
+        assert "render:cover.webp" not in handler._locks
+
     async def test_make_directory(self, handler: FSHandler):
         """Test directory creation"""
         await handler.make_directory("test_dir")
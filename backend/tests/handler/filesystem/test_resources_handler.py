@@ -1,13 +1,29 @@
+import asyncio
+import base64
 import os
+import re
+from contextlib import asynccontextmanager
+from io import BytesIO
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from config import RESOURCES_BASE_PATH
 from handler.filesystem.base_handler import CoverSize
-from handler.filesystem.resources_handler import FSResourcesHandler
+from handler.filesystem.resources_handler import (
+    COVER_RENDITION_HEIGHTS,
+    RESIZED_IMAGE_WIDTHS,
+    RESIZED_IMAGES_PATH,
+    RESIZED_IMAGES_SIZE_KEY,
+    RESOURCE_URLS_KEY,
+    FSResourcesHandler,
+)
+from handler.redis_handler import async_cache
 from models.collection import Collection
 from models.rom import Rom
+from PIL import Image
+from utils.concurrency import LoopBoundSemaphore
+from utils.images import PLACEHOLDER_SIZE, ImageFormat, run_image_task
 
 
 class TestFSResourcesHandler:
@@ -70,42 +86,6 @@ class TestFSResourcesHandler:
         assert isinstance(small_exists, bool)
         assert isinstance(big_exists, bool)
 
-    def test_resize_cover_to_small_high_resolution(self, handler: FSResourcesHandler):
-        """Test resize_cover_to_small with high resolution image"""
-        # Create a mock image with high resolution
-        mock_image = Mock()
-        mock_image.height = 1500
-        mock_image.width = 1000
-        mock_image.resize.return_value = mock_image
-
-        save_path = "/tmp/test_small.png"
-
-        handler.resize_cover_to_small(mock_image, save_path)
-
-        # Should use 0.2 ratio for high resolution
-        expected_width = int(1000 * 0.2)
-        expected_height = int(1500 * 0.2)
-        mock_image.resize.assert_called_once_with((expected_width, expected_height))
-        mock_image.save.assert_called_once_with(save_path)
-
-    def test_resize_cover_to_small_low_resolution(self, handler: FSResourcesHandler):
-        """Test resize_cover_to_small with low resolution image"""
-        # Create a mock image with low resolution
-        mock_image = Mock()
-        mock_image.height = 800
-        mock_image.width = 600
-        mock_image.resize.return_value = mock_image
-
-        save_path = "/tmp/test_small.png"
-
-        handler.resize_cover_to_small(mock_image, save_path)
-
-        # Should use 0.4 ratio for low resolution
-        expected_width = int(600 * 0.4)
-        expected_height = int(800 * 0.4)
-        mock_image.resize.assert_called_once_with((expected_width, expected_height))
-        mock_image.save.assert_called_once_with(save_path)
-
     def test_get_cover_path_no_cover(self, handler: FSResourcesHandler, rom: Rom):
         """Test _get_cover_path when no cover exists"""
         result_small = handler._get_cover_path(rom, CoverSize.SMALL)
@@ -160,10 +140,23 @@ class TestFSResourcesHandler:
 
                 await handler.get_cover(rom, False, url)
 
-                # Should call _store_cover for both sizes since covers don't exist
-                assert mock_store.call_count == 2
-                mock_store.assert_any_call(rom, url, CoverSize.SMALL)
-                mock_store.assert_any_call(rom, url, CoverSize.BIG)
+                # Should store the cover since covers don't exist
+                mock_store.assert_called_once_with(rom, url)
+
+    @pytest.mark.asyncio
+    async def test_get_cover_with_url_existing_covers(
+        self, handler: FSResourcesHandler, rom
+    ):
+        """Test get_cover with URL but no overwrite when covers exist"""
+        url = "http://example.com/cover.png"
+
+        with patch.object(handler, "_store_cover") as mock_store:
+            with patch.object(handler, "cover_exists") as mock_exists:
+                mock_exists.return_value = True
+
+                await handler.get_cover(rom, False, url)
+
+                mock_store.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_cover_with_overwrite(
@@ -175,10 +168,8 @@ class TestFSResourcesHandler:
         with patch.object(handler, "_store_cover") as mock_store:
             await handler.get_cover(rom, True, url)
 
-            # Should call _store_cover for both sizes regardless of existence
-            assert mock_store.call_count == 2
-            mock_store.assert_any_call(rom, url, CoverSize.SMALL)
-            mock_store.assert_any_call(rom, url, CoverSize.BIG)
+            # Should store the cover regardless of existence
+            mock_store.assert_called_once_with(rom, url)
 
     async def test_remove_cover_no_entity(self, handler: FSResourcesHandler):
         """Test remove_cover with no entity"""
@@ -195,45 +186,6 @@ class TestFSResourcesHandler:
             mock_remove.assert_called_once_with(f"{rom.fs_resources_path}/cover")
             assert result == {"path_cover_s": "", "path_cover_l": ""}
 
-    async def test_build_artwork_path(self, handler: FSResourcesHandler, rom: Rom):
-        """Test build_artwork_path method"""
-        file_ext = "png"
-
-        with patch.object(handler, "make_directory") as mock_make_dir:
-            with patch.object(handler, "validate_path") as mock_validate:
-                mock_validate.side_effect = lambda x: Path(x)
-
-                path_cover_l, path_cover_s = await handler._build_artwork_path(
-                    rom, file_ext
-                )
-
-                expected_cover_path = f"{rom.fs_resources_path}/cover"
-                expected_big_path = f"{expected_cover_path}/big.{file_ext}"
-                expected_small_path = f"{expected_cover_path}/small.{file_ext}"
-
-                mock_make_dir.assert_called_once_with(expected_cover_path)
-                assert str(path_cover_l) == expected_big_path
-                assert str(path_cover_s) == expected_small_path
-
-    async def test_build_artwork_path_different_extensions(
-        self, handler: FSResourcesHandler, rom
-    ):
-        """Test build_artwork_path with different file extensions"""
-        extensions = ["png", "jpg", "jpeg", "gif", "webp"]
-
-        for ext in extensions:
-            with patch.object(handler, "make_directory"):
-                with patch.object(handler, "validate_path") as mock_validate:
-                    mock_validate.side_effect = lambda x: Path(x)
-
-                    path_cover_l, path_cover_s = await handler._build_artwork_path(
-                        rom, ext
-                    )
-
-                    # Check that the extension is properly included
-                    assert str(path_cover_l).endswith(f"big.{ext}")
-                    assert str(path_cover_s).endswith(f"small.{ext}")
-
     def test_get_screenshot_path(self, handler: FSResourcesHandler, rom: Rom):
         """Test _get_screenshot_path method"""
         idx = "0"
@@ -296,6 +248,39 @@ class TestFSResourcesHandler:
             ]
             assert result == expected_paths
 
+    @pytest.mark.asyncio
+    async def test_get_rom_screenshots_downloads_are_capped(
+        self, handler: FSResourcesHandler, rom
+    ):
+        """Test get_rom_screenshots downloads concurrently up to the download slots"""
+        handler.download_slots = LoopBoundSemaphore(2)
+        running = 0
+        max_running = 0
+
+        @asynccontextmanager
+        async def stream(method, url, **kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            yield MagicMock(status_code=404)
+
+        httpx_client = MagicMock()
+        httpx_client.stream = stream
+        urls = [f"http://example.com/screenshot{i}.jpg" for i in range(6)]
+
+        with patch(
+            "handler.filesystem.resources_handler.get_httpx_client",
+            return_value=httpx_client,
+        ):
+            result = await handler.get_rom_screenshots(rom, urls)
+
+        assert max_running == 2
+        assert result == [
+            f"{rom.fs_resources_path}/screenshots/{i}.jpg" for i in range(6)
+        ]
+
     def test_manual_exists_no_manual(self, handler: FSResourcesHandler, rom: Rom):
         """Test manual_exists when no manual exists"""
         assert not handler.manual_exists(rom)
@@ -484,3 +469,488 @@ class TestFSResourcesHandler:
         assert isinstance(ra_badges, str)
         assert "retroachievements" in ra_base
         assert "badges" in ra_badges
+
+
+class FakeResourceServer:
+    """Serve resources by URL with their ETag when set, recording the requests"""
+
+    def __init__(self):
+        self.contents: dict[str, bytes] = {}
+        self.etags: dict[str, str] = {}
+        self.downloaded: list[str] = []
+        self.not_modified: list[str] = []
+
+    @asynccontextmanager
+    async def stream(self, method, url, headers=None, **kwargs):
+        etag = self.etags.get(url)
+        if etag and (headers or {}).get("If-None-Match") == etag:
+            self.not_modified.append(url)
+            yield MagicMock(status_code=304, headers={})
+            return
+
+        self.downloaded.append(url)
+        content = self.contents[url]
+
+        async def aiter_raw():
+            yield content
+
+        yield MagicMock(
+            status_code=200,
+            aiter_raw=aiter_raw,
+            headers={"ETag": etag} if etag else {},
+        )
+
+
+class TestResourcesBlobStore:
+    """Test suite for the content-addressed blob store of FSResourcesHandler"""
+
+    @pytest.fixture
+    async def handler(self, tmp_path: Path):
+        await async_cache.delete(RESOURCE_URLS_KEY)
+        with patch(
+            "handler.filesystem.resources_handler.RESOURCES_BASE_PATH", str(tmp_path)
+        ):
+            yield FSResourcesHandler()
+
+    @pytest.fixture
+    def server(self):
+        server = FakeResourceServer()
+        httpx_client = MagicMock()
+        httpx_client.stream = server.stream
+        with patch(
+            "handler.filesystem.resources_handler.get_httpx_client",
+            return_value=httpx_client,
+        ):
+            yield server
+
+    async def test_fetch_blob_downloads_url_once(
+        self, handler: FSResourcesHandler, server: FakeResourceServer
+    ):
+        server.contents["http://example.com/cover.png"] = b"cover"
+
+        blob_paths = await asyncio.gather(
+            handler.fetch_blob("http://example.com/cover.png"),
+            handler.fetch_blob("http://example.com/cover.png"),
+        )
+
+        assert blob_paths[0] == blob_paths[1]
+        assert server.downloaded == ["http://example.com/cover.png"]
+        assert await handler.read_file(blob_paths[0]) == b"cover"
+
+    async def test_fetch_blob_skips_recently_checked_url(
+        self, handler: FSResourcesHandler, server: FakeResourceServer
+    ):
+        server.contents["http://example.com/cover.png"] = b"cover"
+        server.etags["http://example.com/cover.png"] = '"v1"'
+
+        await handler.fetch_blob("http://example.com/cover.png")
+        await handler.fetch_blob("http://example.com/cover.png")
+
+        assert server.downloaded == ["http://example.com/cover.png"]
+        assert server.not_modified == []
+
+    async def test_fetch_blob_revalidates_unchanged_url(
+        self, handler: FSResourcesHandler, server: FakeResourceServer
+    ):
+        server.contents["http://example.com/cover.png"] = b"cover"
+        server.etags["http://example.com/cover.png"] = '"v1"'
+
+        blob_path = await handler.fetch_blob("http://example.com/cover.png")
+        with patch(
+            "handler.filesystem.resources_handler.RESOURCE_REVALIDATE_INTERVAL", -1
+        ):
+            revalidated_blob_path = await handler.fetch_blob(
+                "http://example.com/cover.png"
+            )
+
+        assert revalidated_blob_path == blob_path
+        assert server.downloaded == ["http://example.com/cover.png"]
+        assert server.not_modified == ["http://example.com/cover.png"]
+
+    async def test_fetch_blob_downloads_changed_url(
+        self, handler: FSResourcesHandler, server: FakeResourceServer
+    ):
+        server.contents["http://example.com/cover.png"] = b"cover"
+        server.etags["http://example.com/cover.png"] = '"v1"'
+        blob_path = await handler.fetch_blob("http://example.com/cover.png")
+
+        server.contents["http://example.com/cover.png"] = b"new cover"
+        server.etags["http://example.com/cover.png"] = '"v2"'
+        with patch(
+            "handler.filesystem.resources_handler.RESOURCE_REVALIDATE_INTERVAL", -1
+        ):
+            new_blob_path = await handler.fetch_blob("http://example.com/cover.png")
+
+        assert new_blob_path != blob_path
+        assert await handler.read_file(new_blob_path) == b"new cover"
+
+    async def test_fetch_blob_without_validators_is_not_revalidated(
+        self, handler: FSResourcesHandler, server: FakeResourceServer
+    ):
+        server.contents["http://example.com/cover.png"] = b"cover"
+
+        await handler.fetch_blob("http://example.com/cover.png")
+        with patch(
+            "handler.filesystem.resources_handler.RESOURCE_REVALIDATE_INTERVAL", -1
+        ):
+            await handler.fetch_blob("http://example.com/cover.png")
+
+        assert server.downloaded == ["http://example.com/cover.png"]
+
+    async def test_fetch_blob_stores_identical_content_once(
+        self, handler: FSResourcesHandler, server: FakeResourceServer
+    ):
+        server.contents["http://example.com/us/badge.png"] = b"badge"
+        server.contents["http://example.com/eu/badge.png"] = b"badge"
+
+        blob_path = await handler.fetch_blob("http://example.com/us/badge.png")
+        other_blob_path = await handler.fetch_blob("http://example.com/eu/badge.png")
+
+        assert blob_path == other_blob_path
+        assert await handler.list_files(os.path.dirname(blob_path)) == [
+            os.path.basename(blob_path)
+        ]
+
+    async def test_fetch_blob_download_failed(self, handler: FSResourcesHandler):
+        @asynccontextmanager
+        async def stream(method, url, **kwargs):
+            yield MagicMock(status_code=404)
+
+        httpx_client = MagicMock()
+        httpx_client.stream = stream
+        with patch(
+            "handler.filesystem.resources_handler.get_httpx_client",
+            return_value=httpx_client,
+        ):
+            assert await handler.fetch_blob("http://example.com/missing.png") is None
+
+    async def test_roms_share_stored_screenshots(
+        self, handler: FSResourcesHandler, server: FakeResourceServer
+    ):
+        server.contents["http://example.com/screenshot.jpg"] = b"screenshot"
+        roms = [Mock(spec=Rom, fs_resources_path=f"roms/1/{id}") for id in (1, 2)]
+
+        for rom in roms:
+            await handler.get_rom_screenshots(
+                rom, ["http://example.com/screenshot.jpg"]
+            )
+
+        assert server.downloaded == ["http://example.com/screenshot.jpg"]
+        first, second = (
+            handler.validate_path(f"{rom.fs_resources_path}/screenshots/0.jpg")
+            for rom in roms
+        )
+        assert first.read_bytes() == b"screenshot"
+        assert await asyncio.to_thread(os.path.samefile, first, second)
+
+    async def test_get_cover_stores_renditions(
+        self, handler: FSResourcesHandler, server: FakeResourceServer
+    ):
+        cover = BytesIO()
+        Image.new("RGB", (1000, 1500), "red").save(cover, format="PNG")
+        server.contents["http://example.com/cover.png"] = cover.getvalue()
+        rom = Mock(spec=Rom, fs_resources_path="roms/1/1")
+
+        path_cover_s, path_cover_l = await handler.get_cover(
+            rom, True, "http://example.com/cover.png"
+        )
+
+        # Covers are named after a hash of their content
+        assert re.fullmatch(r"roms/1/1/cover/small\.[0-9a-f]{16}\.webp", path_cover_s)
+        assert re.fullmatch(r"roms/1/1/cover/big\.[0-9a-f]{16}\.webp", path_cover_l)
+        for size, height in COVER_RENDITION_HEIGHTS.items():
+            cover_path = handler._get_cover_path(rom, size)
+            assert cover_path is not None
+            with Image.open(handler.validate_path(cover_path)) as img:
+                assert img.format == "WEBP"
+                assert img.height == height
+
+    async def test_get_cover_replaces_previous_format(
+        self, handler: FSResourcesHandler, server: FakeResourceServer
+    ):
+        cover = BytesIO()
+        Image.new("RGB", (100, 150), "red").save(cover, format="PNG")
+        server.contents["http://example.com/cover.png"] = cover.getvalue()
+        rom = Mock(spec=Rom, fs_resources_path="roms/1/1")
+        await handler.write_file(b"old cover", "roms/1/1/cover", "small.png")
+
+        await handler.get_cover(rom, True, "http://example.com/cover.png")
+
+        cover_files = await handler.list_files("roms/1/1/cover")
+        assert [cover_file.split(".")[0] for cover_file in cover_files] == [
+            "big",
+            "small",
+            "thumb",
+        ]
+        assert all(cover_file.endswith(".webp") for cover_file in cover_files)
+
+    async def test_get_cover_overwrite_keeps_unchanged_files(
+        self, handler: FSResourcesHandler, server: FakeResourceServer
+    ):
+        cover = BytesIO()
+        Image.new("RGB", (100, 150), "red").save(cover, format="PNG")
+        server.contents["http://example.com/cover.png"] = cover.getvalue()
+        server.etags["http://example.com/cover.png"] = '"v1"'
+        rom = Mock(spec=Rom, fs_resources_path="roms/1/1")
+
+        path_cover_s, _ = await handler.get_cover(
+            rom, True, "http://example.com/cover.png"
+        )
+        assert path_cover_s is not None
+        cover_file = handler.validate_path(path_cover_s)
+        inode = cover_file.stat().st_ino
+        with patch(
+            "handler.filesystem.resources_handler.RESOURCE_REVALIDATE_INTERVAL", -1
+        ):
+            await handler.get_cover(rom, True, "http://example.com/cover.png")
+
+        assert server.downloaded == ["http://example.com/cover.png"]
+        assert cover_file.stat().st_ino == inode
+
+    async def test_store_artwork(self, handler: FSResourcesHandler):
+        rom = Mock(spec=Rom, fs_resources_path="roms/1/1")
+        artwork = BytesIO()
+        Image.new("RGBA", (100, 150), (0, 0, 255, 128)).save(artwork, format="PNG")
+
+        path_cover_l, path_cover_s = await handler.store_artwork(rom, artwork)
+
+        assert path_cover_l is not None and path_cover_s is not None
+        assert path_cover_l.startswith("roms/1/1/cover/big.")
+        assert path_cover_s.startswith("roms/1/1/cover/small.")
+        with Image.open(handler.validate_path(path_cover_s)) as img:
+            # Covers are never upscaled, and keep their transparency
+            assert img.size == (100, 150)
+            assert img.mode == "RGBA"
+
+    async def test_store_artwork_renames_changed_cover(
+        self, handler: FSResourcesHandler
+    ):
+        rom = Mock(spec=Rom, fs_resources_path="roms/1/1")
+        red_artwork, blue_artwork = BytesIO(), BytesIO()
+        Image.new("RGB", (100, 150), "red").save(red_artwork, format="PNG")
+        Image.new("RGB", (100, 150), "blue").save(blue_artwork, format="PNG")
+
+        _, red_path_cover_s = await handler.store_artwork(rom, red_artwork)
+        _, blue_path_cover_s = await handler.store_artwork(rom, blue_artwork)
+
+        assert red_path_cover_s is not None
+        assert blue_path_cover_s != red_path_cover_s
+        assert not handler.validate_path(red_path_cover_s).exists()
+        assert handler._get_cover_path(rom, CoverSize.SMALL) == blue_path_cover_s
+
+    async def test_store_artwork_invalid_image(self, handler: FSResourcesHandler):
+        rom = Mock(spec=Rom, fs_resources_path="roms/1/1")
+
+        result = await handler.store_artwork(rom, BytesIO(b"not an image"))
+
+        assert result == (None, None)
+
+    async def test_get_cover_placeholder(self, handler: FSResourcesHandler):
+        rom = Mock(spec=Rom, fs_resources_path="roms/1/1")
+        artwork = BytesIO()
+        Image.new("RGB", (1000, 1500), "red").save(artwork, format="PNG")
+        await handler.store_artwork(rom, artwork)
+
+        placeholder = await handler.get_cover_placeholder(rom)
+
+        assert placeholder is not None
+        prefix = "data:image/webp;base64,"
+        assert placeholder.startswith(prefix)
+        image_data = BytesIO(base64.b64decode(placeholder.removeprefix(prefix)))
+        with Image.open(image_data) as img:
+            assert max(img.size) == PLACEHOLDER_SIZE
+
+    async def test_get_cover_placeholder_no_cover(self, handler: FSResourcesHandler):
+        rom = Mock(spec=Rom, fs_resources_path="roms/1/1")
+
+        assert await handler.get_cover_placeholder(rom) is None
+
+
+class TestResizedImages:
+    """Test suite for the images resized on demand by FSResourcesHandler"""
+
+    @pytest.fixture
+    async def handler(self, tmp_path: Path):
+        await async_cache.delete(RESIZED_IMAGES_SIZE_KEY)
+        with patch(
+            "handler.filesystem.resources_handler.RESOURCES_BASE_PATH", str(tmp_path)
+        ):
+            handler = FSResourcesHandler()
+            image = BytesIO()
+            Image.new("RGB", (1000, 500), "red").save(image, format="PNG")
+            await handler.write_file(image.getvalue(), "roms/1/1/screenshots", "0.jpg")
+            yield handler
+
+    async def test_resizes_to_supported_width(self, handler: FSResourcesHandler):
+        resized_path = await handler.get_resized_image(
+            "roms/1/1/screenshots/0.jpg", 300, ImageFormat.WEBP
+        )
+
+        assert resized_path.startswith(RESIZED_IMAGES_PATH)
+        assert resized_path.endswith("_384.webp")
+        with Image.open(handler.validate_path(resized_path)) as img:
+            assert img.format == "WEBP"
+            assert img.size == (384, 192)
+
+    async def test_never_upscales(self, handler: FSResourcesHandler):
+        resized_path = await handler.get_resized_image(
+            "roms/1/1/screenshots/0.jpg", 2000, ImageFormat.JPEG
+        )
+
+        with Image.open(handler.validate_path(resized_path)) as img:
+            assert img.format == "JPEG"
+            assert img.size == (1000, 500)
+
+    async def test_caps_to_largest_width(self, handler: FSResourcesHandler):
+        # High density screens ask for more than the largest supported width
+        resized_path = await handler.get_resized_image(
+            "roms/1/1/screenshots/0.jpg", 2160, ImageFormat.WEBP
+        )
+
+        assert resized_path.endswith(f"_{RESIZED_IMAGE_WIDTHS[-1]}.webp")
+
+    async def test_reuses_cached_image(self, handler: FSResourcesHandler):
+        with patch(
+            "handler.filesystem.resources_handler.run_image_task",
+            wraps=run_image_task,
+        ) as mock_run:
+            first = await handler.get_resized_image(
+                "roms/1/1/screenshots/0.jpg", 256, ImageFormat.WEBP
+            )
+            second = await handler.get_resized_image(
+                "roms/1/1/screenshots/0.jpg", 256, ImageFormat.WEBP
+            )
+
+        assert first == second
+        assert mock_run.call_count == 1
+
+    async def test_missing_image(self, handler: FSResourcesHandler):
+        with pytest.raises(FileNotFoundError):
+            await handler.get_resized_image(
+                "roms/1/1/screenshots/1.jpg", 256, ImageFormat.WEBP
+            )
+
+    async def test_resized_image_is_not_resized_again(
+        self, handler: FSResourcesHandler
+    ):
+        resized_path = await handler.get_resized_image(
+            "roms/1/1/screenshots/0.jpg", 256, ImageFormat.WEBP
+        )
+
+        with pytest.raises(ValueError):
+            await handler.get_resized_image(resized_path, 128, ImageFormat.WEBP)
+
+    async def test_evicts_least_recently_used(self, handler: FSResourcesHandler):
+        first = await handler.get_resized_image(
+            "roms/1/1/screenshots/0.jpg", 256, ImageFormat.WEBP
+        )
+        first_file = handler.validate_path(first)
+        os.utime(first_file, (0, 0))
+
+        # The second image makes the cache exceed the size of the first one
+        with patch(
+            "handler.filesystem.resources_handler.RESIZED_IMAGES_MAX_SIZE",
+            first_file.stat().st_size,
+        ):
+            second = await handler.get_resized_image(
+                "roms/1/1/screenshots/0.jpg", 128, ImageFormat.WEBP
+            )
+
+        second_size = handler.validate_path(second).stat().st_size
+        assert not first_file.exists()
+        assert int(await async_cache.get(RESIZED_IMAGES_SIZE_KEY)) == second_size
+
+
+class TestCoverSprites:
+    """Test suite for the cover sprite sheets of FSResourcesHandler"""
+
+    @pytest.fixture
+    async def handler(self, tmp_path: Path):
+        await async_cache.delete(RESIZED_IMAGES_SIZE_KEY)
+        with patch(
+            "handler.filesystem.resources_handler.RESOURCES_BASE_PATH", str(tmp_path)
+        ):
+            yield FSResourcesHandler()
+
+    async def _store_cover(
+        self, handler: FSResourcesHandler, rom_id: int, size: tuple[int, int]
+    ) -> Rom:
+        rom = Mock(
+            spec=Rom, id=rom_id, fs_resources_path=f"roms/1/{rom_id}", path_cover_s=""
+        )
+        artwork = BytesIO()
+        Image.new("RGB", size, "red").save(artwork, format="PNG")
+        _, rom.path_cover_s = await handler.store_artwork(rom, artwork)
+        return rom
+
+    async def test_packs_covers_in_order(self, handler: FSResourcesHandler):
+        roms = [
+            await self._store_cover(handler, 1, (100, 150)),
+            await self._store_cover(handler, 2, (400, 200)),
+        ]
+
+        sprite = await handler.get_cover_sprite(roms, 64)
+
+        assert sprite is not None
+        # Covers are scaled to the tile width, tiles fit the largest cover
+        assert sprite["tiles"] == {
+            1: {"x": 0, "y": 0, "width": 64, "height": 96},
+            2: {"x": 64, "y": 0, "width": 64, "height": 32},
+        }
+        assert (sprite["width"], sprite["height"]) == (128, 96)
+        with Image.open(handler.validate_path(sprite["path"])) as img:
+            assert img.format == "WEBP"
+            assert img.size == (128, 96)
+
+    async def test_renders_wide_tiles_from_small_covers(
+        self, handler: FSResourcesHandler
+    ):
+        roms = [await self._store_cover(handler, 1, (600, 900))]
+
+        sprite = await handler.get_cover_sprite(roms, 256)
+
+        # The thumbnail rendition is only 128 pixels high
+        assert sprite is not None
+        assert sprite["tiles"] == {1: {"x": 0, "y": 0, "width": 256, "height": 384}}
+
+    async def test_rejects_unsupported_width(self, handler: FSResourcesHandler):
+        roms = [await self._store_cover(handler, 1, (100, 150))]
+
+        with pytest.raises(ValueError):
+            await handler.get_cover_sprite(roms, 100)
+
+    async def test_skips_roms_without_cover(self, handler: FSResourcesHandler):
+        rom = await self._store_cover(handler, 1, (100, 150))
+        no_cover = Mock(spec=Rom, id=2, fs_resources_path="roms/1/2", path_cover_s="")
+
+        sprite = await handler.get_cover_sprite([no_cover, rom], 64)
+
+        assert sprite is not None
+        assert list(sprite["tiles"]) == [1]
+        assert await handler.get_cover_sprite([no_cover], 64) is None
+
+    async def test_reuses_cached_sprite(self, handler: FSResourcesHandler):
+        roms = [await self._store_cover(handler, 1, (100, 150))]
+
+        with patch(
+            "handler.filesystem.resources_handler.run_image_task",
+            wraps=run_image_task,
+        ) as render:
+            sprite = await handler.get_cover_sprite(roms, 64)
+            cached_sprite = await handler.get_cover_sprite(roms, 64)
+            await handler.get_cover_sprite(roms, 128)
+
+        assert cached_sprite == sprite
+        # Sprite sheets of another width are rendered separately
+        assert render.call_count == 2
+
+    async def test_changed_cover_renders_new_sprite(self, handler: FSResourcesHandler):
+        roms = [await self._store_cover(handler, 1, (100, 150))]
+        sprite = await handler.get_cover_sprite(roms, 256)
+
+        roms = [await self._store_cover(handler, 1, (150, 100))]
+        new_sprite = await handler.get_cover_sprite(roms, 256)
+
+        assert sprite is not None and new_sprite is not None
+        assert new_sprite["path"] != sprite["path"]
+        assert new_sprite["tiles"][1]["width"] == 150
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import re
 from unittest.mock import AsyncMock, patch
@@ -20,6 +21,7 @@ from handler.metadata.base_hander import (
     MetadataHandler,
     UniversalPlatformSlug,
     _normalize_search_term,
+    fixture_index_cache,
 )
 from handler.redis_handler import async_cache
 
@@ -102,7 +104,9 @@ class TestMetadataHandlerMethods:
 
     @pytest.fixture
     def handler(self):
-        return MetadataHandler()
+        fixture_index_cache.clear()
+        yield MetadataHandler()
+        fixture_index_cache.clear()
 
     def test_normalize_cover_url_with_url(self, handler: MetadataHandler):
         """Test URL normalization with valid URL."""
@@ -131,6 +135,35 @@ class TestMetadataHandlerMethods:
             mock_func.assert_called_once_with("Test Game", True, False)
             assert result == "normalized"
 
+    def test_find_best_match(self, handler: MetadataHandler):
+        """Test finding the best match among candidates."""
+        result = handler.find_best_match(
+            "The Legend of Zelda", ["Zelda II", "Legend of Zelda, The", "Metroid"]
+        )
+        assert result == ("Legend of Zelda, The", 1.0)
+
+    def test_find_best_match_below_threshold(self, handler: MetadataHandler):
+        """Test no match is returned below the minimum similarity score."""
+        assert handler.find_best_match("Metroid", ["Castlevania"]) == (None, 0.0)
+        assert handler.find_best_match("Metroid", []) == (None, 0.0)
+
+    def test_find_best_match_split_game_name(self, handler: MetadataHandler):
+        """Test matching against the last part of split candidate names."""
+        result = handler.find_best_match(
+            "Ocarina of Time",
+            ["The Legend of Zelda: Ocarina of Time"],
+            split_game_name=True,
+        )
+        assert result == ("The Legend of Zelda: Ocarina of Time", 1.0)
+
+    def test_find_best_match_first_of_ties(self, handler: MetadataHandler):
+        """Test the first of equally scored candidates is returned."""
+        result = handler.find_best_match(
+            "Super Mario Bros.",
+            ["Mario Kart 64", "Super Mario Bros", "Super Mario Bros."],
+        )
+        assert result == ("Super Mario Bros", 1.0)
+
     @pytest.mark.asyncio
     async def test_ps2_opl_format_found(self, handler: MetadataHandler):
         """Test PS2 OPL format when serial is found."""
@@ -239,11 +272,10 @@ class TestMetadataHandlerMethods:
     @pytest.mark.asyncio
     async def test_switch_titledb_format_cache_exists(self, handler: MetadataHandler):
         """Test Switch TitleDB format when cache exists."""
-        with patch.object(
-            async_cache, "exists", new_callable=AsyncMock
-        ) as mock_exists, patch.object(
-            async_cache, "hget", new_callable=AsyncMock
-        ) as mock_hget:
+        with (
+            patch.object(async_cache, "exists", new_callable=AsyncMock) as mock_exists,
+            patch.object(async_cache, "hget", new_callable=AsyncMock) as mock_hget,
+        ):
 
             mock_exists.return_value = True
             mock_hget.return_value = json.dumps(
@@ -266,13 +298,13 @@ class TestMetadataHandlerMethods:
         self, handler: MetadataHandler
     ):
         """Test Switch TitleDB format when cache is missing but fetch succeeds."""
-        with patch.object(
-            async_cache, "exists", new_callable=AsyncMock
-        ) as mock_exists, patch.object(
-            async_cache, "hget", new_callable=AsyncMock
-        ) as mock_hget, patch(
-            "handler.metadata.base_hander.update_switch_titledb_task"
-        ) as mock_task:
+        with (
+            patch.object(async_cache, "exists", new_callable=AsyncMock) as mock_exists,
+            patch.object(async_cache, "hget", new_callable=AsyncMock) as mock_hget,
+            patch(
+                "handler.metadata.base_hander.update_switch_titledb_task"
+            ) as mock_task,
+        ):
 
             # First call returns False (cache missing), second returns True (after fetch)
             mock_exists.side_effect = [False, True]
@@ -291,13 +323,13 @@ class TestMetadataHandlerMethods:
         self, handler: MetadataHandler
     ):
         """Test Switch TitleDB format when cache is missing and fetch fails."""
-        with patch.object(
-            async_cache, "exists", new_callable=AsyncMock
-        ) as mock_exists, patch(
-            "handler.metadata.base_hander.update_switch_titledb_task"
-        ) as mock_task, patch(
-            "handler.metadata.base_hander.log"
-        ) as mock_log:
+        with (
+            patch.object(async_cache, "exists", new_callable=AsyncMock) as mock_exists,
+            patch(
+                "handler.metadata.base_hander.update_switch_titledb_task"
+            ) as mock_task,
+            patch("handler.metadata.base_hander.log") as mock_log,
+        ):
 
             mock_exists.return_value = False  # Cache always missing
             mock_task.run = AsyncMock()
@@ -312,11 +344,10 @@ class TestMetadataHandlerMethods:
     @pytest.mark.asyncio
     async def test_switch_titledb_format_not_found(self, handler: MetadataHandler):
         """Test Switch TitleDB format when title ID not found."""
-        with patch.object(
-            async_cache, "exists", new_callable=AsyncMock
-        ) as mock_exists, patch.object(
-            async_cache, "hget", new_callable=AsyncMock
-        ) as mock_hget:
+        with (
+            patch.object(async_cache, "exists", new_callable=AsyncMock) as mock_exists,
+            patch.object(async_cache, "hget", new_callable=AsyncMock) as mock_hget,
+        ):
 
             mock_exists.return_value = True
             mock_hget.return_value = None
@@ -330,25 +361,49 @@ class TestMetadataHandlerMethods:
     @pytest.mark.asyncio
     async def test_switch_productid_format_found(self, handler: MetadataHandler):
         """Test Switch Product ID format when found."""
-        with patch.object(
-            async_cache, "exists", new_callable=AsyncMock
-        ) as mock_exists, patch.object(
-            async_cache, "hget", new_callable=AsyncMock
-        ) as mock_hget:
+        with (
+            patch.object(async_cache, "exists", new_callable=AsyncMock) as mock_exists,
+            patch.object(async_cache, "hget", new_callable=AsyncMock) as mock_hget,
+        ):
             mock_exists.return_value = True
-            mock_hget.return_value = json.dumps({"name": "Product Game"})
+            mock_hget.side_effect = [
+                "70123456789012",
+                json.dumps({"name": "Product Game"}),
+            ]
 
             match = re.match(SWITCH_PRODUCT_ID_REGEX, "0100ABC123456789")
             assert match is not None
             result = await handler._switch_productid_format(match, "original")
 
             # Check that bitmask 0x800 was cleared (ABC -> AB0)
-            mock_hget.assert_called_once_with(
-                "romm:switch_product_id",  # SWITCH_PRODUCT_ID_KEY
+            mock_hget.assert_any_call(
+                "romm:switch_product_ids",  # SWITCH_PRODUCT_ID_KEY
                 "0100ABC123456089",
             )
+            # The product ID index references the TitleDB entry
+            mock_hget.assert_called_with(
+                "romm:switch_titledb",  # SWITCH_TITLEDB_INDEX_KEY
+                "70123456789012",
+            )
             assert result[0] == "Product Game"
 
+    @pytest.mark.asyncio
+    async def test_switch_productid_format_not_found(self, handler: MetadataHandler):
+        """Test Switch Product ID format when product ID not found."""
+        with (
+            patch.object(async_cache, "exists", new_callable=AsyncMock) as mock_exists,
+            patch.object(async_cache, "hget", new_callable=AsyncMock) as mock_hget,
+        ):
+            mock_exists.return_value = True
+            mock_hget.return_value = None
+
+            match = re.match(SWITCH_PRODUCT_ID_REGEX, "0100ABC123456789")
+            assert match is not None
+            result = await handler._switch_productid_format(match, "original")
+
+            mock_hget.assert_called_once()
+            assert result == ("original", None)
+
     @pytest.mark.asyncio
     async def test_mame_format_found(self, handler: MetadataHandler):
         """Test MAME format when entry is found."""
@@ -381,6 +436,103 @@ class TestMetadataHandlerMethods:
 
             assert result == "test_rom"
 
+    @pytest.mark.asyncio
+    async def test_prefetch_fixture_indexes_switch(self, handler: MetadataHandler):
+        """Test prefetching resolves product IDs to TitleDB entries in bulk."""
+        with (
+            patch.object(async_cache, "hmget", new_callable=AsyncMock) as mock_hmget,
+            patch.object(async_cache, "hget", new_callable=AsyncMock) as mock_hget,
+        ):
+            mock_hmget.side_effect = [
+                ["70123456789012"],
+                [None, json.dumps({"name": "Product Game"})],
+            ]
+
+            await handler.prefetch_fixture_indexes(
+                UniversalPlatformSlug.SWITCH,
+                ["Game [70999999999999].nsp", "Update [0100ABC123456800].nsp"],
+            )
+
+            mock_hmget.assert_any_call("romm:switch_product_ids", ("0100ABC123456000",))
+            mock_hmget.assert_called_with(
+                "romm:switch_titledb", ("70999999999999", "70123456789012")
+            )
+
+            match = re.search(SWITCH_PRODUCT_ID_REGEX, "0100ABC123456800")
+            assert match is not None
+            with patch.object(
+                async_cache, "exists", new_callable=AsyncMock
+            ) as mock_exists:
+                mock_exists.return_value = True
+                result = await handler._switch_productid_format(match, "original")
+
+            mock_hget.assert_not_called()
+            assert result[0] == "Product Game"
+
+    @pytest.mark.asyncio
+    async def test_prefetch_fixture_indexes_other_platform(
+        self, handler: MetadataHandler
+    ):
+        """Test prefetching skips platforms without fixture indexes."""
+        with patch.object(async_cache, "hmget", new_callable=AsyncMock) as mock_hmget:
+            await handler.prefetch_fixture_indexes(
+                UniversalPlatformSlug.N64, ["SLUS-12345 Game.z64"]
+            )
+
+            mock_hmget.assert_not_called()
+
+    async def test_search_variants_sequential(self, handler: MetadataHandler):
+        """Test variants are searched in order until one matches."""
+        search = AsyncMock(side_effect=[(None, 0.0), ("Game", 0.8), ("Other", 1.0)])
+
+        result = await handler.search_variants(
+            search, [("a", False), ("b", True), ("c", False)]
+        )
+
+        assert result == "Game"
+        assert search.await_count == 2
+
+    async def test_search_variants_speculative_best_score(
+        self, handler: MetadataHandler
+    ):
+        """Test speculative search returns the best scoring match of all variants."""
+        scores = {"a": ("Game A", 0.8), "b": ("Game B", 0.9), "c": (None, 0.0)}
+
+        async def search(term: str, split_game_name: bool):
+            return scores[term]
+
+        with patch("handler.metadata.base_hander.METADATA_SPECULATIVE_SEARCH", True):
+            result = await handler.search_variants(
+                search, [("a", False), ("b", True), ("c", False)]
+            )
+
+        assert result == "Game B"
+
+    async def test_search_variants_speculative_perfect_match_cancels(
+        self, handler: MetadataHandler
+    ):
+        """Test pending searches are cancelled once a perfect match is found."""
+        cancelled = []
+
+        async def search(term: str, split_game_name: bool):
+            if term == "slow":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(term)
+                    raise
+                return "Slow Game", 0.9
+            return "Game", 1.0
+
+        with patch("handler.metadata.base_hander.METADATA_SPECULATIVE_SEARCH", True):
+            result = await asyncio.wait_for(
+                handler.search_variants(search, [("slow", False), ("fast", True)]),
+                timeout=5,
+            )
+
+        assert result == "Game"
+        assert cancelled == ["slow"]
+
     def test_mask_sensitive_values_authorization_bearer(self, handler: MetadataHandler):
         """Test masking Bearer token in Authorization header."""
         values = {"Authorization": "Bearer abc123def456ghi789"}
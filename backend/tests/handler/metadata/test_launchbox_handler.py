@@ -0,0 +1,80 @@
+import pytest
+from handler.metadata.launchbox_handler import LaunchboxHandler
+from handler.redis_handler import async_cache
+from tasks.scheduled.update_launchbox_metadata import (
+    LAUNCHBOX_METADATA_DATABASE_ID_KEY,
+    LAUNCHBOX_METADATA_NAME_KEY,
+    LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY,
+    encode_launchbox_game,
+)
+from utils.cache import get_generation_key
+
+PLATFORM_TITLES_KEY = f"{LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY}:Nintendo 64"
+KEYS = (
+    LAUNCHBOX_METADATA_DATABASE_ID_KEY,
+    LAUNCHBOX_METADATA_NAME_KEY,
+    PLATFORM_TITLES_KEY,
+    get_generation_key(LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY),
+)
+
+
+@pytest.fixture
+async def handler():
+    await async_cache.delete(*KEYS)
+    await async_cache.hset(
+        LAUNCHBOX_METADATA_NAME_KEY,
+        mapping={"Super Mario 64:Nintendo 64": "12345"},
+    )
+    await async_cache.hset(
+        PLATFORM_TITLES_KEY,
+        mapping={
+            "Super Mario 64": "12345",
+            "Mario Kart 64": "67890",
+            "Super Mario 64 (USA)": "12345",
+        },
+    )
+    await async_cache.hset(
+        LAUNCHBOX_METADATA_DATABASE_ID_KEY,
+        mapping={
+            "12345": encode_launchbox_game(
+                {"DatabaseID": "12345", "Name": "Super Mario 64"}
+            ),
+            "67890": encode_launchbox_game(
+                {"DatabaseID": "67890", "Name": "Mario Kart 64"}
+            ),
+        },
+    )
+    yield LaunchboxHandler()
+    await async_cache.delete(*KEYS)
+
+
+class TestLaunchboxHandlerFuzzyMatch:
+    """Test resolving LaunchBox games through the fuzzy title index."""
+
+    async def test_exact_match(self, handler: LaunchboxHandler):
+        game = await handler._get_rom_from_metadata("Super Mario 64", "n64")
+        assert game is not None
+        assert game["DatabaseID"] == "12345"
+
+    async def test_fuzzy_match(self, handler: LaunchboxHandler):
+        game = await handler._get_rom_from_metadata("Mario Kart_64", "n64")
+        assert game is not None
+        assert game["Name"] == "Mario Kart 64"
+
+    async def test_fuzzy_match_below_threshold(self, handler: LaunchboxHandler):
+        assert await handler._get_rom_from_metadata("Wave Race", "n64") is None
+
+    async def test_title_index_rebuilt_on_new_generation(
+        self, handler: LaunchboxHandler
+    ):
+        title_index, _ = await handler._get_title_index("Nintendo 64")
+        assert (await handler._get_title_index("Nintendo 64"))[0] is title_index
+
+        await async_cache.hset(PLATFORM_TITLES_KEY, "Wave Race 64", "11111")
+        await async_cache.incr(
+            get_generation_key(LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY)
+        )
+
+        title_index, title_ids = await handler._get_title_index("Nintendo 64")
+        assert len(title_index) == 4
+        assert title_ids["Wave Race 64"] == "11111"
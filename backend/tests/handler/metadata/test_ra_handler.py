@@ -0,0 +1,113 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from handler.metadata.ra_handler import RAHandler
+from handler.redis_handler import async_cache
+
+PLATFORM_ID = 999
+
+
+@pytest.fixture
+async def handler():
+    handler = RAHandler()
+    await async_cache.delete(handler._get_hashes_index_key(PLATFORM_ID))
+    yield handler
+    await async_cache.delete(handler._get_hashes_index_key(PLATFORM_ID))
+
+
+@pytest.fixture
+def rom():
+    rom = MagicMock()
+    rom.platform.id = PLATFORM_ID
+    rom.platform.ra_id = 4
+    return rom
+
+
+@pytest.fixture
+def game_list():
+    return [
+        {"ID": 1, "Title": "Game One", "Hashes": ["ABCDEF", "123456"]},
+        {"ID": 2, "Title": "Game Two", "Hashes": ["fedcba"]},
+        {"ID": 3, "Title": "Game Three", "Hashes": []},
+    ]
+
+
+class TestRAHandlerHashesIndex:
+    """Test the per-platform RetroAchievements hashes index."""
+
+    async def test_build_hashes_index(self, handler: RAHandler, game_list):
+        await handler._build_hashes_index(PLATFORM_ID, game_list, ttl=60)
+
+        index_key = handler._get_hashes_index_key(PLATFORM_ID)
+        assert await async_cache.hlen(index_key) == 4
+        assert await async_cache.ttl(index_key) > 0
+
+    async def test_search_rom_is_case_insensitive(
+        self, handler: RAHandler, rom, game_list
+    ):
+        await handler._build_hashes_index(PLATFORM_ID, game_list, ttl=60)
+
+        result = await handler._search_rom(rom, "abcdef")
+        assert result == {"ID": 1, "Title": "Game One"}
+
+        result = await handler._search_rom(rom, "FEDCBA")
+        assert result == {"ID": 2, "Title": "Game Two"}
+
+    async def test_search_rom_not_found(self, handler: RAHandler, rom, game_list):
+        await handler._build_hashes_index(PLATFORM_ID, game_list, ttl=60)
+
+        assert await handler._search_rom(rom, "000000") is None
+
+    async def test_search_rom_without_ra_id(self, handler: RAHandler, rom):
+        rom.platform.ra_id = None
+
+        assert await handler._search_rom(rom, "abcdef") is None
+
+    async def test_search_rom_builds_index_once(
+        self, handler: RAHandler, rom, game_list
+    ):
+        with (
+            patch.object(
+                handler,
+                "_seconds_since_last_cache_file_update",
+                AsyncMock(return_value=10**9),
+            ),
+            patch.object(
+                handler.ra_service,
+                "get_game_list",
+                AsyncMock(return_value=game_list),
+            ) as mock_get_game_list,
+            patch(
+                "handler.metadata.ra_handler.fs_resource_handler.write_file",
+                AsyncMock(),
+            ),
+        ):
+            assert (await handler._search_rom(rom, "123456"))["ID"] == 1
+            assert (await handler._search_rom(rom, "fedcba"))["ID"] == 2
+            assert await handler._search_rom(rom, "000000") is None
+
+        mock_get_game_list.assert_called_once()
+
+    async def test_empty_platform_is_indexed(self, handler: RAHandler, rom):
+        await handler._build_hashes_index(PLATFORM_ID, [], ttl=60)
+
+        with patch.object(handler, "_refresh_hashes_index") as mock_refresh:
+            assert await handler._search_rom(rom, "abcdef") is None
+
+        mock_refresh.assert_not_called()
+
+
+def test_index_locks_usable_from_different_event_loops():
+    # Tasks share the handler singleton, but each run their own event loop
+    handler = RAHandler()
+
+    async def contend():
+        async def hold():
+            async with handler._index_locks[PLATFORM_ID]:
+                await asyncio.sleep(0)
+
+        await asyncio.gather(hold(), hold())
+
+    asyncio.run(contend())
+    asyncio.run(contend())
@@ -0,0 +1,138 @@
+import asyncio
+import gc
+import warnings
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from handler.metadata.sgdb_handler import SGDB_MAX_CONCURRENT_LOOKUPS, SGDBBaseHandler
+
+# Search results by normalized search term
+GAMES = {
+    "super mario 64": [{"id": 1, "name": "Super Mario 64"}],
+    "mario kart 64": [{"id": 2, "name": "Mario Kart 64"}],
+}
+
+
+def _grid(url: str) -> dict:
+    return {"url": url, "thumb": url}
+
+
+@pytest.fixture
+def handler():
+    handler = SGDBBaseHandler()
+    handler.sgdb_service = MagicMock()
+    handler.sgdb_service.search_games = AsyncMock(
+        side_effect=lambda term: GAMES.get(term, [])
+    )
+
+    async def iter_grids_for_game(game_id: int, **kwargs):
+        yield _grid(f"https://cdn.steamgriddb.com/grid/{game_id}.png")
+
+    handler.sgdb_service.iter_grids_for_game = iter_grids_for_game
+
+    with patch("handler.metadata.sgdb_handler.STEAMGRIDDB_API_ENABLED", True):
+        yield handler
+
+
+class TestGetDetailsByNames:
+    async def test_returns_first_name_with_a_match(self, handler: SGDBBaseHandler):
+        result = await handler.get_details_by_names(
+            ["Unknown Game", "Mario Kart 64", "Super Mario 64"]
+        )
+
+        assert result == {
+            "sgdb_id": 2,
+            "url_cover": "https://cdn.steamgriddb.com/grid/2.png",
+        }
+
+    async def test_no_match(self, handler: SGDBBaseHandler):
+        result = await handler.get_details_by_names(["Unknown Game"])
+
+        assert result == {"sgdb_id": None}
+
+    async def test_stops_at_first_page_with_a_cover(self, handler: SGDBBaseHandler):
+        pages_fetched = 0
+
+        async def iter_grids_for_game(game_id: int, **kwargs):
+            nonlocal pages_fetched
+            for page in range(3):
+                pages_fetched += 1
+                yield _grid(f"https://cdn.steamgriddb.com/grid/{game_id}-{page}.png")
+
+        handler.sgdb_service.iter_grids_for_game = iter_grids_for_game
+
+        result = await handler.get_details_by_names(["Super Mario 64"])
+
+        assert result["url_cover"] == "https://cdn.steamgriddb.com/grid/1-0.png"
+        assert pages_fetched == 1
+
+    async def test_cancels_lookups_after_first_match(self, handler: SGDBBaseHandler):
+        cancelled = []
+
+        async def search_games(term: str):
+            if term == "mario kart 64":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(term)
+                    raise
+            return GAMES.get(term, [])
+
+        handler.sgdb_service.search_games = search_games
+
+        result = await asyncio.wait_for(
+            handler.get_details_by_names(["Super Mario 64", "Mario Kart 64"]),
+            timeout=5,
+        )
+
+        assert result["sgdb_id"] == 1
+        assert cancelled == ["mario kart 64"]
+
+    async def test_cancelled_queued_lookups_leave_no_coroutine(
+        self, handler: SGDBBaseHandler
+    ):
+        async def search_games(term: str):
+            if term not in GAMES:
+                await asyncio.sleep(10)
+            return GAMES.get(term, [])
+
+        handler.sgdb_service.search_games = search_games
+        # Lookups beyond the concurrency cap wait for a slot, and get cancelled
+        names = ["Super Mario 64"] + [
+            f"Unknown Game {i}" for i in range(SGDB_MAX_CONCURRENT_LOOKUPS * 2)
+        ]
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = await asyncio.wait_for(
+                handler.get_details_by_names(names), timeout=5
+            )
+            # Let the cancelled tasks finish, and free their coroutines
+            await asyncio.sleep(0)
+            gc.collect()
+
+        assert result["sgdb_id"] == 1
+        assert not [w for w in caught if issubclass(w.category, RuntimeWarning)]
+
+    async def test_concurrency_is_capped(self, handler: SGDBBaseHandler):
+        running = 0
+        max_running = 0
+
+        async def search_games(term: str):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return []
+
+        handler.sgdb_service.search_games = search_games
+
+        await asyncio.gather(
+            *(
+                handler.get_details_by_names([f"Game {i}", f"Other Game {i}"])
+                for i in range(SGDB_MAX_CONCURRENT_LOOKUPS * 2)
+            )
+        )
+
+        assert max_running == SGDB_MAX_CONCURRENT_LOOKUPS
@@ -1,5 +1,6 @@
 from handler.auth import auth_handler
 from handler.database import (
+    db_collection_handler,
     db_platform_handler,
     db_rom_handler,
     db_save_handler,
@@ -8,10 +9,12 @@ from handler.database import (
     db_user_handler,
 )
 from models.assets import Save, Screenshot, State
+from models.collection import SmartCollection
 from models.platform import Platform
 from models.rom import Rom
 from models.user import Role, User
 from sqlalchemy.exc import IntegrityError
+from utils.filesystem import get_resource_url
 
 
 def test_platforms():
@@ -69,6 +72,32 @@ def test_roms(rom: Rom, platform: Platform):
     assert len(roms) == 1
 
 
+def test_rom_cover_change_updates_smart_collections(rom: Rom, admin_user: User):
+    smart_collection = db_collection_handler.add_smart_collection(
+        SmartCollection(
+            name="test_smart_collection",
+            user_id=admin_user.id,
+            filter_criteria={},
+            rom_ids=[rom.id],
+        )
+    )
+
+    small_cover = f"{rom.fs_resources_path}/cover/small.0123456789abcdef.webp"
+    big_cover = f"{rom.fs_resources_path}/cover/big.0123456789abcdef.webp"
+    db_rom_handler.update_rom(
+        rom.id, {"path_cover_s": small_cover, "path_cover_l": big_cover}
+    )
+
+    smart_collection = db_collection_handler.get_smart_collection(smart_collection.id)
+    assert smart_collection is not None
+    assert smart_collection.path_covers_small == [
+        get_resource_url(small_cover, smart_collection.updated_at)
+    ]
+    assert smart_collection.path_covers_large == [
+        get_resource_url(big_cover, smart_collection.updated_at)
+    ]
+
+
 def test_users(admin_user):
     db_user_handler.add_user(
         User(
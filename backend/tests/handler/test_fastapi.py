@@ -1,4 +1,7 @@
+from unittest.mock import AsyncMock, patch
+
 import pytest
+from handler.metadata.igdb_handler import IGDBRom
 from handler.scan_handler import MetadataSource, ScanType, scan_platform, scan_rom
 from models.platform import Platform
 from models.rom import Rom, RomFile
@@ -69,3 +72,55 @@ async def test_scan_rom():
     assert rom.fs_size_bytes == 1024
     assert rom.tags == []
     assert not rom.multi
+
+
+async def test_scan_rom_with_dat_match():
+    platform = Platform(fs_slug="n64", slug="n64", igdb_id=4, hasheous_id=1)
+    rom = Rom(fs_name="sm64.z64", fs_size_bytes=1024, tags=[], multi=False)
+
+    with (
+        patch(
+            "handler.scan_handler.meta_dat_handler.lookup_rom",
+            AsyncMock(
+                return_value={
+                    "name": "Super Mario 64 (USA)",
+                    "dat_set": "Nintendo - Nintendo 64 (BigEndian)",
+                }
+            ),
+        ),
+        patch("handler.scan_handler.meta_playmatch_handler.lookup_rom") as playmatch,
+        patch("handler.scan_handler.meta_hasheous_handler.lookup_rom") as hasheous,
+        patch(
+            "handler.scan_handler.meta_igdb_handler.get_rom",
+            AsyncMock(return_value=IGDBRom(igdb_id=None)),
+        ) as igdb_get_rom,
+    ):
+        await scan_rom(
+            platform=platform,
+            scan_type=ScanType.QUICK,
+            rom=rom,
+            fs_rom={
+                "fs_name": "sm64.z64",
+                "multi": False,
+                "files": [
+                    RomFile(
+                        file_name="sm64.z64",
+                        file_path="n64",
+                        file_size_bytes=1024,
+                        last_modified=1620000000,
+                        crc_hash="3ce60709",
+                    )
+                ],
+                "crc_hash": "3ce60709",
+                "md5_hash": "",
+                "sha1_hash": "",
+                "ra_hash": "",
+            },
+            metadata_sources=[MetadataSource.IGDB, MetadataSource.HASHEOUS],
+            newly_added=True,
+        )
+
+    # The DAT match stands in for the network hash lookups
+    playmatch.assert_not_called()
+    hasheous.assert_not_called()
+    assert igdb_get_rom.await_args.args[0] == "Super Mario 64 (USA).z64"
@@ -0,0 +1,133 @@
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+from tasks.manual.cleanup_orphaned_resources import (
+    ORPHANED_BLOB_MIN_AGE,
+    CleanupOrphanedResourcesTask,
+)
+
+
+def _write_file(path, content: bytes = b"resource", age: int = 0) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    if age:
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def resources_path(tmp_path):
+    # Platform 1 with rom 10, platform 2 without roms
+    _write_file(tmp_path / "roms" / "1" / "10" / "cover" / "small.webp")
+    _write_file(tmp_path / "roms" / "1" / "11" / "cover" / "small.webp", b"12345")
+    _write_file(tmp_path / "roms" / "1" / "ra_hashes.json")
+    _write_file(tmp_path / "roms" / "2" / "ra_hashes.json")
+    _write_file(tmp_path / "roms" / "3" / "30" / "manual" / "30.pdf", b"123")
+
+    with (
+        patch(
+            "tasks.manual.cleanup_orphaned_resources.RESOURCES_BASE_PATH",
+            str(tmp_path),
+        ),
+        patch(
+            "tasks.manual.cleanup_orphaned_resources.db_platform_handler.get_platform_ids",
+            return_value={1, 2},
+        ),
+        patch(
+            "tasks.manual.cleanup_orphaned_resources.db_rom_handler.get_rom_ids_by_platform",
+            return_value={1: {10}},
+        ),
+    ):
+        yield tmp_path
+
+
+def _list_files(path) -> list[str]:
+    return sorted(
+        os.path.relpath(os.path.join(root, file), path)
+        for root, _, files in os.walk(path)
+        for file in files
+    )
+
+
+def _store_blobs(resources_path) -> None:
+    blobs_path = resources_path / "blobs" / "ab"
+    old = ORPHANED_BLOB_MIN_AGE * 2
+    # Cover blob with a rendition linked by rom 10
+    _write_file(blobs_path / "abc", b"source", age=old)
+    _write_file(blobs_path / "abc.small.webp", b"small", age=old)
+    os.link(
+        blobs_path / "abc.small.webp",
+        resources_path / "roms" / "1" / "10" / "cover" / "big.webp",
+    )
+    # Cover blob with a rendition linked by the orphaned rom 11
+    _write_file(blobs_path / "abd", b"source", age=old)
+    _write_file(blobs_path / "abd.small.webp", b"small", age=old)
+    os.remove(resources_path / "roms" / "1" / "11" / "cover" / "small.webp")
+    os.link(
+        blobs_path / "abd.small.webp",
+        resources_path / "roms" / "1" / "11" / "cover" / "small.webp",
+    )
+    # Blob stored moments ago, not linked yet
+    _write_file(blobs_path / "abe", b"source")
+    # Interrupted download
+    _write_file(resources_path / "blobs" / "tmp" / "0123", b"partial", age=old)
+
+
+class TestCleanupOrphanedResourcesTask:
+    async def test_run_removes_orphaned_directories(self, resources_path):
+        report = await CleanupOrphanedResourcesTask().run()
+
+        assert report == {
+            "dry_run": False,
+            "directories": 2,
+            "blobs": 0,
+            "bytes": 8,
+            "errors": 0,
+        }
+        assert _list_files(resources_path) == [
+            "roms/1/10/cover/small.webp",
+            "roms/1/ra_hashes.json",
+            "roms/2/ra_hashes.json",
+        ]
+
+    async def test_run_dry_run_removes_nothing(self, resources_path):
+        files = _list_files(resources_path)
+
+        report = await CleanupOrphanedResourcesTask().run(dry_run=True)
+
+        assert report == {
+            "dry_run": True,
+            "directories": 2,
+            "blobs": 0,
+            "bytes": 8,
+            "errors": 0,
+        }
+        assert _list_files(resources_path) == files
+
+    async def test_run_removes_unlinked_blobs(self, resources_path):
+        _store_blobs(resources_path)
+
+        report = await CleanupOrphanedResourcesTask().run()
+
+        assert report["blobs"] == 3
+        assert report["bytes"] == len(b"123source" b"small" b"partial")
+        assert _list_files(resources_path / "blobs") == [
+            "ab/abc",
+            "ab/abc.small.webp",
+            "ab/abe",
+        ]
+
+    async def test_run_dry_run_counts_blobs_of_orphaned_directories(
+        self, resources_path
+    ):
+        _store_blobs(resources_path)
+        files = _list_files(resources_path)
+
+        report = await CleanupOrphanedResourcesTask().run(dry_run=True)
+
+        # Same figures as a real run, although the directories are left
+        assert report["blobs"] == 3
+        assert report["bytes"] == len(b"123source" b"small" b"partial")
+        assert _list_files(resources_path) == files
@@ -0,0 +1,130 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from handler.metadata.dat_handler import DatHandler
+from handler.redis_handler import async_cache
+from tasks.manual.import_dat_files import (
+    DAT_HASH_INDEX_KEY,
+    ImportDatFilesTask,
+    get_dat_hash_field,
+)
+
+NOINTRO_DAT = b"""<?xml version="1.0"?>
+<datafile>
+    <header>
+        <name>Nintendo - Nintendo 64 (BigEndian)</name>
+        <description>Nintendo - Nintendo 64 (BigEndian)</description>
+        <homepage>No-Intro</homepage>
+    </header>
+    <game name="Super Mario 64 (USA)">
+        <description>Super Mario 64 (USA)</description>
+        <rom name="Super Mario 64 (USA).z64" size="8388608" crc="3CE60709" md5="20B854B239203BAF6C961B850A4A51A2" sha1="9BEF1128717F958171A4AFAC3ED78EE2BB4E86CE"/>
+    </game>
+</datafile>
+"""
+
+REDUMP_DAT = b"""<?xml version="1.0"?>
+<datafile>
+    <header>
+        <name>Sony - PlayStation</name>
+        <url>http://redump.org/</url>
+    </header>
+    <game name="Crash Bandicoot (USA)">
+        <rom name="Crash Bandicoot (USA).cue" size="96" crc="0bd1b1b6"/>
+        <rom name="Crash Bandicoot (USA).bin" size="1000" crc="cba67c4e" sha1="f3a1a9d3fbd8a1f5d2c4e8d7b6a5f4e3d2c1b0a9"/>
+    </game>
+</datafile>
+"""
+
+ENTITIES_DAT = b"""<?xml version="1.0"?>
+<!DOCTYPE datafile [<!ENTITY name "Super Mario 64 (USA)">]>
+<datafile>
+    <game name="&name;">
+        <rom name="Super Mario 64 (USA).z64" crc="3CE60709"/>
+    </game>
+</datafile>
+"""
+
+
+@pytest.fixture
+async def dats_path(tmp_path):
+    (tmp_path / "n64.dat").write_bytes(NOINTRO_DAT)
+    (tmp_path / "psx.dat").write_bytes(REDUMP_DAT)
+    (tmp_path / "broken.dat").write_bytes(b"<datafile><game>")
+    (tmp_path / "entities.dat").write_bytes(ENTITIES_DAT)
+    # Unreadable as a file
+    (tmp_path / "folder.dat").mkdir()
+    (tmp_path / "readme.txt").write_bytes(b"not a dat file")
+
+    with patch("tasks.manual.import_dat_files.DATS_BASE_PATH", str(tmp_path)):
+        yield tmp_path
+
+    await async_cache.delete(DAT_HASH_INDEX_KEY)
+
+
+def _rom_file(crc_hash=None, md5_hash=None, sha1_hash=None) -> MagicMock:
+    return MagicMock(crc_hash=crc_hash, md5_hash=md5_hash, sha1_hash=sha1_hash)
+
+
+class TestImportDatFilesTask:
+    async def test_run_indexes_all_hashes(self, dats_path):
+        await ImportDatFilesTask().run()
+
+        entry = await async_cache.hget(
+            DAT_HASH_INDEX_KEY,
+            get_dat_hash_field("md5", "20B854B239203BAF6C961B850A4A51A2"),
+        )
+        assert json.loads(entry) == {
+            "name": "Super Mario 64 (USA)",
+            "set": "Nintendo - Nintendo 64 (BigEndian)",
+            "source": "nointro",
+        }
+        # 3 hashes for the N64 game, 3 for the 2 files of the PlayStation one
+        assert await async_cache.hlen(DAT_HASH_INDEX_KEY) == 6
+
+    async def test_run_replaces_previous_index(self, dats_path):
+        await async_cache.hset(DAT_HASH_INDEX_KEY, "crc:deadbeef", "{}")
+
+        await ImportDatFilesTask().run()
+
+        assert not await async_cache.hexists(DAT_HASH_INDEX_KEY, "crc:deadbeef")
+
+    async def test_run_failure_removes_temporary_index(self, dats_path):
+        with (
+            patch.object(
+                ImportDatFilesTask, "_import_dat", side_effect=RuntimeError("redis")
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            await ImportDatFilesTask().run()
+
+        assert not await async_cache.exists(f"{DAT_HASH_INDEX_KEY}:tmp")
+
+    async def test_run_without_dat_files(self, tmp_path):
+        await async_cache.hset(DAT_HASH_INDEX_KEY, "crc:deadbeef", "{}")
+
+        with patch("tasks.manual.import_dat_files.DATS_BASE_PATH", str(tmp_path)):
+            await ImportDatFilesTask().run()
+
+        assert not await async_cache.exists(DAT_HASH_INDEX_KEY)
+
+    async def test_lookup_rom(self, dats_path):
+        await ImportDatFilesTask().run()
+
+        match = await DatHandler().lookup_rom(
+            [_rom_file(crc_hash="00000000"), _rom_file(crc_hash="CBA67C4E")]
+        )
+
+        assert match["name"] == "Crash Bandicoot (USA)"
+        assert match["dat_set"] == "Sony - PlayStation"
+        assert match["hasheous_metadata"]["redump_match"]
+        assert not match["hasheous_metadata"]["nointro_match"]
+
+    async def test_lookup_rom_not_found(self, dats_path):
+        await ImportDatFilesTask().run()
+
+        assert await DatHandler().lookup_rom([_rom_file(crc_hash="00000000")]) == {
+            "name": None
+        }
+        assert await DatHandler().lookup_rom([_rom_file()]) == {"name": None}
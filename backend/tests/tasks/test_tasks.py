@@ -1,3 +1,4 @@
+import tempfile
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -311,3 +312,56 @@ class TestRemoteFilePullTask:
         result = await disabled_task.run(force=True)
 
         assert result == b"forced content"
+
+    @patch("tasks.tasks.ctx_httpx_client")
+    async def test_stream_to_file_success(self, mock_ctx_httpx_client, task):
+        """Test streaming a remote file to disk"""
+
+        async def aiter_bytes():
+            yield b"test "
+            yield b"content"
+
+        mock_response = MagicMock()
+        mock_response.aiter_bytes = aiter_bytes
+        mock_client = MagicMock()
+        mock_client.stream.return_value.__aenter__.return_value = mock_response
+        mock_ctx_httpx_client.get.return_value = mock_client
+
+        with tempfile.TemporaryFile() as tmp_file:
+            result = await task.stream_to_file(tmp_file, force=True)
+
+            assert result is True
+            assert tmp_file.read() == b"test content"
+
+        mock_client.stream.assert_called_once_with(
+            "GET", "https://example.com/data.json", timeout=120
+        )
+
+    @patch("tasks.tasks.ctx_httpx_client")
+    @patch("tasks.tasks.log")
+    async def test_stream_to_file_http_error(
+        self, mock_log, mock_ctx_httpx_client, task
+    ):
+        """Test handling of HTTP errors while streaming"""
+        mock_client = MagicMock()
+        mock_client.stream.return_value.__aenter__.side_effect = httpx.HTTPError(
+            "Connection failed"
+        )
+        mock_ctx_httpx_client.get.return_value = mock_client
+
+        with tempfile.TemporaryFile() as tmp_file:
+            result = await task.stream_to_file(tmp_file, force=True)
+
+        mock_log.error.assert_called()
+        assert result is False
+
+    @patch.object(RemoteFilePullTask, "unschedule")
+    async def test_stream_to_file_disabled_not_forced(
+        self, mock_unschedule, disabled_task
+    ):
+        """Test streaming when task is disabled and not forced"""
+        with tempfile.TemporaryFile() as tmp_file:
+            result = await disabled_task.stream_to_file(tmp_file, force=False)
+
+        mock_unschedule.assert_called_once()
+        assert result is False
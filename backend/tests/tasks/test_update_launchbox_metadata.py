@@ -1,22 +1,40 @@
 import os
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, patch
 
 import anyio
 import pytest
 from tasks.scheduled.update_launchbox_metadata import (
     LAUNCHBOX_FILES_KEY,
+    LAUNCHBOX_LEGACY_METADATA_KEYS,
     LAUNCHBOX_MAME_KEY,
     LAUNCHBOX_METADATA_ALTERNATE_NAME_KEY,
     LAUNCHBOX_METADATA_DATABASE_ID_KEY,
     LAUNCHBOX_METADATA_IMAGE_KEY,
     LAUNCHBOX_METADATA_NAME_KEY,
+    LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY,
     LAUNCHBOX_PLATFORMS_KEY,
     UpdateLaunchboxMetadataTask,
+    decode_launchbox_game,
+    encode_launchbox_game,
     update_launchbox_metadata_task,
 )
 from tasks.tasks import RemoteFilePullTask
 
 
+def stream_content(content: bytes | None):
+    """Mock RemoteFilePullTask.stream_to_file writing the given content"""
+
+    async def _stream_to_file(file, force=False):
+        if content is None:
+            return False
+
+        file.write(content)
+        file.seek(0)
+        return True
+
+    return _stream_to_file
+
+
 @pytest.fixture
 def task() -> UpdateLaunchboxMetadataTask:
     """Create a task instance for testing"""
@@ -50,16 +68,16 @@ class TestUpdateLaunchboxMetadataTask:
         assert task.description == "Updates the LaunchBox metadata store"
         assert task.url == "https://gamesdb.launchbox-app.com/Metadata.zip"
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     async def test_run_when_launchbox_api_enabled(
-        self, mock_super_run, task, sample_zip_content
+        self, mock_stream_to_file, task, sample_zip_content
     ):
         """Test run method when Launchbox API is enabled"""
-        mock_super_run.return_value = sample_zip_content
+        mock_stream_to_file.side_effect = stream_content(sample_zip_content)
 
         await task.run(force=True)
 
-        mock_super_run.assert_called_once_with(True)
+        mock_stream_to_file.assert_called_once_with(ANY, True)
 
     @patch("tasks.scheduled.update_launchbox_metadata.LAUNCHBOX_API_ENABLED", False)
     @patch("tasks.scheduled.update_launchbox_metadata.log")
@@ -71,27 +89,27 @@ class TestUpdateLaunchboxMetadataTask:
             "Launchbox API is not enabled, skipping metadata update"
         )
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_launchbox_metadata.log")
-    async def test_run_when_content_is_none(self, mock_log, mock_super_run, task):
+    async def test_run_when_content_is_none(self, mock_log, mock_stream_to_file, task):
         """Test run method when super().run() returns None"""
-        mock_super_run.return_value = None
+        mock_stream_to_file.side_effect = stream_content(None)
 
         await task.run(force=True)
 
-        mock_super_run.assert_called_once()
+        mock_stream_to_file.assert_called_once()
 
         mock_log.warning.assert_called_once_with(
             "No content received from launchbox metadata update"
         )
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_launchbox_metadata.log")
     async def test_run_with_corrupt_zip_file(
-        self, mock_log, mock_super_run, task, corrupt_zip_content
+        self, mock_log, mock_stream_to_file, task, corrupt_zip_content
     ):
         """Test run method with corrupt ZIP file"""
-        mock_super_run.return_value = corrupt_zip_content
+        mock_stream_to_file.side_effect = stream_content(corrupt_zip_content)
 
         await task.run(force=True)
 
@@ -99,13 +117,13 @@ class TestUpdateLaunchboxMetadataTask:
             "Bad zip file in launchbox metadata update"
         )
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_launchbox_metadata.log")
     async def test_run_successful_completion(
-        self, mock_log, mock_super_run, task, sample_zip_content
+        self, mock_log, mock_stream_to_file, task, sample_zip_content
     ):
         """Test successful completion of the task"""
-        mock_super_run.return_value = sample_zip_content
+        mock_stream_to_file.side_effect = stream_content(sample_zip_content)
 
         await task.run(force=True)
 
@@ -113,17 +131,17 @@ class TestUpdateLaunchboxMetadataTask:
             "Scheduled launchbox metadata update completed!"
         )
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_launchbox_metadata.async_cache.pipeline")
     async def test_xml_parsing(
         self,
         mock_async_cache_pipeline,
-        mock_super_run,
+        mock_stream_to_file,
         task,
         sample_zip_content,
     ):
         """Test parsing of Platforms.xml file"""
-        mock_super_run.return_value = sample_zip_content
+        mock_stream_to_file.side_effect = stream_content(sample_zip_content)
 
         # Create a mock pipeline with async context manager support
         mock_pipe = AsyncMock()
@@ -142,7 +160,7 @@ class TestUpdateLaunchboxMetadataTask:
 
         # Check hset call details
         hset_calls = mock_pipe.hset.call_args_list
-        assert len(hset_calls) == 12
+        assert len(hset_calls) == 15
 
         platform_calls = [
             call for call in hset_calls if call[0][0] == LAUNCHBOX_PLATFORMS_KEY
@@ -171,18 +189,52 @@ class TestUpdateLaunchboxMetadataTask:
         assert len(metadata_alt_calls) == 1
         assert len(metadata_image_calls) == 1
 
+        # Alternate names are indexed under the platform of their game
+        platform_titles_calls = [
+            call[1]["mapping"]
+            for call in hset_calls
+            if call[0][0] == f"{LAUNCHBOX_METADATA_PLATFORM_TITLES_KEY}:Nintendo 64"
+        ]
+        assert len(platform_titles_calls) == 2
+        assert platform_titles_calls[1] == {"Super Mario 64 (USA)": "12345"}
+
         mame_calls = [call for call in hset_calls if call[0][0] == LAUNCHBOX_MAME_KEY]
         assert len(mame_calls) == 2
 
         files_calls = [call for call in hset_calls if call[0][0] == LAUNCHBOX_FILES_KEY]
         assert len(files_calls) == 2
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
+    @patch("tasks.scheduled.update_launchbox_metadata.async_cache.pipeline")
+    @patch("tasks.scheduled.update_launchbox_metadata.LAUNCHBOX_PIPELINE_BATCH_SIZE", 1)
+    async def test_pipeline_flushed_in_batches(
+        self,
+        mock_async_cache_pipeline,
+        mock_stream_to_file,
+        task,
+        sample_zip_content,
+    ):
+        """Test that the pipeline is flushed while parsing instead of once at the end"""
+        mock_stream_to_file.side_effect = stream_content(sample_zip_content)
+
+        mock_pipe = AsyncMock()
+        mock_async_cache_pipeline.return_value.__aenter__ = AsyncMock(
+            return_value=mock_pipe
+        )
+        mock_async_cache_pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        await task.run(force=True)
+
+        assert mock_async_cache_pipeline.call_count == 4
+        assert mock_pipe.execute.call_count > 4
+        assert len(mock_pipe.hset.call_args_list) == 15
+
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_launchbox_metadata.async_cache.pipeline")
     async def test_empty_xml_elements_handling(
         self,
         mock_async_cache_pipeline,
-        mock_super_run,
+        mock_stream_to_file,
         task,
     ):
         """Test handling of XML elements with empty or missing text"""
@@ -192,7 +244,7 @@ class TestUpdateLaunchboxMetadataTask:
         )
 
         async with await anyio.open_file(sample_path, "rb") as f:
-            mock_super_run.return_value = await f.read()
+            mock_stream_to_file.side_effect = stream_content(await f.read())
 
         # Create a mock pipeline with async context manager support
         mock_pipe = AsyncMock()
@@ -216,12 +268,12 @@ class TestUpdateLaunchboxMetadataTask:
         # Only one valid platform should be processed
         assert len(platform_calls) == 1
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_launchbox_metadata.async_cache.pipeline")
     async def test_missing_xml_files_handling(
         self,
         mock_async_cache_pipeline,
-        mock_super_run,
+        mock_stream_to_file,
         task,
     ):
         """Test handling when some XML files are missing from the ZIP"""
@@ -231,7 +283,7 @@ class TestUpdateLaunchboxMetadataTask:
         )
 
         async with await anyio.open_file(sample_path, "rb") as f:
-            mock_super_run.return_value = await f.read()
+            mock_stream_to_file.side_effect = stream_content(await f.read())
 
         # Create a mock pipeline with async context manager support
         mock_pipe = AsyncMock()
@@ -252,18 +304,70 @@ class TestUpdateLaunchboxMetadataTask:
     def test_redis_keys_are_defined(self):
         """Test that all Redis keys are properly defined"""
         assert LAUNCHBOX_PLATFORMS_KEY == "romm:launchbox_platforms"
-        assert (
-            LAUNCHBOX_METADATA_DATABASE_ID_KEY == "romm:launchbox_metadata_database_id"
-        )
-        assert LAUNCHBOX_METADATA_NAME_KEY == "romm:launchbox_metadata_name"
+        assert LAUNCHBOX_METADATA_DATABASE_ID_KEY == "romm:launchbox_metadata_games"
+        assert LAUNCHBOX_METADATA_NAME_KEY == "romm:launchbox_metadata_name_ids"
         assert (
             LAUNCHBOX_METADATA_ALTERNATE_NAME_KEY
-            == "romm:launchbox_metadata_alternate_name"
+            == "romm:launchbox_metadata_alternate_name_ids"
         )
         assert LAUNCHBOX_METADATA_IMAGE_KEY == "romm:launchbox_metadata_image"
         assert LAUNCHBOX_MAME_KEY == "romm:launchbox_mame"
         assert LAUNCHBOX_FILES_KEY == "romm:launchbox_files"
 
+    @patch.object(RemoteFilePullTask, "stream_to_file")
+    @patch("tasks.scheduled.update_launchbox_metadata.async_cache.pipeline")
+    async def test_game_records_stored_once(
+        self,
+        mock_async_cache_pipeline,
+        mock_stream_to_file,
+        task,
+        sample_zip_content,
+    ):
+        """Test that name indexes only reference the compressed game records"""
+        mock_stream_to_file.side_effect = stream_content(sample_zip_content)
+
+        mock_pipe = AsyncMock()
+        mock_async_cache_pipeline.return_value.__aenter__ = AsyncMock(
+            return_value=mock_pipe
+        )
+        mock_async_cache_pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        await task.run(force=True)
+
+        hset_calls = mock_pipe.hset.call_args_list
+        games = {
+            database_id: decode_launchbox_game(data)
+            for call in hset_calls
+            if call[0][0] == LAUNCHBOX_METADATA_DATABASE_ID_KEY
+            for database_id, data in call[1]["mapping"].items()
+        }
+        assert len(games) == 2
+        for database_id, game in games.items():
+            assert game["DatabaseID"] == database_id
+            assert None not in game.values()
+
+        for call in hset_calls:
+            if call[0][0] in (
+                LAUNCHBOX_METADATA_NAME_KEY,
+                LAUNCHBOX_METADATA_ALTERNATE_NAME_KEY,
+            ):
+                for database_id in call[1]["mapping"].values():
+                    assert database_id in games
+
+        mock_pipe.delete.assert_called_once_with(*LAUNCHBOX_LEGACY_METADATA_KEYS)
+
+    def test_encode_decode_launchbox_game(self):
+        """Test the compact game record encoding round trip"""
+        game = {"DatabaseID": "1", "Name": "Pokémon Red", "Overview": None}
+
+        encoded = encode_launchbox_game(game)
+
+        assert isinstance(encoded, str)
+        assert decode_launchbox_game(encoded) == {
+            "DatabaseID": "1",
+            "Name": "Pokémon Red",
+        }
+
     def test_task_instance_creation(self):
         """Test that the task instance is created correctly"""
         assert isinstance(update_launchbox_metadata_task, UpdateLaunchboxMetadataTask)
@@ -276,13 +380,13 @@ class TestUpdateLaunchboxMetadataTaskIntegration:
     def task(self):
         return UpdateLaunchboxMetadataTask()
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_launchbox_metadata.async_cache.pipeline")
     async def test_full_workflow_integration(
-        self, mock_async_cache_pipeline, mock_super_run, task, sample_zip_content
+        self, mock_async_cache_pipeline, mock_stream_to_file, task, sample_zip_content
     ):
         """Test the complete workflow from ZIP download to Redis storage"""
-        mock_super_run.return_value = sample_zip_content
+        mock_stream_to_file.side_effect = stream_content(sample_zip_content)
 
         # Create a mock pipeline with async context manager support
         mock_pipe = AsyncMock()
@@ -295,7 +399,7 @@ class TestUpdateLaunchboxMetadataTaskIntegration:
 
         # Check hset call details
         hset_calls = mock_pipe.hset.call_args_list
-        assert len(hset_calls) == 12
+        assert len(hset_calls) == 15
 
         # Verify that all expected Redis keys were used
         redis_keys_used = [call[0][0] for call in hset_calls]
@@ -1,8 +1,9 @@
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 from tasks.scheduled.update_switch_titledb import (
+    SWITCH_LEGACY_PRODUCT_ID_KEY,
     SWITCH_PRODUCT_ID_KEY,
     SWITCH_TITLEDB_INDEX_KEY,
     UpdateSwitchTitleDBTask,
@@ -11,6 +12,20 @@ from tasks.scheduled.update_switch_titledb import (
 from tasks.tasks import RemoteFilePullTask
 
 
+def stream_content(content: bytes | None):
+    """Mock RemoteFilePullTask.stream_to_file writing the given content"""
+
+    async def _stream_to_file(file, force=False):
+        if content is None:
+            return False
+
+        file.write(content)
+        file.seek(0)
+        return True
+
+    return _stream_to_file
+
+
 class TestUpdateSwitchTitleDBTask:
     @pytest.fixture
     def task(self):
@@ -63,17 +78,17 @@ class TestUpdateSwitchTitleDBTask:
             == "https://raw.githubusercontent.com/blawar/titledb/master/US.en.json"
         )
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_switch_titledb.async_cache.pipeline")
     async def test_run_success(
         self,
         mock_async_cache_pipeline,
-        mock_super_run,
+        mock_stream_to_file,
         task,
         sample_json_content,
     ):
         """Test successful run with valid data"""
-        mock_super_run.return_value = sample_json_content
+        mock_stream_to_file.side_effect = stream_content(sample_json_content)
 
         # Create mock pipeline with async context manager support
         mock_pipe = AsyncMock()
@@ -84,7 +99,7 @@ class TestUpdateSwitchTitleDBTask:
         await task.run(force=True)
 
         # Verify super().run was called
-        mock_super_run.assert_called_once_with(True)
+        mock_stream_to_file.assert_called_once_with(ANY, True)
 
         # Verify pipeline was used
         assert mock_async_cache_pipeline.called
@@ -105,17 +120,17 @@ class TestUpdateSwitchTitleDBTask:
         assert len(titledb_calls) > 0
         assert len(product_calls) > 0
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_switch_titledb.async_cache.pipeline")
     async def test_run_filters_empty_data(
         self,
         mock_async_cache_pipeline,
-        mock_super_run,
+        mock_stream_to_file,
         task,
         sample_json_content,
     ):
         """Test that empty keys and None values are filtered out"""
-        mock_super_run.return_value = sample_json_content
+        mock_stream_to_file.side_effect = stream_content(sample_json_content)
 
         mock_pipe = AsyncMock()
         mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
@@ -137,12 +152,12 @@ class TestUpdateSwitchTitleDBTask:
                 for key in mapping.keys():
                     assert key is not None and key != ""
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_switch_titledb.async_cache.pipeline")
     async def test_run_batches_data(
         self,
         mock_async_cache_pipeline,
-        mock_super_run,
+        mock_stream_to_file,
         task,
     ):
         """Test that data is properly batched"""
@@ -156,7 +171,7 @@ class TestUpdateSwitchTitleDBTask:
             }
 
         large_json_content = json.dumps(large_dataset).encode("utf-8")
-        mock_super_run.return_value = large_json_content
+        mock_stream_to_file.side_effect = stream_content(large_json_content)
 
         mock_pipe = AsyncMock()
         mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
@@ -169,40 +184,75 @@ class TestUpdateSwitchTitleDBTask:
         hset_calls = mock_pipe.hset.call_args_list
         assert len(hset_calls) > 2  # At least one batch for each key type
 
-    @patch.object(RemoteFilePullTask, "run")
-    async def test_run_no_content(self, mock_super_run, task):
+    @patch.object(RemoteFilePullTask, "stream_to_file")
+    @patch("tasks.scheduled.update_switch_titledb.async_cache.pipeline")
+    async def test_run_stores_titles_once(
+        self,
+        mock_async_cache_pipeline,
+        mock_stream_to_file,
+        task,
+        sample_json_content,
+    ):
+        """Test that each title is stored once, with the product IDs as an index"""
+        mock_stream_to_file.side_effect = stream_content(sample_json_content)
+
+        mock_pipe = AsyncMock()
+        mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
+        mock_pipe.__aexit__ = AsyncMock(return_value=None)
+        mock_async_cache_pipeline.return_value = mock_pipe
+
+        await task.run(force=True)
+
+        titledb_mapping = {}
+        product_mapping = {}
+        for call in mock_pipe.hset.call_args_list:
+            if call[0][0] == SWITCH_TITLEDB_INDEX_KEY:
+                titledb_mapping.update(call[1]["mapping"])
+            elif call[0][0] == SWITCH_PRODUCT_ID_KEY:
+                product_mapping.update(call[1]["mapping"])
+
+        assert len(titledb_mapping) == 3
+        assert product_mapping == {
+            "0100000000010000": "0100000000010000",
+            "0100000000020000": "0100000000020000",
+            "0100000000030000": "0100000000030000",
+        }
+        mock_pipe.delete.assert_called_once_with(SWITCH_LEGACY_PRODUCT_ID_KEY)
+
+    @patch.object(RemoteFilePullTask, "stream_to_file")
+    async def test_run_no_content(self, mock_stream_to_file, task):
         """Test run when super().run returns None"""
-        mock_super_run.return_value = None
+        mock_stream_to_file.side_effect = stream_content(None)
 
         await task.run(force=True)
 
         # Should return early without doing anything
-        mock_super_run.assert_called_once_with(True)
+        mock_stream_to_file.assert_called_once_with(ANY, True)
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_switch_titledb.async_cache.pipeline")
     async def test_run_invalid_json(
         self,
         mock_async_cache_pipeline,
-        mock_super_run,
+        mock_stream_to_file,
         task,
     ):
         """Test run with invalid JSON content"""
-        mock_super_run.return_value = b"invalid json content"
+        mock_stream_to_file.side_effect = stream_content(b"invalid json content")
 
         with pytest.raises(json.JSONDecodeError):
             await task.run(force=True)
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_switch_titledb.async_cache.pipeline")
     async def test_run_empty_json(
         self,
         mock_async_cache_pipeline,
-        mock_super_run,
+        mock_stream_to_file,
         task,
     ):
         """Test run with empty JSON object"""
-        mock_super_run.return_value = json.dumps({}).encode("utf-8")
+        mock_stream_to_file.side_effect = stream_content(json.dumps({}).encode("utf-8"))
 
         mock_pipe = AsyncMock()
         mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
@@ -214,17 +264,17 @@ class TestUpdateSwitchTitleDBTask:
         # Should still call execute even with empty data
         assert mock_pipe.execute.called
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_switch_titledb.async_cache.pipeline")
     async def test_product_id_mapping(
         self,
         mock_async_cache_pipeline,
-        mock_super_run,
+        mock_stream_to_file,
         task,
         sample_json_content,
     ):
         """Test that product ID mapping works correctly"""
-        mock_super_run.return_value = sample_json_content
+        mock_stream_to_file.side_effect = stream_content(sample_json_content)
 
         mock_pipe = AsyncMock()
         mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
@@ -241,28 +291,35 @@ class TestUpdateSwitchTitleDBTask:
 
         assert len(product_calls) > 0
 
-        # Verify product mapping structure
+        titledb_keys = {
+            key
+            for call in hset_calls
+            if call[0][0] == SWITCH_TITLEDB_INDEX_KEY
+            for key in call[1]["mapping"]
+        }
+
+        # Verify product mapping only references the titledb entries
         for call in product_calls:
             args, kwargs = call
             if "mapping" in kwargs:
                 mapping = kwargs["mapping"]
-                for product_id, data_json in mapping.items():
-                    data = json.loads(data_json)
-                    assert data.get("id") == product_id
+                for product_id, titledb_key in mapping.items():
+                    assert titledb_key in titledb_keys
+                    assert product_id == titledb_key
 
-    @patch.object(RemoteFilePullTask, "run")
+    @patch.object(RemoteFilePullTask, "stream_to_file")
     @patch("tasks.scheduled.update_switch_titledb.async_cache.pipeline")
     @patch("tasks.scheduled.update_switch_titledb.log")
     async def test_completion_log(
         self,
         mock_log,
         mock_async_cache_pipeline,
-        mock_super_run,
+        mock_stream_to_file,
         task,
         sample_json_content,
     ):
         """Test that completion is logged"""
-        mock_super_run.return_value = sample_json_content
+        mock_stream_to_file.side_effect = stream_content(sample_json_content)
 
         mock_pipe = AsyncMock()
         mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
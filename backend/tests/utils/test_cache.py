@@ -1,9 +1,16 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
+import pytest
 from handler.metadata.base_hander import MAME_XML_KEY, METADATA_FIXTURES_DIR
 from handler.redis_handler import async_cache
 from redis.asyncio import Redis as AsyncRedis
-from utils.cache import conditionally_set_cache
+from utils.cache import (
+    FixtureIndexCache,
+    LookupCache,
+    conditionally_set_cache,
+    get_generation_key,
+    purge_lookup_cache,
+)
 
 
 class TestConditionallySetCache:
@@ -53,3 +60,100 @@ class TestConditionallySetCache:
         )
 
         mock_cache_pipeline.assert_not_called()
+
+
+TEST_INDEX_KEY = "romm:test_fixture_index"
+
+
+@pytest.fixture
+async def index_cache():
+    await async_cache.delete(TEST_INDEX_KEY, get_generation_key(TEST_INDEX_KEY))
+    await async_cache.hset(TEST_INDEX_KEY, mapping={"a": "1", "b": "2"})
+    yield FixtureIndexCache(async_cache, maxsize=2, check_interval=0)
+    await async_cache.delete(TEST_INDEX_KEY, get_generation_key(TEST_INDEX_KEY))
+
+
+class TestFixtureIndexCache:
+    """Test the FixtureIndexCache class."""
+
+    async def test_hget_reads_through_once(self, index_cache: FixtureIndexCache):
+        with patch.object(async_cache, "hget", wraps=async_cache.hget) as mock_hget:
+            assert await index_cache.hget(TEST_INDEX_KEY, "a") == b"1"
+            assert await index_cache.hget(TEST_INDEX_KEY, "a") == b"1"
+            assert await index_cache.hget(TEST_INDEX_KEY, "missing") is None
+            assert await index_cache.hget(TEST_INDEX_KEY, "missing") is None
+
+        assert mock_hget.call_count == 2
+
+    async def test_generation_bump_invalidates(self, index_cache: FixtureIndexCache):
+        assert await index_cache.hget(TEST_INDEX_KEY, "a") == b"1"
+
+        await async_cache.hset(TEST_INDEX_KEY, "a", "3")
+        assert await index_cache.hget(TEST_INDEX_KEY, "a") == b"1"
+
+        await async_cache.incr(get_generation_key(TEST_INDEX_KEY))
+        assert await index_cache.hget(TEST_INDEX_KEY, "a") == b"3"
+
+    async def test_lru_eviction(self, index_cache: FixtureIndexCache):
+        await index_cache.hget(TEST_INDEX_KEY, "a")
+        await index_cache.hget(TEST_INDEX_KEY, "b")
+        await index_cache.hget(TEST_INDEX_KEY, "a")
+        await index_cache.hget(TEST_INDEX_KEY, "c")
+
+        with patch.object(async_cache, "hget", wraps=async_cache.hget) as mock_hget:
+            await index_cache.hget(TEST_INDEX_KEY, "a")
+            mock_hget.assert_not_called()
+
+            await index_cache.hget(TEST_INDEX_KEY, "b")
+            mock_hget.assert_called_once()
+
+    async def test_prefetch_uses_hmget(self, index_cache: FixtureIndexCache):
+        with (
+            patch.object(async_cache, "hmget", wraps=async_cache.hmget) as mock_hmget,
+            patch.object(async_cache, "hget", wraps=async_cache.hget) as mock_hget,
+        ):
+            await index_cache.prefetch(TEST_INDEX_KEY, ["a", "b", "a"])
+
+            assert await index_cache.hget(TEST_INDEX_KEY, "a") == b"1"
+            assert await index_cache.hget(TEST_INDEX_KEY, "b") == b"2"
+
+        mock_hmget.assert_called_once_with(TEST_INDEX_KEY, ("a", "b"))
+        mock_hget.assert_not_called()
+
+    async def test_exists(self, index_cache: FixtureIndexCache):
+        assert await index_cache.exists(TEST_INDEX_KEY)
+        assert not await index_cache.exists("romm:test_missing_fixture_index")
+
+
+class TestLookupCache:
+    """Test the LookupCache class."""
+
+    async def test_set_and_get(self):
+        lookup_cache = LookupCache(async_cache, "test_provider", ttl=60)
+
+        assert await lookup_cache.get("missing") is None
+
+        await lookup_cache.set("hit", {"id": 1})
+        await lookup_cache.set("miss", {})
+
+        assert await lookup_cache.get("hit") == {"id": 1}
+        assert await lookup_cache.get("miss") == {}
+        assert 0 < await async_cache.ttl(f"{lookup_cache.key}:hit") <= 60
+
+        await purge_lookup_cache(async_cache)
+
+    async def test_disabled(self):
+        lookup_cache = LookupCache(async_cache, "test_provider", ttl=0)
+
+        await lookup_cache.set("hit", {"id": 1})
+        assert await lookup_cache.get("hit") is None
+
+    async def test_purge(self):
+        await LookupCache(async_cache, "test_provider_a", ttl=60).set("a", {})
+        await LookupCache(async_cache, "test_provider_b", ttl=60).set("b", {})
+        await async_cache.set("romm:test_unrelated", "1")
+
+        assert await purge_lookup_cache(async_cache) == 2
+        assert await async_cache.get("romm:test_unrelated") == b"1"
+
+        await async_cache.delete("romm:test_unrelated")
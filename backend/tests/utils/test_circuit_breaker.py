@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from handler.redis_handler import async_cache
+from utils.circuit_breaker import CircuitBreaker
+
+
+@pytest.fixture
+async def breaker():
+    breaker = CircuitBreaker("TestProvider", threshold=3, cooldown=60)
+    await async_cache.delete(breaker.key, breaker.probe_key)
+    yield breaker
+    await async_cache.delete(breaker.key, breaker.probe_key)
+
+
+async def _expire_cooldown(breaker: CircuitBreaker) -> None:
+    await async_cache.hset(breaker.key, "open_until", 0)
+
+
+@patch("utils.circuit_breaker._emit_warning", new_callable=AsyncMock)
+class TestCircuitBreaker:
+    """Test the CircuitBreaker class."""
+
+    async def test_closed_by_default(self, mock_emit, breaker: CircuitBreaker):
+        assert await breaker.allow_request()
+
+    async def test_opens_after_threshold(self, mock_emit, breaker: CircuitBreaker):
+        for _ in range(2):
+            await breaker.record_failure()
+        assert await breaker.allow_request()
+        mock_emit.assert_not_called()
+
+        await breaker.record_failure()
+        assert not await breaker.allow_request()
+        mock_emit.assert_called_once()
+
+    async def test_success_resets_failures(self, mock_emit, breaker: CircuitBreaker):
+        for _ in range(2):
+            await breaker.record_failure()
+        await breaker.record_success()
+        await breaker.record_failure()
+
+        assert await breaker.allow_request()
+
+    async def test_half_open_allows_single_probe(
+        self, mock_emit, breaker: CircuitBreaker
+    ):
+        for _ in range(3):
+            await breaker.record_failure()
+
+        await _expire_cooldown(breaker)
+
+        assert await breaker.allow_request()
+        assert not await breaker.allow_request()
+
+    async def test_successful_probe_closes_circuit(
+        self, mock_emit, breaker: CircuitBreaker
+    ):
+        for _ in range(3):
+            await breaker.record_failure()
+
+        await _expire_cooldown(breaker)
+
+        assert await breaker.allow_request()
+        await breaker.record_success()
+
+        assert await breaker.allow_request()
+        assert await breaker.allow_request()
+
+    async def test_failed_probe_reopens_circuit(
+        self, mock_emit, breaker: CircuitBreaker
+    ):
+        for _ in range(3):
+            await breaker.record_failure()
+
+        await _expire_cooldown(breaker)
+
+        assert await breaker.allow_request()
+        await breaker.record_failure()
+        assert not await breaker.allow_request()
+
+        assert mock_emit.call_count == 2
+
+    async def test_disabled_with_zero_threshold(self, mock_emit):
+        breaker = CircuitBreaker("TestProvider", threshold=0)
+        for _ in range(10):
+            await breaker.record_failure()
+
+        assert await breaker.allow_request()
+        mock_emit.assert_not_called()
@@ -0,0 +1,44 @@
+import asyncio
+
+from utils.concurrency import LoopBoundSemaphore
+
+
+async def test_limits_concurrent_holders():
+    slots = LoopBoundSemaphore(2)
+    running = 0
+    max_running = 0
+
+    async def hold():
+        nonlocal running, max_running
+        async with slots:
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(hold() for _ in range(6)))
+
+    assert max_running == 2
+
+
+async def test_releases_on_error():
+    slots = LoopBoundSemaphore(1)
+
+    try:
+        async with slots:
+            raise ValueError
+    except ValueError:
+        pass
+
+    await asyncio.wait_for(slots.__aenter__(), timeout=1)
+
+
+def test_usable_from_different_event_loops():
+    slots = LoopBoundSemaphore(1)
+
+    async def hold():
+        async with slots:
+            await asyncio.sleep(0)
+
+    asyncio.run(hold())
+    asyncio.run(hold())
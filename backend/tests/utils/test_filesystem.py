@@ -0,0 +1,46 @@
+import os
+from datetime import datetime, timezone
+
+from utils.filesystem import evict_lru_files, get_resource_url
+
+
+def _write_file(path, size: int, mtime: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"0" * size)
+    os.utime(path, (mtime, mtime))
+
+
+def test_evict_lru_files_deletes_least_recently_used(tmp_path):
+    _write_file(tmp_path / "a" / "old.webp", 100, mtime=1000)
+    _write_file(tmp_path / "b" / "recent.webp", 100, mtime=3000)
+    _write_file(tmp_path / "a" / "older.webp", 100, mtime=500)
+
+    total_size = evict_lru_files(str(tmp_path), max_size=150)
+
+    assert total_size == 100
+    assert sorted(p.name for p in tmp_path.rglob("*.webp")) == ["recent.webp"]
+
+
+def test_evict_lru_files_under_max_size(tmp_path):
+    _write_file(tmp_path / "image.webp", 100, mtime=1000)
+
+    assert evict_lru_files(str(tmp_path), max_size=100) == 100
+    assert (tmp_path / "image.webp").exists()
+
+
+def test_get_resource_url_content_hashed_file():
+    updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    assert (
+        get_resource_url("roms/1/1/cover/small.0123456789abcdef.webp", updated_at)
+        == "/assets/romm/resources/roms/1/1/cover/small.0123456789abcdef.webp"
+    )
+
+
+def test_get_resource_url_versions_other_files():
+    updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    assert (
+        get_resource_url("roms/1/1/cover/small.png", updated_at)
+        == f"/assets/romm/resources/roms/1/1/cover/small.png?ts={updated_at}"
+    )
@@ -0,0 +1,77 @@
+import httpx
+import pytest
+from handler.redis_handler import async_cache
+from utils.context import get_httpx_client, initialize_context
+from utils.http_transport import (
+    HTTP_METRICS_KEY,
+    HTTPPool,
+    MetricsTransport,
+    get_http_metrics,
+    record_http_request,
+)
+
+
+@pytest.fixture(autouse=True)
+async def clear_metrics():
+    await async_cache.delete(HTTP_METRICS_KEY)
+    yield
+    await async_cache.delete(HTTP_METRICS_KEY)
+
+
+async def test_http_metrics_by_host():
+    await record_http_request("api.igdb.com", 0.1, failed=False)
+    await record_http_request("api.igdb.com", 0.3, failed=True)
+    await record_http_request("www.screenscraper.fr", 0.05, failed=False)
+
+    assert await get_http_metrics() == [
+        {
+            "host": "api.igdb.com",
+            "requests": 2,
+            "errors": 1,
+            "avg_latency_ms": 200.0,
+        },
+        {
+            "host": "www.screenscraper.fr",
+            "requests": 1,
+            "errors": 0,
+            "avg_latency_ms": 50.0,
+        },
+    ]
+
+
+async def test_pools_have_separate_clients():
+    async with initialize_context():
+        igdb_client = get_httpx_client(HTTPPool.IGDB)
+        downloads_client = get_httpx_client(HTTPPool.DOWNLOADS)
+
+        assert igdb_client is not downloads_client
+        assert get_httpx_client() is not igdb_client
+
+
+async def test_httpx_client_records_requests():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/timeout":
+            raise httpx.ConnectTimeout("timed out", request=request)
+        return httpx.Response(503 if request.url.path == "/down" else 200)
+
+    async with initialize_context():
+        client = get_httpx_client(HTTPPool.PLAYMATCH)
+        assert isinstance(client._transport, MetricsTransport)
+        client._transport.transport = httpx.MockTransport(handler)
+
+        await client.get("https://playmatch.retrorealm.dev/up")
+        await client.get("https://playmatch.retrorealm.dev/down")
+        with pytest.raises(httpx.ConnectTimeout):
+            await client.get("https://playmatch.retrorealm.dev/timeout")
+
+    [metrics] = await get_http_metrics()
+    assert metrics["host"] == "playmatch.retrorealm.dev"
+    assert metrics["requests"] == 3
+    assert metrics["errors"] == 2
+
+
+async def test_http2_enabled_where_configured():
+    async with initialize_context():
+        client = get_httpx_client(HTTPPool.IGDB)
+        assert isinstance(client._transport, MetricsTransport)
+        assert client._transport.transport._pool._http2
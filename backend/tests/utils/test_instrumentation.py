@@ -0,0 +1,107 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from handler.metadata.playmatch_handler import PlaymatchHandler
+from handler.redis_handler import async_cache
+from utils.cache import LookupCache
+from utils.instrumentation import (
+    PROVIDER_METRICS_KEY,
+    get_provider_metrics,
+    instrument_provider,
+    mark_status,
+)
+
+
+@pytest.fixture(autouse=True)
+async def clear_metrics():
+    await async_cache.delete(PROVIDER_METRICS_KEY)
+    yield
+    await async_cache.delete(PROVIDER_METRICS_KEY)
+
+
+class FakeProvider:
+    def __init__(self) -> None:
+        self.lookup_cache = LookupCache(async_cache, "test_instrumentation", ttl=60)
+
+    @instrument_provider("fake")
+    async def _request(self, key: str) -> dict:
+        cached = await self.lookup_cache.get(key)
+        if cached is not None:
+            return cached
+
+        await self.lookup_cache.set(key, {"key": key})
+        return {"key": key}
+
+    @instrument_provider("fake")
+    async def get_rom(self, fail: bool = False) -> dict:
+        if fail:
+            raise ValueError("provider error")
+        return await self._request("rom")
+
+    @instrument_provider("fake")
+    async def get_platform(self) -> dict:
+        mark_status("circuit_open")
+        return {}
+
+    @instrument_provider("fake")
+    async def get_rom_by_id(self) -> dict:
+        await asyncio.sleep(10)
+        return {}
+
+
+async def test_records_calls_errors_and_cache_hits():
+    provider = FakeProvider()
+    await async_cache.delete(f"{provider.lookup_cache.key}:rom")
+
+    assert await provider.get_rom() == {"key": "rom"}
+    assert await provider.get_rom() == {"key": "rom"}
+    with pytest.raises(ValueError):
+        await provider.get_rom(fail=True)
+
+    metrics = {m["endpoint"]: m for m in await get_provider_metrics()}
+
+    assert metrics["get_rom"]["provider"] == "fake"
+    assert metrics["get_rom"]["calls"] == 3
+    assert metrics["get_rom"]["errors"] == 1
+    assert metrics["get_rom"]["cache_hits"] == 0
+    assert metrics["request"]["calls"] == 2
+    assert metrics["request"]["errors"] == 0
+    assert metrics["request"]["cache_hits"] == 1
+
+    await async_cache.delete(f"{provider.lookup_cache.key}:rom")
+
+
+async def test_cancelled_calls_are_not_counted():
+    task = asyncio.create_task(FakeProvider().get_rom_by_id())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert await get_provider_metrics() == []
+
+
+async def test_errors_returned_without_raising_are_counted():
+    assert await FakeProvider().get_platform() == {}
+
+    metrics = await get_provider_metrics()
+
+    assert metrics[0]["endpoint"] == "get_platform"
+    assert metrics[0]["errors"] == 1
+
+
+async def test_skipped_call_of_open_circuit_is_an_error():
+    handler = PlaymatchHandler()
+    with (
+        patch("handler.metadata.playmatch_handler.get_httpx_client"),
+        patch.object(
+            handler.circuit_breaker, "allow_request", AsyncMock(return_value=False)
+        ),
+    ):
+        assert await handler._request(handler.identify_url, {}) == {}
+
+    metrics = await get_provider_metrics()
+
+    assert metrics[0]["provider"] == "playmatch"
+    assert metrics[0]["errors"] == 1
@@ -0,0 +1,45 @@
+import io
+import json
+
+import pytest
+from utils.json import iter_object_items
+
+
+class TestIterObjectItems:
+    """Test the iter_object_items function."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+    def test_yields_all_items(self, chunk_size):
+        """Test items are decoded regardless of where chunks are split."""
+        data = {
+            "0100000000010000": {"id": "0100000000010000", "name": "Pokémon"},
+            "number": 1234567890,
+            "float": 2.5,
+            "null": None,
+            "list": [1, "two", {"three": 3}],
+            "escaped": 'quote " and brace }',
+        }
+        fp = io.StringIO(json.dumps(data, indent=2))
+
+        assert dict(iter_object_items(fp, chunk_size=chunk_size)) == data
+
+    def test_empty_object(self):
+        """Test an empty object yields nothing."""
+        assert list(iter_object_items(io.StringIO(" {} "))) == []
+
+    def test_is_lazy(self):
+        """Test items are yielded before the whole document is read."""
+        fp = io.StringIO('{"a": 1, "b": 2, "c": ')
+        items = iter_object_items(fp, chunk_size=4)
+
+        assert next(items) == ("a", 1)
+        assert next(items) == ("b", 2)
+
+    @pytest.mark.parametrize(
+        "content",
+        ["", "invalid json content", "[1, 2]", '{"a": 1,}', '{"a" 1}', '{"a": 1'],
+    )
+    def test_invalid_json(self, content):
+        """Test invalid documents raise a JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_object_items(io.StringIO(content), chunk_size=2))
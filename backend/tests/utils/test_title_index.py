@@ -0,0 +1,23 @@
+from utils.title_index import TrigramTitleIndex
+
+
+class TestTrigramTitleIndex:
+    """Test the TrigramTitleIndex class."""
+
+    def test_search_ranks_closest_titles_first(self):
+        index = TrigramTitleIndex(
+            (title.lower(), title)
+            for title in ["Super Mario 64", "Mario Kart 64", "Wave Race 64"]
+        )
+
+        assert len(index) == 3
+        assert index.search("super mario 64", limit=2) == [
+            "Super Mario 64",
+            "Mario Kart 64",
+        ]
+
+    def test_search_without_shared_trigrams(self):
+        index = TrigramTitleIndex([("metroid", "Metroid")])
+
+        assert index.search("zelda") == []
+        assert index.search("") == []
@@ -1,10 +1,28 @@
 import json
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 from itertools import batched
 from pathlib import Path
+from typing import Any, Final
 
 from anyio import open_file
+from config import METADATA_LOOKUP_CACHE_TTL
 from logger.logger import log
 from redis.asyncio import Redis as AsyncRedis
+from utils.instrumentation import mark_cache_hit
+
+# Entries kept in memory across all fixture indexes of a process
+FIXTURE_INDEX_CACHE_SIZE: Final = 20000
+# Seconds between checks of an index generation against redis
+FIXTURE_INDEX_GENERATION_CHECK_INTERVAL: Final = 30
+FIXTURE_INDEX_PREFETCH_BATCH_SIZE: Final = 1000
+
+LOOKUP_CACHE_KEY: Final = "romm:lookup_cache"
+
+
+def get_generation_key(key: str) -> str:
+    return f"{key}:generation"
 
 
 async def conditionally_set_cache(cache: AsyncRedis, key: str, file_path: Path) -> None:
@@ -18,7 +36,149 @@ async def conditionally_set_cache(cache: AsyncRedis, key: str, file_path: Path)
                 for data_batch in batched(index_data.items(), 2000, strict=False):
                     data_map = {k: json.dumps(v) for k, v in dict(data_batch).items()}
                     await pipe.hset(key, mapping=data_map)
+                await pipe.incr(get_generation_key(key))
                 await pipe.execute()
     except Exception as e:
         # Log the error but don't fail - this allows migrations to run even if Redis is not available
         log.warning(f"Failed to initialize cache for {key}: {e}")
+
+
+class FixtureIndexCache:
+    """Process-local read-through LRU cache over static redis hash indexes.
+
+    Lookups, including misses, are kept in memory so repeated scans don't go
+    to redis for every file. Writers bump the index generation key (see
+    `get_generation_key`) when they rewrite an index, and the local entries for
+    that index are dropped the next time its generation is checked.
+    """
+
+    def __init__(
+        self,
+        cache: AsyncRedis,
+        maxsize: int = FIXTURE_INDEX_CACHE_SIZE,
+        check_interval: float = FIXTURE_INDEX_GENERATION_CHECK_INTERVAL,
+    ) -> None:
+        self.cache = cache
+        self.maxsize = maxsize
+        self.check_interval = check_interval
+        self._entries: OrderedDict[tuple[str, str], str | None] = OrderedDict()
+        self._existing_keys: set[str] = set()
+        self._generations: dict[str, tuple[str | None, float]] = {}
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._existing_keys.clear()
+        self._generations.clear()
+
+    def _invalidate(self, key: str) -> None:
+        self._existing_keys.discard(key)
+        for entry in [entry for entry in self._entries if entry[0] == key]:
+            del self._entries[entry]
+
+    async def _check_generation(self, key: str) -> None:
+        now = time.monotonic()
+        known = self._generations.get(key)
+        if known and now - known[1] < self.check_interval:
+            return
+
+        generation = await self.cache.get(get_generation_key(key))
+        if known and known[0] != generation:
+            log.debug(f"Fixture index {key} was updated, dropping local entries")
+            self._invalidate(key)
+
+        self._generations[key] = (generation, now)
+
+    def _store(self, key: str, field: str, value: str | None) -> None:
+        self._entries[(key, field)] = value
+        self._entries.move_to_end((key, field))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def exists(self, key: str) -> bool:
+        await self._check_generation(key)
+        if key in self._existing_keys:
+            return True
+
+        if await self.cache.exists(key):
+            self._existing_keys.add(key)
+            return True
+
+        return False
+
+    async def hget(self, key: str, field: str) -> str | None:
+        await self._check_generation(key)
+        if (key, field) in self._entries:
+            self._entries.move_to_end((key, field))
+            return self._entries[(key, field)]
+
+        value = await self.cache.hget(key, field)
+        self._store(key, field, value)
+        return value
+
+    async def prefetch(self, key: str, fields: Iterable[str]) -> None:
+        """Load the given fields of an index in bulk, with as few HMGET calls as possible."""
+        await self._check_generation(key)
+        missing = [
+            field
+            for field in dict.fromkeys(fields)
+            if (key, field) not in self._entries
+        ]
+
+        for fields_batch in batched(
+            missing, FIXTURE_INDEX_PREFETCH_BATCH_SIZE, strict=False
+        ):
+            values = await self.cache.hmget(key, fields_batch)
+            for field, value in zip(fields_batch, values, strict=True):
+                self._store(key, field, value)
+
+
+class LookupCache:
+    """Persistent redis cache of a metadata provider's responses.
+
+    Meant for lookups whose answer doesn't change over time for the same input,
+    like hash matches or games by ID, so misses are cached too. Entries expire
+    after `ttl` seconds, and can be dropped for all providers with `purge_lookup_cache`.
+    """
+
+    def __init__(
+        self, cache: AsyncRedis, provider: str, ttl: int = METADATA_LOOKUP_CACHE_TTL
+    ) -> None:
+        self.cache = cache
+        self.ttl = ttl
+        self.key = f"{LOOKUP_CACHE_KEY}:{provider}"
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    async def get(self, lookup_key: str) -> Any | None:
+        if not self.enabled:
+            return None
+
+        value = await self.cache.get(f"{self.key}:{lookup_key}")
+        if value is None:
+            return None
+
+        mark_cache_hit()
+        return json.loads(value)
+
+    async def set(self, lookup_key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+
+        await self.cache.set(
+            f"{self.key}:{lookup_key}",
+            json.dumps(value, separators=(",", ":")),
+            ex=self.ttl,
+        )
+
+
+async def purge_lookup_cache(cache: AsyncRedis) -> int:
+    """Drop the cached responses of all providers, returning how many were dropped."""
+    keys = [key async for key in cache.scan_iter(match=f"{LOOKUP_CACHE_KEY}:*")]
+
+    count = 0
+    for keys_batch in batched(keys, 1000, strict=False):
+        count += await cache.delete(*keys_batch)
+
+    return count
@@ -0,0 +1,105 @@
+import time
+from typing import Final
+
+import socketio  # type: ignore
+from config import (
+    METADATA_CIRCUIT_BREAKER_COOLDOWN,
+    METADATA_CIRCUIT_BREAKER_THRESHOLD,
+    REDIS_URL,
+)
+from handler.redis_handler import async_cache
+from logger.formatter import highlight as hl
+from logger.logger import log
+
+CIRCUIT_BREAKER_KEY: Final = "romm:circuit_breaker"
+# Counters are dropped if a provider is not called for a day, so that
+# a few sparse failures can't add up to an open circuit over time
+CIRCUIT_BREAKER_KEY_TTL: Final = 60 * 60 * 24
+
+
+class CircuitBreaker:
+    """Per-provider circuit breaker shared across processes through Redis.
+
+    After `threshold` consecutive network failures or timeouts, the circuit opens
+    and calls to the provider are short-circuited for `cooldown` seconds. Once the
+    cooldown expires, a single caller is allowed through as a half-open probe: a
+    success closes the circuit, a failure opens it again for another cooldown.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        threshold: int = METADATA_CIRCUIT_BREAKER_THRESHOLD,
+        cooldown: int = METADATA_CIRCUIT_BREAKER_COOLDOWN,
+    ) -> None:
+        self.provider = provider
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.key = f"{CIRCUIT_BREAKER_KEY}:{provider}"
+        self.probe_key = f"{self.key}:probe"
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    async def allow_request(self) -> bool:
+        """Check if a request to the provider can go through."""
+        if not self.enabled:
+            return True
+
+        failures, open_until = await async_cache.hmget(
+            self.key, ["failures", "open_until"]
+        )
+        if int(failures or 0) < self.threshold:
+            return True
+
+        if time.time() < float(open_until or 0):
+            return False
+
+        # Half-open: only one caller across all processes gets to probe the provider
+        return bool(await async_cache.set(self.probe_key, 1, nx=True, ex=self.cooldown))
+
+    async def record_success(self) -> None:
+        if not self.enabled:
+            return
+
+        failures = await async_cache.hget(self.key, "failures")
+        if failures is None:
+            return
+
+        await async_cache.delete(self.key, self.probe_key)
+        if int(failures) >= self.threshold:
+            log.info(f"{hl(self.provider)} is reachable again, resuming requests")
+
+    async def record_failure(self) -> None:
+        if not self.enabled:
+            return
+
+        async with async_cache.pipeline() as pipe:
+            pipe.hincrby(self.key, "failures", 1)
+            pipe.expire(self.key, CIRCUIT_BREAKER_KEY_TTL)
+            failures, _ = await pipe.execute()
+
+        if failures < self.threshold:
+            return
+
+        # A failed probe, or the failure that crossed the threshold, (re)opens the circuit
+        probe_failed = await async_cache.delete(self.probe_key)
+        if failures > self.threshold and not probe_failed:
+            return
+
+        await async_cache.hset(self.key, "open_until", time.time() + self.cooldown)
+        message = (
+            f"{self.provider} is not responding, skipping requests "
+            f"for {self.cooldown} seconds"
+        )
+        log.warning(message)
+        await _emit_warning(message)
+
+
+async def _emit_warning(message: str) -> None:
+    try:
+        socket_manager = socketio.AsyncRedisManager(str(REDIS_URL), write_only=True)
+        await socket_manager.emit("scan:warning", message)
+    except Exception as exc:
+        log.debug(f"Could not emit circuit breaker warning: {exc}")
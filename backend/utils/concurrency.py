@@ -0,0 +1,37 @@
+import asyncio
+from types import TracebackType
+from weakref import WeakKeyDictionary
+
+
+class LoopBoundSemaphore:
+    """Semaphore that can be shared by coroutines running on different event loops.
+
+    asyncio primitives are bound to the event loop they are first awaited on, while
+    handlers are module-level singletons used by tasks that each run their own loop,
+    so a separate semaphore is kept for every loop.
+    """
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.value)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def __aenter__(self) -> None:
+        await self._get_semaphore().acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._get_semaphore().release()
@@ -1,16 +1,47 @@
 from collections.abc import AsyncGenerator, Awaitable, Callable
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from contextvars import ContextVar, Token
 from typing import TypeVar
 
 import aiohttp
 import httpx
 from fastapi import Request, Response
+from utils.http_transport import (
+    AIOHTTP_POOL_SETTINGS,
+    HTTPX_POOL_SETTINGS,
+    HTTPPool,
+    create_aiohttp_session,
+    create_httpx_client,
+)
 
 _T = TypeVar("_T")
 
+# Clients of the default pool
 ctx_aiohttp_session: ContextVar[aiohttp.ClientSession] = ContextVar("aiohttp_session")
 ctx_httpx_client: ContextVar[httpx.AsyncClient] = ContextVar("httpx_client")
+# Clients of all pools, see `utils.http_transport.HTTPPool`
+ctx_aiohttp_sessions: ContextVar[dict[HTTPPool, aiohttp.ClientSession]] = ContextVar(
+    "aiohttp_sessions"
+)
+ctx_httpx_clients: ContextVar[dict[HTTPPool, httpx.AsyncClient]] = ContextVar(
+    "httpx_clients"
+)
+
+
+def get_httpx_client(pool: HTTPPool = HTTPPool.DEFAULT) -> httpx.AsyncClient:
+    """Get the httpx client of a connection pool, falling back to the default one."""
+    clients = ctx_httpx_clients.get(None)
+    if clients and pool in clients:
+        return clients[pool]
+    return ctx_httpx_client.get()
+
+
+def get_aiohttp_session(pool: HTTPPool = HTTPPool.DEFAULT) -> aiohttp.ClientSession:
+    """Get the aiohttp session of a connection pool, falling back to the default one."""
+    sessions = ctx_aiohttp_sessions.get(None)
+    if sessions and pool in sessions:
+        return sessions[pool]
+    return ctx_aiohttp_session.get()
 
 
 @asynccontextmanager
@@ -24,13 +55,23 @@ async def set_context_var(var: ContextVar[_T], value: _T) -> AsyncGenerator[Toke
 @asynccontextmanager
 async def initialize_context() -> AsyncGenerator[None]:
     """Initialize context variables."""
-    async with (
-        aiohttp.ClientSession() as aiohttp_session,
-        httpx.AsyncClient() as httpx_client,
-        set_context_var(ctx_aiohttp_session, aiohttp_session),
-        set_context_var(ctx_httpx_client, httpx_client),
-    ):
-        yield
+    async with AsyncExitStack() as stack:
+        aiohttp_sessions = {
+            pool: await stack.enter_async_context(create_aiohttp_session(pool))
+            for pool in AIOHTTP_POOL_SETTINGS
+        }
+        httpx_clients = {
+            pool: await stack.enter_async_context(create_httpx_client(pool))
+            for pool in HTTPX_POOL_SETTINGS
+        }
+
+        async with (
+            set_context_var(ctx_aiohttp_session, aiohttp_sessions[HTTPPool.DEFAULT]),
+            set_context_var(ctx_httpx_client, httpx_clients[HTTPPool.DEFAULT]),
+            set_context_var(ctx_aiohttp_sessions, aiohttp_sessions),
+            set_context_var(ctx_httpx_clients, httpx_clients),
+        ):
+            yield
 
 
 async def set_context_middleware(
@@ -44,5 +85,7 @@ async def set_context_middleware(
     async with (
         set_context_var(ctx_aiohttp_session, request.app.state.aiohttp_session),
         set_context_var(ctx_httpx_client, request.app.state.httpx_client),
+        set_context_var(ctx_aiohttp_sessions, request.app.state.aiohttp_sessions),
+        set_context_var(ctx_httpx_clients, request.app.state.httpx_clients),
     ):
         return await call_next(request)
@@ -1,8 +1,11 @@
 import os
 import re
 from collections.abc import Iterator
+from datetime import datetime
 from pathlib import Path
 
+from config import FRONTEND_RESOURCES_PATH
+
 
 def iter_files(path: str, recursive: bool = False) -> Iterator[tuple[Path, str]]:
     """List files in a directory.
@@ -30,6 +33,35 @@ def iter_directories(path: str, recursive: bool = False) -> Iterator[tuple[Path,
             break
 
 
+def evict_lru_files(path: str, max_size: int) -> int:
+    """Delete the least recently used files of a directory tree until it fits in max_size.
+
+    Files are ordered by modification time, which readers bump to mark them as used.
+    Returns the total size of the files left, in bytes.
+    """
+    files: list[tuple[float, int, str]] = []
+    for root, _, file_names in os.walk(path):
+        for file_name in file_names:
+            file_path = os.path.join(root, file_name)
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file_path))
+
+    total_size = sum(size for _, size, _ in files)
+    for _, size, file_path in sorted(files):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+
+    return total_size
+
+
 INVALID_CHARS_HYPHENS = re.compile(r"[\\/:|]")
 INVALID_CHARS_EMPTY = re.compile(r'[*?"<>]')
 
@@ -61,3 +93,31 @@ def sanitize_filename(filename: str) -> str:
         raise ValueError("Filename cannot be empty after sanitization")
 
     return sanitized_filename
+
+
+# Length of the content hash in the name of content hashed files
+CONTENT_HASH_LENGTH = 16
+# Content hashed files are named "{name}.{hash}.{extension}"
+CONTENT_HASHED_FILENAME = re.compile(
+    rf"\.[0-9a-f]{{{CONTENT_HASH_LENGTH}}}\.[0-9a-z]+$", re.IGNORECASE
+)
+
+
+def get_resource_url(path: str, updated_at: datetime) -> str:
+    """
+    Build the URL of a file in the resources folder
+
+    Content hashed files never change under the same URL, so they are cached forever.
+    Other files are versioned by the update time of the row referencing them.
+
+    Args:
+    - path (str): Path of the file, relative to the resources folder.
+    - updated_at (datetime): Update time of the row referencing the file.
+
+    Returns:
+    - str: The URL of the file.
+    """
+    if CONTENT_HASHED_FILENAME.search(path):
+        return f"{FRONTEND_RESOURCES_PATH}/{path}"
+
+    return f"{FRONTEND_RESOURCES_PATH}/{path}?ts={updated_at}"
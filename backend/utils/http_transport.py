@@ -0,0 +1,196 @@
+import enum
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Final, TypedDict
+
+import aiohttp
+import httpx
+from handler.redis_handler import async_cache
+from logger.logger import log
+
+# Per host request counters, with fields "{host}:{metric}"
+HTTP_METRICS_KEY: Final = "romm:http_metrics"
+
+
+class HTTPPool(enum.StrEnum):
+    """Connection pools, so that providers and downloads don't starve each other's sockets."""
+
+    DEFAULT = "default"
+    # Cover, screenshot and manual downloads
+    DOWNLOADS = "downloads"
+    # httpx based providers
+    HASHEOUS = "hasheous"
+    IGDB = "igdb"
+    PLAYMATCH = "playmatch"
+    # aiohttp based providers
+    MOBYGAMES = "mobygames"
+    RETROACHIEVEMENTS = "retroachievements"
+    SCREENSCRAPER = "screenscraper"
+    STEAMGRIDDB = "steamgriddb"
+
+
+@dataclass(frozen=True)
+class HTTPPoolSettings:
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    http2: bool = False
+    # Only enforced by aiohttp, 0 for no limit other than max_connections
+    max_connections_per_host: int = 0
+
+
+HTTPX_POOL_SETTINGS: Final = {
+    HTTPPool.DEFAULT: HTTPPoolSettings(100, 20, 5),
+    HTTPPool.DOWNLOADS: HTTPPoolSettings(32, 16, 30, http2=True),
+    HTTPPool.HASHEOUS: HTTPPoolSettings(10, 10, 30),
+    # IGDB allows up to 8 open requests at once
+    HTTPPool.IGDB: HTTPPoolSettings(8, 8, 30, http2=True),
+    HTTPPool.PLAYMATCH: HTTPPoolSettings(10, 10, 30),
+}
+
+AIOHTTP_POOL_SETTINGS: Final = {
+    # Shared by several hosts, none of which should take all of its connections
+    HTTPPool.DEFAULT: HTTPPoolSettings(100, 100, 15, max_connections_per_host=20),
+    HTTPPool.MOBYGAMES: HTTPPoolSettings(4, 4, 30),
+    HTTPPool.RETROACHIEVEMENTS: HTTPPoolSettings(8, 8, 30),
+    # ScreenScraper limits the number of threads per account
+    HTTPPool.SCREENSCRAPER: HTTPPoolSettings(4, 4, 30),
+    HTTPPool.STEAMGRIDDB: HTTPPoolSettings(8, 8, 30),
+}
+
+
+class HTTPHostMetrics(TypedDict):
+    host: str
+    requests: int
+    errors: int
+    avg_latency_ms: float
+
+
+async def record_http_request(host: str, duration: float, failed: bool) -> None:
+    """Count a request to `host` in the metrics shared by all processes."""
+    try:
+        async with async_cache.pipeline(transaction=False) as pipe:
+            await pipe.hincrby(HTTP_METRICS_KEY, f"{host}:requests", 1)
+            await pipe.hincrbyfloat(
+                HTTP_METRICS_KEY, f"{host}:duration_ms", duration * 1000
+            )
+            if failed:
+                await pipe.hincrby(HTTP_METRICS_KEY, f"{host}:errors", 1)
+            await pipe.execute()
+    except Exception as exc:
+        # Metrics should never break a request
+        log.debug(f"Could not record HTTP metrics for {host}: {exc}")
+
+
+async def get_http_metrics() -> list[HTTPHostMetrics]:
+    counters: dict[str, dict[str, float]] = {}
+    for field, value in (await async_cache.hgetall(HTTP_METRICS_KEY)).items():
+        field = field.decode() if isinstance(field, bytes) else field
+        host, _, metric = field.rpartition(":")
+        counters.setdefault(host, {})[metric] = float(value)
+
+    return [
+        HTTPHostMetrics(
+            host=host,
+            requests=int(metrics.get("requests", 0)),
+            errors=int(metrics.get("errors", 0)),
+            avg_latency_ms=round(
+                metrics.get("duration_ms", 0) / max(metrics.get("requests", 0), 1), 1
+            ),
+        )
+        for host, metrics in sorted(counters.items())
+    ]
+
+
+class MetricsTransport(httpx.AsyncBaseTransport):
+    """Count the requests sent through a transport, including the ones that raise."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start_time = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            # Timeouts and connection errors never get a response
+            await record_http_request(
+                request.url.host, time.perf_counter() - start_time, failed=True
+            )
+            raise
+
+        await record_http_request(
+            request.url.host,
+            time.perf_counter() - start_time,
+            failed=response.is_server_error,
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def create_httpx_client(pool: HTTPPool) -> httpx.AsyncClient:
+    settings = HTTPX_POOL_SETTINGS[pool]
+    return httpx.AsyncClient(
+        transport=MetricsTransport(
+            httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=settings.max_connections,
+                    max_keepalive_connections=settings.max_keepalive_connections,
+                    keepalive_expiry=settings.keepalive_expiry,
+                ),
+                http2=settings.http2,
+            )
+        ),
+    )
+
+
+async def _on_aiohttp_request_start(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: aiohttp.TraceRequestStartParams,
+) -> None:
+    ctx.start_time = time.perf_counter()
+
+
+async def _on_aiohttp_request_end(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: aiohttp.TraceRequestEndParams,
+) -> None:
+    await record_http_request(
+        params.url.host or "",
+        time.perf_counter() - ctx.start_time,
+        failed=params.response.status >= 500,
+    )
+
+
+async def _on_aiohttp_request_exception(
+    session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: aiohttp.TraceRequestExceptionParams,
+) -> None:
+    await record_http_request(
+        params.url.host or "", time.perf_counter() - ctx.start_time, failed=True
+    )
+
+
+def create_aiohttp_session(pool: HTTPPool) -> aiohttp.ClientSession:
+    settings = AIOHTTP_POOL_SETTINGS[pool]
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_aiohttp_request_start)
+    trace_config.on_request_end.append(_on_aiohttp_request_end)
+    trace_config.on_request_exception.append(_on_aiohttp_request_exception)
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=settings.max_connections,
+            limit_per_host=settings.max_connections_per_host,
+            keepalive_timeout=settings.keepalive_expiry,
+            ttl_dns_cache=300,
+        ),
+        trace_configs=[trace_config],
+    )
@@ -0,0 +1,202 @@
+import asyncio
+import enum
+import functools
+import math
+import multiprocessing
+import os
+import uuid
+from base64 import b64encode
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Final, ParamSpec, TypeVar
+
+from config import IMAGE_PROCESSING_WORKERS
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+RENDITION_FORMAT: Final = "webp"
+RENDITION_QUALITY: Final = 82
+
+# Tiles per row of the sprite sheets
+SPRITE_COLUMNS: Final = 16
+
+# Max width and height of the placeholders inlined in API responses
+PLACEHOLDER_SIZE: Final = 16
+PLACEHOLDER_QUALITY: Final = 40
+
+
+class ImageFormat(enum.StrEnum):
+    WEBP = "webp"
+    JPEG = "jpeg"
+    PNG = "png"
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_executor: Executor | None = None
+
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        if IMAGE_PROCESSING_WORKERS > 0:
+            # Forking a process running an event loop and threads is unsafe
+            _executor = ProcessPoolExecutor(
+                max_workers=IMAGE_PROCESSING_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        else:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="images")
+    return _executor
+
+
+async def run_image_task(func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    """Run blocking image work in the image processing pool, off the event loop."""
+    global _executor
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            _get_executor(), functools.partial(func, *args, **kwargs)
+        )
+    except BrokenProcessPool:
+        # A worker died, e.g. killed out of memory, start a new pool next time
+        _executor = None
+        raise
+
+
+def _save_image(image: Image.Image, target_path: str, image_format: str) -> None:
+    tmp_path = f"{target_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        image.save(tmp_path, format=image_format, quality=RENDITION_QUALITY)
+        os.replace(tmp_path, target_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def render_renditions(source_path: str, renditions: dict[str, int]) -> None:
+    """Encode an image into a WebP file per target path, scaled down to its max height.
+
+    Images are never scaled up. Runs in the image processing pool.
+
+    Args:
+        source_path: Absolute path of the image
+        renditions: Max height of the rendition by absolute target path
+    """
+    with Image.open(source_path) as img:
+        image = ImageOps.exif_transpose(img)
+        image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+    # Largest renditions first, so that each one is resized from the previous one
+    for target_path, max_height in sorted(
+        renditions.items(), key=lambda rendition: rendition[1], reverse=True
+    ):
+        if image.height > max_height:
+            width = max(round(image.width * max_height / image.height), 1)
+            image = image.resize((width, max_height), Image.Resampling.LANCZOS)
+
+        _save_image(image, target_path, RENDITION_FORMAT)
+
+
+def render_resized_image(
+    source_path: str, target_path: str, max_width: int, image_format: ImageFormat
+) -> None:
+    """Encode an image scaled down to a max width, in the given format.
+
+    Images are never scaled up. Runs in the image processing pool.
+
+    Args:
+        source_path: Absolute path of the image
+        target_path: Absolute path of the resized image
+        max_width: Max width of the resized image
+        image_format: Format of the resized image
+    """
+    with Image.open(source_path) as img:
+        image = ImageOps.exif_transpose(img)
+        keep_alpha = image.has_transparency_data and image_format != ImageFormat.JPEG
+        image = image.convert("RGBA" if keep_alpha else "RGB")
+
+    if image.width > max_width:
+        height = max(round(image.height * max_width / image.width), 1)
+        image = image.resize((max_width, height), Image.Resampling.LANCZOS)
+
+    _save_image(image, target_path, image_format)
+
+
+def render_placeholder(source_path: str) -> str:
+    """Encode a tiny version of an image as a data URI, shown while the image loads.
+
+    Browsers blur it when scaling it up. Runs in the image processing pool.
+
+    Args:
+        source_path: Absolute path of the image
+    """
+    with Image.open(source_path) as img:
+        image = img.convert("RGB")
+
+    image.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.Resampling.BOX)
+    buffer = BytesIO()
+    image.save(buffer, format=RENDITION_FORMAT, quality=PLACEHOLDER_QUALITY)
+    data = b64encode(buffer.getvalue()).decode()
+    return f"data:image/{RENDITION_FORMAT};base64,{data}"
+
+
+def render_sprite(
+    source_paths: list[str], target_path: str, tile_size: tuple[int, int]
+) -> tuple[tuple[int, int], list[tuple[int, int, int, int] | None]]:
+    """Pack images into a single WebP sprite sheet, on a grid of tiles.
+
+    Images are scaled down to fit in a tile, and placed at its top left corner.
+    Unreadable images are left out. Runs in the image processing pool.
+
+    Args:
+        source_paths: Absolute paths of the images
+        target_path: Absolute path of the sprite sheet
+        tile_size: Max width and height of the images in the sprite sheet
+    Returns
+        Size of the sprite sheet, and box (x, y, width, height) of each image in
+        the sprite sheet, in order
+    """
+    images: list[Image.Image | None] = []
+    for source_path in source_paths:
+        try:
+            with Image.open(source_path) as img:
+                image = ImageOps.exif_transpose(img).convert("RGBA")
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError):
+            images.append(None)
+            continue
+
+        image.thumbnail(tile_size, Image.Resampling.LANCZOS)
+        images.append(image)
+
+    tiles_count = sum(image is not None for image in images)
+    if not tiles_count:
+        return (0, 0), [None] * len(images)
+
+    # Tiles are as large as the largest image
+    tile_width = max(image.width for image in images if image)
+    tile_height = max(image.height for image in images if image)
+    columns = min(tiles_count, SPRITE_COLUMNS)
+    sprite = Image.new(
+        "RGBA",
+        (columns * tile_width, math.ceil(tiles_count / columns) * tile_height),
+        (0, 0, 0, 0),
+    )
+
+    boxes: list[tuple[int, int, int, int] | None] = []
+    tile = 0
+    for image in images:
+        if image is None:
+            boxes.append(None)
+            continue
+
+        x = (tile % columns) * tile_width
+        y = (tile // columns) * tile_height
+        sprite.paste(image, (x, y))
+        boxes.append((x, y, image.width, image.height))
+        tile += 1
+
+    _save_image(sprite, target_path, RENDITION_FORMAT)
+    return sprite.size, boxes
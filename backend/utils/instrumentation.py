@@ -0,0 +1,148 @@
+import asyncio
+import functools
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Final, ParamSpec, TypedDict, TypeVar
+
+from handler.redis_handler import async_cache
+from logger.logger import log
+from opentelemetry import metrics, trace
+
+# Per provider call counters, with fields "{provider}:{endpoint}:{metric}"
+PROVIDER_METRICS_KEY: Final = "romm:provider_metrics"
+
+tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+
+provider_call_duration = meter.create_histogram(
+    "romm.metadata.provider.duration",
+    unit="s",
+    description="Duration of metadata provider calls",
+)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class ProviderCall:
+    provider: str
+    endpoint: str
+    status: str = "ok"
+    cache_hit: bool = False
+
+
+_current_call: ContextVar[ProviderCall | None] = ContextVar(
+    "provider_call", default=None
+)
+
+
+class ProviderMetrics(TypedDict):
+    provider: str
+    endpoint: str
+    calls: int
+    errors: int
+    cache_hits: int
+    avg_latency_ms: float
+
+
+def mark_cache_hit() -> None:
+    """Flag the provider call in progress as served from cache."""
+    call = _current_call.get()
+    if call is not None:
+        call.cache_hit = True
+
+
+def mark_status(status: str) -> None:
+    """Set the status of the provider call in progress, when it fails without raising."""
+    call = _current_call.get()
+    if call is not None:
+        call.status = status
+
+
+async def _record_provider_call(call: ProviderCall, duration: float) -> None:
+    field = f"{call.provider}:{call.endpoint}"
+    try:
+        async with async_cache.pipeline(transaction=False) as pipe:
+            await pipe.hincrby(PROVIDER_METRICS_KEY, f"{field}:calls", 1)
+            await pipe.hincrbyfloat(
+                PROVIDER_METRICS_KEY, f"{field}:duration_ms", duration * 1000
+            )
+            if call.status != "ok":
+                await pipe.hincrby(PROVIDER_METRICS_KEY, f"{field}:errors", 1)
+            if call.cache_hit:
+                await pipe.hincrby(PROVIDER_METRICS_KEY, f"{field}:cache_hits", 1)
+            await pipe.execute()
+    except Exception as exc:
+        # Metrics should never break a provider call
+        log.debug(f"Could not record metrics for {field}: {exc}")
+
+
+async def get_provider_metrics() -> list[ProviderMetrics]:
+    counters: dict[tuple[str, str], dict[str, float]] = {}
+    for field, value in (await async_cache.hgetall(PROVIDER_METRICS_KEY)).items():
+        field = field.decode() if isinstance(field, bytes) else field
+        provider, endpoint, metric = field.split(":", 2)
+        counters.setdefault((provider, endpoint), {})[metric] = float(value)
+
+    return [
+        ProviderMetrics(
+            provider=provider,
+            endpoint=endpoint,
+            calls=int(metrics.get("calls", 0)),
+            errors=int(metrics.get("errors", 0)),
+            cache_hits=int(metrics.get("cache_hits", 0)),
+            avg_latency_ms=round(
+                metrics.get("duration_ms", 0) / max(metrics.get("calls", 0), 1), 1
+            ),
+        )
+        for (provider, endpoint), metrics in sorted(counters.items())
+    ]
+
+
+def instrument_provider(
+    provider: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Trace a provider coroutine method, and record its duration, status and cache hits.
+
+    Durations go to the `romm.metadata.provider.duration` OpenTelemetry histogram,
+    exported with the rest of the telemetry when an exporter is configured, and to
+    counters in redis exposed by the `/stats/providers` endpoint.
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        endpoint = func.__name__.lstrip("_")
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            call = ProviderCall(provider=provider, endpoint=endpoint)
+            token = _current_call.set(call)
+            start_time = time.perf_counter()
+            with tracer.start_as_current_span(f"{provider}.{endpoint}") as span:
+                try:
+                    return await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    call.status = "cancelled"
+                    raise
+                except Exception as exc:
+                    call.status = type(exc).__name__
+                    raise
+                finally:
+                    _current_call.reset(token)
+                    duration = time.perf_counter() - start_time
+                    attributes = {
+                        "provider": call.provider,
+                        "endpoint": call.endpoint,
+                        "status": call.status,
+                        "cache_hit": call.cache_hit,
+                    }
+                    span.set_attributes(attributes)
+                    provider_call_duration.record(duration, attributes)
+                    if call.status != "cancelled":
+                        await _record_provider_call(call, duration)
+
+        return wrapper
+
+    return decorator
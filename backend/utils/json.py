@@ -8,9 +8,10 @@ import datetime
 import decimal
 import json
 import uuid
+from collections.abc import Iterator
 from json import *  # noqa: F401, F403
 from json import dumps as __original_dumps
-from typing import Any
+from typing import IO, Any
 
 
 class DefaultJSONEncoder(json.JSONEncoder):
@@ -27,3 +28,79 @@ class DefaultJSONEncoder(json.JSONEncoder):
 def dumps(*args: Any, **kwargs: Any) -> str:  # type: ignore[no-redef]
     kwargs.setdefault("cls", DefaultJSONEncoder)
     return __original_dumps(*args, **kwargs)
+
+
+def iter_object_items(
+    fp: IO[str], chunk_size: int = 64 * 1024
+) -> Iterator[tuple[str, Any]]:
+    """Incrementally parse the top-level JSON object in `fp`, yielding its items.
+
+    Unlike `json.load`, only the item being decoded is held in memory, so large
+    documents made of many small entries can be processed with bounded memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+
+    def fill() -> bool:
+        nonlocal buffer, pos
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            return False
+
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\n\r":
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill():
+                return ""
+
+    def expect(char: str) -> None:
+        nonlocal pos
+        if peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", buffer, pos)
+        pos += 1
+
+    def decode() -> Any:
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The value might just be cut off at the end of the buffer
+                if fill():
+                    continue
+                raise
+
+            # A number reaching the end of the buffer may be truncated, e.g. "2." of "2.5"
+            truncated = end == len(buffer) or (
+                isinstance(value, (int, float)) and buffer[end] in ".eE+-"
+            )
+            if truncated and fill():
+                continue
+
+            pos = end
+            return value
+
+    expect("{")
+    if peek() == "}":
+        return
+
+    while True:
+        if peek() != '"':
+            raise json.JSONDecodeError("Expecting property name", buffer, pos)
+        key = decode()
+        expect(":")
+        yield key, decode()
+
+        if peek() == "}":
+            return
+        expect(",")
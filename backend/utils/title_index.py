@@ -0,0 +1,55 @@
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable
+
+
+def _trigrams(title: str) -> set[str]:
+    padded = f"  {title} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramTitleIndex:
+    """In-memory trigram index over a set of titles, for fuzzy candidate lookups.
+
+    Titles are expected to be normalized by the caller, the same way as the
+    search terms they will be compared to. Candidates are ranked by the Dice
+    coefficient of their trigram sets, which is cheap enough to narrow down
+    thousands of titles to a handful worth scoring with a proper string
+    similarity metric.
+    """
+
+    def __init__(self, titles: Iterable[tuple[str, str]]) -> None:
+        """Build the index from (normalized title, original title) pairs."""
+        self.titles: list[str] = []
+        self._trigram_counts: list[int] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+
+        for position, (normalized_title, title) in enumerate(titles):
+            title_trigrams = _trigrams(normalized_title)
+            self.titles.append(title)
+            self._trigram_counts.append(len(title_trigrams))
+            for trigram in title_trigrams:
+                self._postings[trigram].append(position)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def search(self, normalized_search_term: str, limit: int = 10) -> list[str]:
+        """Return the original titles of the top `limit` candidates, best first."""
+        search_trigrams = _trigrams(normalized_search_term)
+        if not search_trigrams:
+            return []
+
+        shared: dict[int, int] = defaultdict(int)
+        for trigram in search_trigrams:
+            for position in self._postings.get(trigram, ()):
+                shared[position] += 1
+
+        best = heapq.nlargest(
+            limit,
+            shared.items(),
+            key=lambda item: (
+                2 * item[1] / (len(search_trigrams) + self._trigram_counts[item[0]])
+            ),
+        )
+        return [self.titles[position] for position, _ in best]
@@ -0,0 +1,12 @@
+/* generated using openapi-typescript-codegen -- do not edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+import type { CoverSpriteTileSchema } from './CoverSpriteTileSchema';
+export type CoverSpriteSchema = {
+    url: string;
+    width: number;
+    height: number;
+    tiles: Record<string, CoverSpriteTileSchema>;
+};
+
@@ -52,6 +52,7 @@ export type DetailedRomSchema = {
     hasheous_metadata: (RomHasheousMetadata | null);
     path_cover_small: (string | null);
     path_cover_large: (string | null);
+    cover_placeholder: (string | null);
     url_cover: (string | null);
     has_manual: boolean;
     path_manual: (string | null);
@@ -17,5 +17,6 @@ export type ScreenshotSchema = {
     missing_from_fs: boolean;
     created_at: string;
     updated_at: string;
+    thumbnail_path: string;
 };
 
@@ -46,6 +46,7 @@ export type SimpleRomSchema = {
     hasheous_metadata: (RomHasheousMetadata | null);
     path_cover_small: (string | null);
     path_cover_large: (string | null);
+    cover_placeholder: (string | null);
     url_cover: (string | null);
     has_manual: boolean;
     path_manual: (string | null);
@@ -0,0 +1,39 @@
+import storeCoverSprites from "@/stores/coverSprites";
+import storeGalleryView from "@/stores/galleryView";
+import storeRoms from "@/stores/roms";
+import { views } from "@/utils";
+import { watch } from "vue";
+import { useDisplay } from "vuetify";
+
+// Load the covers of each page of gallery cards with a single sprite sheet
+export const useCoverSprites = () => {
+  const coverSpritesStore = storeCoverSprites();
+  const galleryViewStore = storeGalleryView();
+  const romsStore = storeRoms();
+  const { name, width } = useDisplay();
+
+  // Synchronous, so that the roms are pending before their cards are rendered
+  watch(
+    () => romsStore.allRoms,
+    (roms, previousRoms) => {
+      const view = views[galleryViewStore.currentView];
+      // The list view has no cards
+      if (view.view === "list") return;
+
+      const previousIds = new Set(previousRoms?.map((rom) => rom.id));
+      const columns = {
+        xs: view["size-cols"],
+        sm: view["size-sm"],
+        md: view["size-md"],
+        lg: view["size-lg"],
+        xl: view["size-xl"],
+        xxl: view["size-xl"],
+      }[name.value];
+      coverSpritesStore.fetchCoverSprite(
+        roms.filter((rom) => !previousIds.has(rom.id)),
+        (width.value * columns) / 12,
+      );
+    },
+    { flush: "sync" },
+  );
+};
@@ -1,5 +1,6 @@
 import type {
   BulkOperationResponse,
+  CoverSpriteSchema,
   SearchRomSchema,
   RomUserSchema,
 } from "@/__generated__";
@@ -183,22 +184,68 @@ async function getRom({
   return api.get(`/roms/${romId}`);
 }
 
+async function getCoverSprite({
+  romIds,
+  width,
+}: {
+  romIds: number[];
+  width: number;
+}): Promise<{ data: CoverSpriteSchema }> {
+  // Repeat the parameter for each id, as expected by the API
+  const params = new URLSearchParams(
+    romIds.map((id) => ["ids", id.toString()]),
+  );
+  params.append("width", width.toString());
+  return api.get("/resources/covers/sprite", { params });
+}
+
+function parseLastSearchResults(text: string): SearchRomSchema[] | null {
+  // Each line holds the full list of results so far, the last one may be incomplete
+  const lines = text.slice(0, text.lastIndexOf("\n")).split("\n");
+  const lastLine = lines[lines.length - 1];
+  return lastLine ? JSON.parse(lastLine) : null;
+}
+
 async function searchRom({
   romId,
   searchTerm,
   searchBy,
+  onResults,
 }: {
   romId: number;
   searchTerm: string;
   searchBy: string;
+  onResults?: (results: SearchRomSchema[]) => void;
 }): Promise<{ data: SearchRomSchema[] }> {
-  return api.get("/search/roms", {
-    params: {
-      rom_id: romId,
-      search_term: searchTerm,
-      search_by: searchBy,
-    },
-  });
+  try {
+    const response = await api.get("/search/roms", {
+      params: {
+        rom_id: romId,
+        search_term: searchTerm,
+        search_by: searchBy,
+        stream: true,
+      },
+      responseType: "text",
+      onDownloadProgress: (event) => {
+        const results = parseLastSearchResults(
+          event.event?.target?.responseText ?? "",
+        );
+        if (results && onResults) onResults(results);
+      },
+    });
+    return { data: parseLastSearchResults(response.data) ?? [] };
+  } catch (error) {
+    // Error details are sent as JSON, but read as text
+    const response = (error as { response?: { data: unknown } }).response;
+    if (response && typeof response.data === "string") {
+      try {
+        response.data = JSON.parse(response.data);
+      } catch {
+        // Keep the raw error text
+      }
+    }
+    throw error;
+  }
 }
 
 async function downloadRom({
@@ -344,6 +391,7 @@ export default {
   getRecentRoms,
   getRecentPlayedRoms,
   getRom,
+  getCoverSprite,
   downloadRom,
   bulkDownloadRoms,
   searchRom,
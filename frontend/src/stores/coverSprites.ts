@@ -0,0 +1,69 @@
+import type { CoverSpriteTileSchema } from "@/__generated__";
+import romApi from "@/services/api/rom";
+import type { SimpleRom } from "@/stores/roms";
+import { chunk } from "lodash";
+import { defineStore } from "pinia";
+
+// Tile widths supported by the cover sprite sheets, and max covers per sheet
+export const COVER_SPRITE_WIDTHS = [64, 128, 192, 256];
+const COVER_SPRITE_MAX_COVERS = 200;
+
+export type CoverSpriteTile = CoverSpriteTileSchema & {
+  url: string;
+  spriteWidth: number;
+  spriteHeight: number;
+  // Small cover the tile was rendered from, the tile is stale once it changes
+  cover: string;
+};
+
+export default defineStore("coverSprites", {
+  state: () => ({
+    tiles: {} as Record<number, CoverSpriteTile>,
+    // Roms whose sprite sheet is being fetched, their cards hold their own cover
+    pending: {} as Record<number, boolean>,
+  }),
+
+  actions: {
+    async fetchCoverSprite(roms: SimpleRom[], cardWidth: number) {
+      const missingRoms = roms.filter(
+        (rom) =>
+          rom.path_cover_small &&
+          !this.pending[rom.id] &&
+          this.tiles[rom.id]?.cover !== rom.path_cover_small,
+      );
+      if (!missingRoms.length) return;
+      missingRoms.forEach((rom) => (this.pending[rom.id] = true));
+
+      // Smallest tile as sharp as the card, or the largest one
+      const width =
+        COVER_SPRITE_WIDTHS.find(
+          (tileWidth) => tileWidth >= cardWidth * window.devicePixelRatio,
+        ) ?? COVER_SPRITE_WIDTHS[COVER_SPRITE_WIDTHS.length - 1];
+
+      for (const page of chunk(missingRoms, COVER_SPRITE_MAX_COVERS)) {
+        try {
+          const { data } = await romApi.getCoverSprite({
+            romIds: page.map((rom) => rom.id),
+            width,
+          });
+          page.forEach((rom) => {
+            const tile = data.tiles[rom.id];
+            if (!tile || !rom.path_cover_small) return;
+            this.tiles[rom.id] = {
+              ...tile,
+              url: data.url,
+              spriteWidth: data.width,
+              spriteHeight: data.height,
+              cover: rom.path_cover_small,
+            };
+          });
+        } catch (error) {
+          // Cards load their own cover without a tile
+          console.error(error);
+        } finally {
+          page.forEach((rom) => delete this.pending[rom.id]);
+        }
+      }
+    },
+  },
+});
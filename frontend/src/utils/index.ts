@@ -135,6 +135,27 @@ export function getDownloadLink({
   )}`;
 }
 
+const RESOURCES_PATH = "/assets/romm/resources/";
+
+/**
+ * Get the URL of a resource image scaled down to a width, rendered on demand.
+ *
+ * @param url URL of the image in the resources folder.
+ * @param width Width of the displayed image, in CSS pixels.
+ * @returns The URL of the resized image, or the original URL for other images.
+ */
+export function getResizedImagePath(url: string, width: number) {
+  if (!url.startsWith(RESOURCES_PATH)) return url;
+
+  const [path, query = ""] = url.slice(RESOURCES_PATH.length).split("?");
+  const queryParams = new URLSearchParams(query);
+  queryParams.set(
+    "width",
+    Math.ceil(width * (window.devicePixelRatio || 1)).toString(),
+  );
+  return `/api/resources/image/${path}?${queryParams.toString()}`;
+}
+
 /**
  * Format bytes as human-readable text.
  *